@@ -0,0 +1,169 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+SECONDS_PER_DAY = 86400
+
+
+def _to_seconds(values: Sequence[datetime]) -> np.ndarray:
+    return np.array(values, dtype="datetime64[s]").astype(np.int64)
+
+
+def _to_cents(values: Sequence[object]) -> np.ndarray:
+    """Денежные суммы в копейках: целые складываются точно, float накапливает ошибку округления"""
+    return np.array([int(Decimal(value).scaleb(2)) for value in values], dtype=np.int64)
+
+
+def _money(cents) -> Decimal:
+    return Decimal(int(cents)).scaleb(-2)
+
+
+class RentalColumns:
+    """Аренды периода в виде колонок: одна строка массива - одна аренда"""
+
+    def __init__(self, rows: Sequence[Tuple[int, datetime, datetime, object]]):
+        car_ids, starts, ends, amounts = zip(*rows) if rows else ((), (), (), ())
+        self.car_ids = np.array(car_ids, dtype=np.int64)
+        self.starts = np.array(starts, dtype="datetime64[s]")
+        self.ends = np.array(ends, dtype="datetime64[s]")
+        self.amounts = _to_cents(amounts)
+
+
+class FleetColumns:
+    def __init__(self, rows: Sequence[Tuple[int, str, int, str]]):
+        car_ids, plates, category_ids, category_names = zip(*rows) if rows else ((), (), (), ())
+        self.car_ids = np.array(car_ids, dtype=np.int64)
+        self.plates = list(plates)
+        self.category_ids = np.array(category_ids, dtype=np.int64)
+        self.category_names = dict(zip(category_ids, category_names))
+
+    def car_index(self, car_ids: np.ndarray) -> np.ndarray:
+        """Позиции машин в парке (car_ids отсортированы по возрастанию)"""
+        return np.searchsorted(self.car_ids, car_ids)
+
+
+def rented_days(rentals: RentalColumns, start: datetime, end: datetime) -> np.ndarray:
+    """Дни аренды, приходящиеся на период, по каждой аренде"""
+    period_start, period_end = _to_seconds([start, end])
+    overlap = (
+        np.minimum(rentals.ends.astype(np.int64), period_end)
+        - np.maximum(rentals.starts.astype(np.int64), period_start)
+    )
+    return np.clip(overlap, 0, None) / SECONDS_PER_DAY
+
+
+def utilization(rentals: RentalColumns, fleet: FleetColumns, start: datetime, end: datetime) -> dict:
+    """Загрузка парка: дни аренды к доступным машино-дням.
+
+    Доступные машино-дни считаются по текущему парку на весь период: дат ввода и вывода машин
+    в базе нет. Машина, добавленная в середине периода, занижает загрузку своей категории.
+    """
+    period_days = max((end - start).total_seconds(), 0) / SECONDS_PER_DAY
+    days = rented_days(rentals, start, end)
+
+    categories, fleet_category = np.unique(fleet.category_ids, return_inverse=True)
+    cars_per_category = np.bincount(fleet_category, minlength=len(categories))
+    rental_category = fleet_category[fleet.car_index(rentals.car_ids)]
+    days_per_category = np.bincount(rental_category, weights=days, minlength=len(categories))
+    available_per_category = cars_per_category * period_days
+
+    available = len(fleet.car_ids) * period_days
+    return {
+        "period_days": round(period_days, 2),
+        "fleet_size": len(fleet.car_ids),
+        "rented_car_days": round(float(days.sum()), 2),
+        "available_car_days": round(available, 2),
+        "utilization": round(float(days.sum() / available), 4) if available else 0,
+        "by_category": [
+            {
+                "category_id": int(category_id),
+                "category": fleet.category_names[category_id],
+                "cars": int(cars),
+                "rented_car_days": round(float(rented), 2),
+                "utilization": round(float(rented / available_cars), 4) if available_cars else 0,
+            }
+            for category_id, cars, rented, available_cars
+            in zip(categories.tolist(), cars_per_category, days_per_category, available_per_category)
+        ],
+    }
+
+
+def _grouped_revenue(keys: np.ndarray, cents: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    groups, inverse = np.unique(keys, return_inverse=True)
+    # bincount с весами суммирует во float64 - копейки складываются в int64
+    totals = np.zeros(len(groups), dtype=np.int64)
+    np.add.at(totals, inverse, cents)
+    return groups, totals, np.bincount(inverse, minlength=len(groups))
+
+
+def revenue(rentals: RentalColumns, fleet: FleetColumns, start: datetime, end: datetime) -> dict:
+    """Выручка аренд, начавшихся в периоде, по машинам, категориям и месяцам"""
+    period_start, period_end = _to_seconds([start, end])
+    started_at = rentals.starts.astype(np.int64)
+    started = (started_at >= period_start) & (started_at < period_end)
+
+    car_ids = rentals.car_ids[started]
+    amounts = rentals.amounts[started]
+    months = rentals.starts[started].astype("datetime64[M]")
+    fleet_index = fleet.car_index(car_ids)
+
+    durations = (rentals.ends[started] - rentals.starts[started]).astype(np.int64) / SECONDS_PER_DAY
+
+    result = {
+        "rentals": int(started.sum()),
+        "revenue": _money(amounts.sum()),
+        "average_rental_days": round(float(durations.mean()), 2) if len(durations) else 0,
+        "by_car": [],
+        "by_category": [],
+        "by_month": [],
+    }
+
+    cars, car_revenue, car_rentals = _grouped_revenue(car_ids, amounts)
+    order = np.argsort(-car_revenue, kind="stable")
+    car_positions = fleet.car_index(cars)
+    result["by_car"] = [
+        {"car_id": int(cars[i]), "license_plate": fleet.plates[car_positions[i]],
+         "rentals": int(car_rentals[i]), "revenue": _money(car_revenue[i])}
+        for i in order
+    ]
+
+    categories, category_revenue, category_rentals = _grouped_revenue(fleet.category_ids[fleet_index], amounts)
+    result["by_category"] = [
+        {"category_id": int(category_id), "category": fleet.category_names[int(category_id)],
+         "rentals": int(count), "revenue": _money(total)}
+        for category_id, total, count in zip(categories.tolist(), category_revenue, category_rentals)
+    ]
+
+    month_keys, month_revenue, month_rentals = _grouped_revenue(months, amounts)
+    result["by_month"] = [
+        {"month": str(month), "rentals": int(count), "revenue": _money(total)}
+        for month, total, count in zip(month_keys, month_revenue, month_rentals)
+    ]
+    return result
+
+
+def fine_collection(rows: Sequence[Tuple[object, bool]]) -> dict:
+    fines, paid = zip(*rows) if rows else ((), ())
+    fines = _to_cents(fines)
+    paid = np.array(paid, dtype=bool)
+
+    total = fines.sum()
+    collected = fines[paid].sum()
+    return {
+        "violations": len(fines),
+        "paid_violations": int(paid.sum()),
+        "fines_total": _money(total),
+        "fines_collected": _money(collected),
+        "collection_rate": round(float(collected / total), 4) if total else 0,
+    }
+
+
+def rental_analytics(rentals: RentalColumns, fleet: FleetColumns, fines: List[Tuple[object, bool]],
+                     start: datetime, end: datetime) -> dict:
+    return {
+        "utilization": utilization(rentals, fleet, start, end),
+        "revenue": revenue(rentals, fleet, start, end),
+        "fines": fine_collection(fines),
+    }
@@ -3,13 +3,13 @@ from fastapi.openapi.docs import get_swagger_ui_html
 from fastapi.responses import JSONResponse
 
 from application.dependencies import get_current_user
-from infrastructure.database.models import UserEntity
+from infrastructure.cache import AuthenticatedPrincipal
 
 router = APIRouter(tags=["Documentation"])
 
 @router.get("/admin/docs")
 def get_admin_docs(
-        current_user: UserEntity = Depends(get_current_user)
+        current_user: AuthenticatedPrincipal = Depends(get_current_user)
 ):
     if current_user.role.role_name != "admin":
         raise HTTPException(
@@ -26,7 +26,7 @@ def get_admin_docs(
 @router.get("/openapi.json", include_in_schema=False)
 def get_open_api(
         request: Request,
-        current_user: UserEntity = Depends(get_current_user)
+        current_user: AuthenticatedPrincipal = Depends(get_current_user)
 ):
     if current_user.role.role_name != "admin":
         raise HTTPException(
@@ -0,0 +1,20 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from application.dependencies import get_current_user
+from infrastructure.cache import AuthenticatedPrincipal
+from infrastructure.metrics import metrics_registry
+
+router = APIRouter(tags=["Admin Metrics"])
+
+
+@router.get("/admin/metrics")
+def get_metrics(
+    current_user: AuthenticatedPrincipal = Depends(get_current_user)
+):
+    if current_user.role.role_name != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Только администратор может просматривать метрики"
+        )
+
+    return metrics_registry.collect()
@@ -1,21 +1,41 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
 from datetime import datetime
+from typing import Tuple
 
 from sqlalchemy.orm import Session
 
-from application.admin.usecases import RentalStatisticUseCase
+from application.admin.usecases import (
+    RentalStatisticUseCase, DashboardStatisticUseCase, ExportRentalStatisticUseCase, RentalAnalyticsUseCase
+)
 from application.dependencies import get_current_user
+from application.streaming import ExportFormat, EXPORT_MEDIA_TYPES
 from infrastructure.database.database_session import get_db
-from infrastructure.database.models import UserEntity
+from infrastructure.cache import AuthenticatedPrincipal
 
 router = APIRouter(tags=["Admin Statistic"])
 
 
+def _parse_period(start_date: str, end_date: str) -> Tuple[datetime, datetime]:
+    try:
+        if len(start_date) == 16:
+            start_date = start_date + ":00"
+        if len(end_date) == 16:
+            end_date = end_date + ":00"
+
+        return datetime.fromisoformat(start_date), datetime.fromisoformat(end_date)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Неправильный формат даты: {str(e)}"
+        )
+
+
 @router.get("/admin/rental-statistic")
 def get_rental_stats(
     start_date: str = Query(..., description="Дата начала в формате ISO (YYYY-MM-DDTHH:mm:ss)"),
     end_date: str = Query(..., description="Дата окончания в формате ISO (YYYY-MM-DDTHH:mm:ss)"),
-    current_user: UserEntity = Depends(get_current_user),
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     if current_user.role.role_name != "admin":
@@ -24,18 +44,61 @@ def get_rental_stats(
             detail="Только администратор может просматривать статистику"
         )
 
-    try:
-        if len(start_date) == 16:
-            start_date = start_date + ":00"
-        if len(end_date) == 16:
-            end_date = end_date + ":00"
-        
-        start_dt = datetime.fromisoformat(start_date)
-        end_dt = datetime.fromisoformat(end_date)
-    except ValueError as e:
+    start_dt, end_dt = _parse_period(start_date, end_date)
+
+    return RentalStatisticUseCase(db).execute(start_dt, end_dt)
+
+
+@router.get("/admin/rental-statistic/export")
+def export_rental_stats(
+    start_date: str = Query(..., description="Дата начала в формате ISO (YYYY-MM-DDTHH:mm:ss)"),
+    end_date: str = Query(..., description="Дата окончания в формате ISO (YYYY-MM-DDTHH:mm:ss)"),
+    format: ExportFormat = ExportFormat.csv,
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    if current_user.role.role_name != "admin":
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Неправильный формат даты: {str(e)}"
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Только администратор может просматривать статистику"
         )
 
-    return RentalStatisticUseCase(db).execute(start_dt, end_dt)
+    start_dt, end_dt = _parse_period(start_date, end_date)
+
+    return StreamingResponse(
+        ExportRentalStatisticUseCase(db).execute(start_dt, end_dt, format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="rental-statistic.{format.value}"'}
+    )
+
+
+@router.get("/admin/rental-analytics")
+def get_rental_analytics(
+    start_date: str = Query(..., description="Дата начала в формате ISO (YYYY-MM-DDTHH:mm:ss)"),
+    end_date: str = Query(..., description="Дата окончания в формате ISO (YYYY-MM-DDTHH:mm:ss)"),
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    if current_user.role.role_name != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Только администратор может просматривать статистику"
+        )
+
+    start_dt, end_dt = _parse_period(start_date, end_date)
+
+    return RentalAnalyticsUseCase(db).execute(start_dt, end_dt)
+
+
+@router.get("/admin/dashboard-statistic")
+def get_dashboard_stats(
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    if current_user.role.role_name != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Только администратор может просматривать статистику"
+        )
+
+    return DashboardStatisticUseCase(db).execute()
@@ -1 +1,4 @@
-from .rental_statistic_use_case import RentalStatisticUseCase
\ No newline at end of file
+from .rental_statistic_use_case import RentalStatisticUseCase
+from .dashboard_statistic_use_case import DashboardStatisticUseCase
+from .export_rental_statistic_use_case import ExportRentalStatisticUseCase
+from .rental_analytics_use_case import RentalAnalyticsUseCase
\ No newline at end of file
@@ -0,0 +1,19 @@
+from sqlalchemy.orm import Session
+
+from infrastructure.database.repository import CarRepository, ClientRepository, RentalRepository
+
+
+class DashboardStatisticUseCase:
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.car_repo = CarRepository(db)
+        self.client_repo = ClientRepository(db)
+        self.rental_repo = RentalRepository(db)
+
+    def execute(self):
+        return {
+            "cars": self.car_repo.count(),
+            "clients": self.client_repo.count(),
+            "rentals": self.rental_repo.count(),
+        }
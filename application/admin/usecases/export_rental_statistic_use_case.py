@@ -0,0 +1,23 @@
+from datetime import datetime
+from typing import Iterator
+
+from sqlalchemy.orm import Session
+
+from application.rental.schemas import RentalRead
+from application.streaming import ExportFormat, EXPORT_BATCH_SIZE, stream_rows
+from infrastructure.database.repository import RentalRepository
+
+
+class ExportRentalStatisticUseCase:
+    def __init__(self, db: Session, batch_size: int = EXPORT_BATCH_SIZE):
+        self.db = db
+        self.batch_size = batch_size
+        self.rental_repo = RentalRepository(db)
+
+    def execute(self, start_date: datetime, end_date: datetime, export_format: ExportFormat) -> Iterator[str]:
+        fields = list(RentalRead.model_fields)
+        rows = (
+            {name: row[name] for name in fields}
+            for row in self.rental_repo.iter_statistic_rows(start_date.date(), end_date.date(), self.batch_size)
+        )
+        return stream_rows(rows, export_format, fields)
\ No newline at end of file
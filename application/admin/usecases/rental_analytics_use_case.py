@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from sqlalchemy.orm import Session
+
+from application.admin.analytics import RentalColumns, FleetColumns, rental_analytics
+from infrastructure.database.repository import CarRepository, RentalRepository, ViolationRepository
+
+
+class RentalAnalyticsUseCase:
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.car_repo = CarRepository(db)
+        self.rental_repo = RentalRepository(db)
+        self.violation_repo = ViolationRepository(db)
+
+    def execute(self, start_date: datetime, end_date: datetime):
+        # Из базы берутся только нужные колонки, метрики считаются над массивами целиком
+        rentals = RentalColumns(self.rental_repo.analytics_columns(start_date, end_date))
+        fleet = FleetColumns(self.car_repo.fleet_columns())
+        fines = self.violation_repo.fine_columns(start_date, end_date)
+
+        return rental_analytics(rentals, fleet, fines, start_date, end_date)
@@ -2,21 +2,26 @@ from datetime import datetime
 
 from sqlalchemy.orm import Session
 
-from infrastructure.database.repository import RentalRepository
+from infrastructure.database.repository import RentalDailyStatRepository
 
 
 class RentalStatisticUseCase:
 
     def __init__(self, db: Session):
         self.db = db
-        self.rental_repo = RentalRepository(db)
+        self.stats_repo = RentalDailyStatRepository(db)
 
     def execute(self, start_date: datetime, end_date: datetime):
-        rentals, p_with, p_without = self.rental_repo.statistic_get_rentals(start_date, end_date)
+        # Период считается по дням: суммируются суточные агрегаты, а не аренды
+        started, completed, revenue, with_violations = self.stats_repo.summary(start_date.date(), end_date.date())
+
+        p_with = (with_violations / started) * 100 if started else 0
+        p_without = 100 - p_with if started else 0
 
         return {
-            "total_rentals": len(rentals),
-            "rentals": rentals,
+            "total_rentals": started,
+            "completed_rentals": completed,
+            "revenue": revenue,
             "percent_with_violations": round(p_with, 2),
             "percent_without_violations": round(p_without, 2),
-        }
+        }
\ No newline at end of file
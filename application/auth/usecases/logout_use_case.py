@@ -2,16 +2,19 @@ from fastapi import Response
 from sqlalchemy.orm import Session
 
 from infrastructure.database.repository import RefreshTokenRepository
+from infrastructure.database.unit_of_work import UnitOfWork
 
 
 class LogoutUseCase:
     def __init__(self, db: Session):
         self.db = db
+        self.uow = UnitOfWork(db)
         self.refresh_token_repo = RefreshTokenRepository(db)
 
     def execute(self, refresh_token: str, response: Response):
         if refresh_token:
-            self.refresh_token_repo.delete(refresh_token)
+            with self.uow:
+                self.refresh_token_repo.delete(refresh_token)
 
         response.delete_cookie("access_token")
         response.delete_cookie("refresh_token")
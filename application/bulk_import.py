@@ -0,0 +1,149 @@
+import csv
+import io
+import json
+import os
+from enum import Enum
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+from fastapi import HTTPException, UploadFile, status
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+
+# Сколько строк файла проверяется и вставляется за раз (одна транзакция на пачку)
+IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", 1000))
+# Сколько ошибок строк попадает в ответ; счетчик failed учитывает все
+IMPORT_MAX_REPORTED_ERRORS = int(os.getenv("IMPORT_MAX_REPORTED_ERRORS", 1000))
+
+
+class ImportFormat(str, Enum):
+    csv = "csv"
+    ndjson = "ndjson"
+
+
+class ImportRowError(BaseModel):
+    row: int = Field(..., description="Номер строки в файле")
+    errors: List[str]
+
+
+class ImportResult(BaseModel):
+    total: int = 0
+    imported: int = 0
+    failed: int = 0
+    skipped: int = Field(0, description="Строки, загруженные ранее (повторный запуск)")
+    errors: List[ImportRowError] = []
+
+    def add_error(self, row: int, *errors: str):
+        self.failed += 1
+        if len(self.errors) < IMPORT_MAX_REPORTED_ERRORS:
+            self.errors.append(ImportRowError(row=row, errors=list(errors)))
+
+
+# Строка файла: номер строки, значения (None - строку не удалось разобрать) и ошибка разбора
+ImportRow = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+
+class ReferenceLookup:
+    """Id записей справочника по названию (без учета регистра) или по id"""
+
+    def __init__(self, items: Sequence, name_attr: str, title: str):
+        self.title = title
+        self.items = {item.id: item for item in items}
+        self.by_name = {getattr(item, name_attr).strip().lower(): item.id for item in items}
+
+    def resolve(self, name: Optional[str], item_id: Optional[int], errors: List[str]) -> Optional[int]:
+        if item_id is not None:
+            if item_id in self.items:
+                return item_id
+            errors.append(f"{self.title}: id {item_id} нет в справочнике")
+            return None
+        resolved = self.by_name.get(name.lower())
+        if resolved is None:
+            errors.append(f"{self.title}: «{name}» нет в справочнике")
+        return resolved
+
+
+def detect_format(filename: Optional[str]) -> Optional[ImportFormat]:
+    extension = os.path.splitext(filename or "")[1].lower()
+    if extension == ".csv":
+        return ImportFormat.csv
+    if extension in (".ndjson", ".jsonl"):
+        return ImportFormat.ndjson
+    return None
+
+
+def read_csv(stream: TextIO) -> Iterator[ImportRow]:
+    reader = csv.DictReader(stream)
+    for values in reader:
+        if None in values:
+            yield reader.line_num, None, "Лишние значения в строке"
+            continue
+        # Пустая ячейка CSV - отсутствующее значение
+        yield reader.line_num, {key.strip(): value for key, value in values.items() if value not in ("", None)}, None
+
+
+def read_ndjson(stream: TextIO) -> Iterator[ImportRow]:
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            values = json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield line_number, None, f"Некорректный JSON: {exc.msg}"
+            continue
+        if not isinstance(values, dict):
+            yield line_number, None, "Строка должна быть JSON-объектом"
+            continue
+        yield line_number, values, None
+
+
+def read_rows(stream: TextIO, import_format: ImportFormat) -> Iterator[ImportRow]:
+    if import_format == ImportFormat.csv:
+        return read_csv(stream)
+    return read_ndjson(stream)
+
+
+def upload_rows(file: UploadFile, import_format: Optional[ImportFormat] = None) -> Iterator[ImportRow]:
+    """Строки загруженного файла; формат по умолчанию определяется по расширению"""
+    import_format = import_format or detect_format(file.filename)
+    if import_format is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Укажите формат файла: format=csv или format=ndjson")
+    return _decoded(read_rows(io.TextIOWrapper(file.file, encoding="utf-8-sig", newline=""), import_format))
+
+
+def _decoded(rows: Iterator[ImportRow]) -> Iterator[ImportRow]:
+    # Файл читается по мере загрузки: ошибка кодировки обнаруживается посреди импорта
+    try:
+        yield from rows
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Файл должен быть в кодировке UTF-8")
+
+
+def batched(rows: Iterable[ImportRow], size: int = IMPORT_BATCH_SIZE) -> Iterator[List[ImportRow]]:
+    rows = iter(rows)
+    while batch := list(islice(rows, size)):
+        yield batch
+
+
+def _format_error(error: dict) -> str:
+    field = ".".join(str(part) for part in error["loc"][1:])
+    # Сообщения валидаторов схемы - без префикса «Value error, »
+    message = str(error["ctx"]["error"]) if error["type"] == "value_error" else error["msg"]
+    return f"{field}: {message}" if field else message
+
+
+def validate_batch(adapter: TypeAdapter, rows: List[Tuple[int, Dict[str, Any]]]) -> Tuple[list, Dict[int, List[str]]]:
+    """Проверяет пачку строк одним вызовом TypeAdapter (список схем).
+
+    Возвращает пары (номер строки, модель) для корректных строк и ошибки по номерам строк.
+    """
+    try:
+        return list(zip((row for row, _ in rows), adapter.validate_python([values for _, values in rows]))), {}
+    except ValidationError as exc:
+        errors: Dict[int, List[str]] = {}
+        for error in exc.errors(include_url=False):
+            errors.setdefault(rows[error["loc"][0]][0], []).append(_format_error(error))
+
+    # Повторная проверка только корректных строк: обычно ошибочных немного
+    valid = [(row, values) for row, values in rows if row not in errors]
+    models = adapter.validate_python([values for _, values in valid]) if valid else []
+    return list(zip((row for row, _ in valid), models)), errors
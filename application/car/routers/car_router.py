@@ -1,27 +1,40 @@
+from datetime import datetime
 from decimal import Decimal
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query, File, UploadFile
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
 from application.car.schemas import CarRead, CarCreate, CarUpdate, CarFilter
 from application.car.usecases import CreateCarUseCase, DeleteCarUseCase, GetAllCarUseCase, UpdateCarUseCase, \
-    GetCarUseCase, FilterCarUseCase
+    GetCarUseCase, FilterCarUseCase, SearchCarsUseCase, AutocompleteCarsUseCase, ImportCarsUseCase, GetCarsByIdsUseCase
+from application.bulk_import import ImportFormat, ImportResult, upload_rows
 from application.dependencies import get_current_user
+from application.pagination import Page, PageParams, page_params, DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT
 from infrastructure.database.database_session import get_db
-from infrastructure.database.models import UserEntity
+from infrastructure.cache import AuthenticatedPrincipal
 
 router = APIRouter(prefix="/cars", tags=["Cars"])
 
 
-@router.get("/", response_model=List[CarRead])
+def _car_filter(**values) -> CarFilter:
+    try:
+        return CarFilter(**values)
+    except ValidationError as exc:
+        raise RequestValidationError(exc.errors(include_url=False))
+
+
+@router.get("/", response_model=Page[CarRead])
 def get_all_cars(
+        page: PageParams = Depends(page_params),
         db: Session = Depends(get_db)
 ):
-    return GetAllCarUseCase(db).execute()
+    return GetAllCarUseCase(db).execute(page)
 
 
-@router.get("/filter", response_model=List[CarRead])
+@router.get("/filter", response_model=Page[CarRead])
 def filter_cars(
     brand: Optional[str] = None,
     model: Optional[str] = None,
@@ -31,9 +44,12 @@ def filter_cars(
     max_year: Optional[int] = None,
     min_cost: Optional[Decimal] = None,
     max_cost: Optional[Decimal] = None,
+    available_from: Optional[datetime] = None,
+    available_to: Optional[datetime] = None,
+    page: PageParams = Depends(page_params),
     db: Session = Depends(get_db)
 ):
-    filters = CarFilter(
+    filters = _car_filter(
         brand=brand,
         model=model,
         category_id=category_id,
@@ -42,9 +58,60 @@ def filter_cars(
         max_year=max_year,
         min_cost=min_cost,
         max_cost=max_cost,
+        available_from=available_from,
+        available_to=available_to,
     )
 
-    return FilterCarUseCase(db).execute(filters)
+    return FilterCarUseCase(db).execute(filters, page)
+
+
+@router.get("/search", response_model=List[CarRead])
+def search_cars(
+    q: str = Query(..., min_length=1, max_length=100, description="Марка и/или модель, допускаются опечатки"),
+    brand: Optional[str] = None,
+    model: Optional[str] = None,
+    category_id: Optional[int] = None,
+    color_id: Optional[int] = None,
+    min_year: Optional[int] = None,
+    max_year: Optional[int] = None,
+    min_cost: Optional[Decimal] = None,
+    max_cost: Optional[Decimal] = None,
+    available_from: Optional[datetime] = None,
+    available_to: Optional[datetime] = None,
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    db: Session = Depends(get_db)
+):
+    filters = _car_filter(
+        brand=brand,
+        model=model,
+        category_id=category_id,
+        color_id=color_id,
+        min_year=min_year,
+        max_year=max_year,
+        min_cost=min_cost,
+        max_cost=max_cost,
+        available_from=available_from,
+        available_to=available_to,
+    )
+
+    return SearchCarsUseCase(db).execute(q, filters, limit)
+
+
+@router.get("/autocomplete", response_model=List[str])
+def autocomplete_cars(
+    q: str = Query(..., min_length=1, max_length=100, description="Начало марки или модели"),
+    limit: int = Query(10, ge=1, le=50),
+    db: Session = Depends(get_db)
+):
+    return AutocompleteCarsUseCase(db).execute(q, limit)
+
+
+@router.get("/by-ids", response_model=List[CarRead])
+def get_cars_by_ids(
+    ids: List[int] = Query(..., max_length=MAX_PAGE_LIMIT, description="Id машин (параметр повторяется)"),
+    db: Session = Depends(get_db)
+):
+    return GetCarsByIdsUseCase(db).execute(ids)
 
 
 @router.get("/{car_id}", response_model=CarRead)
@@ -58,7 +125,7 @@ def get_car_by_id(
 @router.post("/", response_model=CarRead, status_code=status.HTTP_201_CREATED)
 def add_car(
     car_data: CarCreate,
-    current_user: UserEntity = Depends(get_current_user),
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     if current_user.role.role_name != "admin":
@@ -67,10 +134,23 @@ def add_car(
     return CreateCarUseCase(db).execute(car_data)
 
 
+@router.post("/import", response_model=ImportResult)
+def import_cars(
+    file: UploadFile = File(..., description="CSV с заголовком или NDJSON в UTF-8"),
+    format: Optional[ImportFormat] = Query(None, description="По умолчанию определяется по расширению файла"),
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    if current_user.role.role_name != "admin":
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Только администратор может добавлять машины")
+
+    return ImportCarsUseCase(db).execute(upload_rows(file, format))
+
+
 @router.delete("/{car_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_car(
     car_id: int,
-    current_user: UserEntity = Depends(get_current_user),
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     if current_user.role.role_name != "admin":
@@ -83,7 +163,7 @@ def delete_car(
 @router.put("/{car_id}", response_model=CarRead)
 def update_car(
     car_data: CarUpdate,
-    current_user: UserEntity = Depends(get_current_user),
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     if current_user.role.role_name != "admin":
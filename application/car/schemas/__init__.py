@@ -3,5 +3,6 @@ from .car_schema import (
     CarRead,
     CarCreate,
     CarUpdate,
-    CarFilter
+    CarFilter,
+    CarImportRow
 )
\ No newline at end of file
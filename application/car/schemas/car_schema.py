@@ -1,7 +1,8 @@
+from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, model_validator
 
 
 class CarBase(BaseModel):
@@ -31,6 +32,31 @@ class CarRead(CarBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class CarImportRow(BaseModel):
+    """Строка файла импорта: категория, цвет и статус задаются названием или id"""
+    brand: str = Field(..., min_length=1, max_length=50)
+    model: str = Field(..., min_length=1, max_length=50)
+    year: int = Field(..., ge=1900, le=2100)
+    license_plate: str = Field(..., min_length=1, max_length=20)
+    daily_cost: Decimal = Field(..., gt=0, max_digits=10, decimal_places=2)
+    category: Optional[str] = None
+    category_id: Optional[int] = None
+    color: Optional[str] = None
+    color_id: Optional[int] = None
+    car_status: Optional[str] = Field(None, description="По умолчанию - доступна для аренды")
+    car_status_id: Optional[int] = None
+
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    @model_validator(mode="after")
+    def check_references(self):
+        if self.category is None and self.category_id is None:
+            raise ValueError("Не указана категория (category или category_id)")
+        if self.color is None and self.color_id is None:
+            raise ValueError("Не указан цвет (color или color_id)")
+        return self
+
+
 class CarFilter(BaseModel):
     brand: Optional[str] = Field(None, description="Марка машины")
     model: Optional[str] = Field(None, description="Модель машины")
@@ -39,4 +65,14 @@ class CarFilter(BaseModel):
     min_year: Optional[int] = Field(None, description="Минимальный год выпуска")
     max_year: Optional[int] = Field(None, description="Максимальный год выпуска")
     min_cost: Optional[Decimal] = Field(None, description="Минимальная стоимость аренды")
-    max_cost: Optional[Decimal] = Field(None, description="Максимальная стоимость аренды")
\ No newline at end of file
+    max_cost: Optional[Decimal] = Field(None, description="Максимальная стоимость аренды")
+    available_from: Optional[datetime] = Field(None, description="Машина свободна с (включительно)")
+    available_to: Optional[datetime] = Field(None, description="Машина свободна до (не включительно)")
+
+    @model_validator(mode="after")
+    def check_period(self):
+        if (self.available_from is None) != (self.available_to is None):
+            raise ValueError("Период доступности задается обеими датами")
+        if self.available_from is not None and self.available_from >= self.available_to:
+            raise ValueError("Начало периода доступности должно быть раньше окончания")
+        return self
\ No newline at end of file
@@ -3,4 +3,8 @@ from .delete_car_use_case import DeleteCarUseCase
 from .update_car_use_case import UpdateCarUseCase
 from .get_all_car_use_case import GetAllCarUseCase
 from .get_car_use_case import GetCarUseCase
-from .filter_cars_usecase import FilterCarUseCase
\ No newline at end of file
+from .filter_cars_usecase import FilterCarUseCase
+from .search_cars_use_case import SearchCarsUseCase
+from .autocomplete_cars_use_case import AutocompleteCarsUseCase
+from .import_cars_use_case import ImportCarsUseCase
+from .get_cars_by_ids_use_case import GetCarsByIdsUseCase
\ No newline at end of file
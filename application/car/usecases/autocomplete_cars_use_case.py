@@ -0,0 +1,29 @@
+from typing import List
+
+from sqlalchemy.orm import Session
+
+from infrastructure.cache import reference_data_cache, CAR_MODELS
+from infrastructure.database.repository import CarRepository
+
+
+class AutocompleteCarsUseCase:
+    def __init__(self, db: Session):
+        self.db = db
+        self.car_repo = CarRepository(db)
+
+    def _load(self):
+        # Различных пар «марка, модель» на порядки меньше, чем машин: подсказки ищутся в памяти без запроса к базе
+        return [
+            (f"{brand} {model}", f"{brand} {model}".lower(), model.lower())
+            for brand, model in self.car_repo.get_models()
+        ]
+
+    def execute(self, prefix: str, limit: int) -> List[str]:
+        prefix = prefix.strip().lower()
+        suggestions = []
+        for name, name_lower, model_lower in reference_data_cache.get_or_load(CAR_MODELS, self._load):
+            if name_lower.startswith(prefix) or model_lower.startswith(prefix):
+                suggestions.append(name)
+                if len(suggestions) >= limit:
+                    break
+        return suggestions
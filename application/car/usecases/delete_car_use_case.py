@@ -1,17 +1,22 @@
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
+from infrastructure.cache import reference_data_cache, CAR_MODELS
 from infrastructure.database.repository import CarRepository
+from infrastructure.database.unit_of_work import UnitOfWork
 
 
 class DeleteCarUseCase:
     def __init__(self, db: Session):
         self.db = db
+        self.uow = UnitOfWork(db)
         self.car_repo = CarRepository(db)
 
     def execute(self, car_id: int):
-        car = self.car_repo.get_by_id(car_id)
-        if car is None:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Статус не найден")
+        with self.uow:
+            car = self.car_repo.get_by_id(car_id)
+            if car is None:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Статус не найден")
 
-        return self.car_repo.delete(car_id)
\ No newline at end of file
+            self.car_repo.delete(car_id)
+            reference_data_cache.invalidate(CAR_MODELS, self.db)
\ No newline at end of file
@@ -1,8 +1,9 @@
-from typing import List
+from typing import Optional
 
 from sqlalchemy.orm import Session
 
 from application.car.schemas import CarFilter, CarRead
+from application.pagination import Page, PageParams
 from infrastructure.database.repository import CarRepository
 
 
@@ -11,8 +12,12 @@ class FilterCarUseCase:
         self.db = db
         self.car_repo = CarRepository(db)
 
-    def execute(self, filters: CarFilter) -> List[CarRead]:
-        cars = self.car_repo.filter(
+    def execute(self, filters: CarFilter, page: Optional[PageParams] = None) -> Page[CarRead]:
+        page = page or PageParams()
+        cars = self.car_repo.filter_page(
+            limit=page.limit,
+            after=page.after,
+            with_total=page.with_total,
             brand=filters.brand,
             model=filters.model,
             category_id=filters.category_id,
@@ -21,5 +26,7 @@ class FilterCarUseCase:
             max_year=filters.max_year,
             min_cost=filters.min_cost,
             max_cost=filters.max_cost,
+            available_from=filters.available_from,
+            available_to=filters.available_to,
         )
-        return [CarRead.model_validate(car) for car in cars]
+        return Page[CarRead].from_keyset(cars, CarRead)
@@ -1,8 +1,9 @@
-from typing import List
+from typing import Optional
 
 from sqlalchemy.orm import Session
 
 from application.car.schemas import CarRead
+from application.pagination import Page, PageParams
 from infrastructure.database.repository import CarRepository
 
 
@@ -11,6 +12,7 @@ class GetAllCarUseCase:
         self.db = db
         self.car_repo = CarRepository(db)
 
-    def execute(self) -> List[CarRead]:
-        cars = self.car_repo.get_all()
-        return [CarRead.model_validate(c) for c in cars]
\ No newline at end of file
+    def execute(self, page: Optional[PageParams] = None) -> Page[CarRead]:
+        page = page or PageParams()
+        cars = self.car_repo.filter_page(page.limit, page.after, page.with_total)
+        return Page[CarRead].from_keyset(cars, CarRead)
\ No newline at end of file
@@ -0,0 +1,15 @@
+from typing import Iterable, List
+
+from sqlalchemy.orm import Session
+
+from application.car.schemas import CarRead
+from infrastructure.database.repository import CarRepository
+
+
+class GetCarsByIdsUseCase:
+    def __init__(self, db: Session):
+        self.db = db
+        self.car_repo = CarRepository(db)
+
+    def execute(self, car_ids: Iterable[int]) -> List[CarRead]:
+        return [CarRead.model_validate(car) for car in self.car_repo.get_by_ids(car_ids)]
@@ -0,0 +1,85 @@
+from typing import Dict, Iterable, List, Set, Tuple
+
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session
+
+from application.bulk_import import ImportResult, ImportRow, IMPORT_BATCH_SIZE, ReferenceLookup, batched, validate_batch
+from application.car.schemas import CarImportRow
+from application.car_category.usecases import GetAllCarCategoriesUseCase
+from application.car_color.usecases import GetAllCarColorsUseCase
+from application.car_status.usecases import GetAllCarStatusesUseCase
+from infrastructure.cache import reference_data_cache, status_registry, CAR_MODELS
+from infrastructure.database.repository import CarRepository
+from infrastructure.database.unit_of_work import UnitOfWork
+
+CAR_IMPORT_ADAPTER = TypeAdapter(List[CarImportRow])
+
+
+class ImportCarsUseCase:
+    def __init__(self, db: Session, batch_size: int = IMPORT_BATCH_SIZE):
+        self.db = db
+        self.uow = UnitOfWork(db)
+        self.batch_size = batch_size
+        self.car_repo = CarRepository(db)
+
+    def execute(self, rows: Iterable[ImportRow]) -> ImportResult:
+        # Справочники берутся из кэша один раз на весь файл
+        categories = ReferenceLookup(GetAllCarCategoriesUseCase(self.db).execute(), "category_name", "Категория")
+        colors = ReferenceLookup(GetAllCarColorsUseCase(self.db).execute(), "color", "Цвет")
+        statuses = ReferenceLookup(GetAllCarStatusesUseCase(self.db).execute(), "status", "Статус")
+        available_status_id = status_registry.get(self.db).available_car
+
+        result = ImportResult()
+        seen_plates: Set[str] = set()
+        for batch in batched(rows, self.batch_size):
+            result.total += len(batch)
+            errors: Dict[int, List[str]] = {}
+            parsed = []
+            for row, values, error in batch:
+                if error is not None:
+                    errors[row] = [error]
+                else:
+                    parsed.append((row, values))
+
+            valid, validation_errors = validate_batch(CAR_IMPORT_ADAPTER, parsed)
+            errors.update(validation_errors)
+
+            cars: List[Tuple[int, dict]] = []
+            for row, car in valid:
+                row_errors: List[str] = []
+                category_id = categories.resolve(car.category, car.category_id, row_errors)
+                color_id = colors.resolve(car.color, car.color_id, row_errors)
+                car_status_id = available_status_id
+                if car.car_status is not None or car.car_status_id is not None:
+                    car_status_id = statuses.resolve(car.car_status, car.car_status_id, row_errors)
+                if car.license_plate in seen_plates:
+                    row_errors.append(f"Номер {car.license_plate} повторяется в файле")
+                seen_plates.add(car.license_plate)
+                if row_errors:
+                    errors[row] = row_errors
+                    continue
+                cars.append((row, dict(
+                    brand=car.brand,
+                    model=car.model,
+                    year=car.year,
+                    category_id=category_id,
+                    license_plate=car.license_plate,
+                    color_id=color_id,
+                    daily_cost=car.daily_cost,
+                    car_status_id=car_status_id,
+                )))
+
+            with self.uow:
+                inserted = set(self.car_repo.bulk_create([values for _, values in cars]))
+            result.imported += len(inserted)
+            for row, values in cars:
+                if values["license_plate"] not in inserted:
+                    errors[row] = [f"Машина с номером {values['license_plate']} уже есть"]
+
+            for row in sorted(errors):
+                result.add_error(row, *errors[row])
+
+        if result.imported:
+            with self.uow:
+                reference_data_cache.invalidate(CAR_MODELS, self.db)
+        return result
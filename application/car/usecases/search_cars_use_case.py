@@ -0,0 +1,16 @@
+from typing import List
+
+from sqlalchemy.orm import Session
+
+from application.car.schemas import CarFilter, CarRead
+from infrastructure.database.repository import CarRepository
+
+
+class SearchCarsUseCase:
+    def __init__(self, db: Session):
+        self.db = db
+        self.car_repo = CarRepository(db)
+
+    def execute(self, text: str, filters: CarFilter, limit: int) -> List[CarRead]:
+        cars = self.car_repo.search(text, limit, **filters.model_dump())
+        return [CarRead.model_validate(car) for car in cars]
@@ -2,29 +2,34 @@ from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
 from application.car.schemas import CarUpdate, CarRead
+from infrastructure.cache import reference_data_cache, CAR_MODELS
 from infrastructure.database.repository import CarRepository
+from infrastructure.database.unit_of_work import UnitOfWork
 
 
 class UpdateCarUseCase:
     def __init__(self, db: Session):
         self.db = db
+        self.uow = UnitOfWork(db)
         self.car_repo = CarRepository(db)
 
     def execute(self, car_data: CarUpdate) -> CarRead:
-        car = self.car_repo.get_by_id(car_data.id)
-        if car is None:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Статус не найден")
+        with self.uow:
+            car = self.car_repo.get_by_id(car_data.id)
+            if car is None:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Статус не найден")
 
-        car_res = self.car_repo.update(
-            car_id=car.id,
-            brand=car_data.brand,
-            model=car_data.model,
-            year=car_data.year,
-            category_id=car_data.category_id,
-            license_plate=car_data.license_plate,
-            color_id=car_data.color_id,
-            daily_cost=car_data.daily_cost,
-            car_status_id=car_data.car_status_id
-        )
+            car_res = self.car_repo.update(
+                car_id=car.id,
+                brand=car_data.brand,
+                model=car_data.model,
+                year=car_data.year,
+                category_id=car_data.category_id,
+                license_plate=car_data.license_plate,
+                color_id=car_data.color_id,
+                daily_cost=car_data.daily_cost,
+                car_status_id=car_data.car_status_id
+            )
 
-        return CarRead.model_validate(car_res)
\ No newline at end of file
+            reference_data_cache.invalidate(CAR_MODELS, self.db)
+            return CarRead.model_validate(car_res)
\ No newline at end of file
@@ -8,7 +8,7 @@ from application.car_category.usecases import CreateCarCategoryUseCase, DeleteCa
     GetAllCarCategoriesUseCase, UpdateCarCategoryUseCase
 from application.dependencies import get_current_user
 from infrastructure.database.database_session import get_db
-from infrastructure.database.models import UserEntity
+from infrastructure.cache import AuthenticatedPrincipal
 
 router = APIRouter(prefix="/car_categories", tags=["Car Categories"])
 
@@ -23,7 +23,7 @@ def get_all_categories(
 @router.post("/", response_model=CarCategoryRead, status_code=status.HTTP_201_CREATED)
 def add_category(
     category_data: CarCategoryCreate,
-    current_user: UserEntity = Depends(get_current_user),
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     if current_user.role.role_name != "admin":
@@ -35,7 +35,7 @@ def add_category(
 @router.delete("/{category_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_category(
     category_id: int,
-    current_user: UserEntity = Depends(get_current_user),
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     if current_user.role.role_name != "admin":
@@ -48,7 +48,7 @@ def delete_category(
 @router.put("/{category_id}", response_model=CarCategoryRead)
 def update_category(
     category_data: CarCategoryUpdate,
-    current_user: UserEntity = Depends(get_current_user),
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     if current_user.role.role_name != "admin":
@@ -1,17 +1,22 @@
 from sqlalchemy.orm import Session
 
 from application.car_category.schemas import CarCategoryCreate, CarCategoryRead
+from infrastructure.cache import reference_data_cache, CAR_CATEGORIES
 from infrastructure.database.repository import CarCategoryRepository
+from infrastructure.database.unit_of_work import UnitOfWork
 
 
 class CreateCarCategoryUseCase:
     def __init__(self, db: Session):
         self.db = db
+        self.uow = UnitOfWork(db)
         self.car_category_repo = CarCategoryRepository(db)
 
     def execute(self, category_data: CarCategoryCreate) -> CarCategoryRead:
-        category_obj = self.car_category_repo.create(
-            category_name=category_data.category_name,
-            description=category_data.description,
-            base_cost=category_data.base_cost)
-        return CarCategoryRead.model_validate(category_obj)
\ No newline at end of file
+        with self.uow:
+            category_obj = self.car_category_repo.create(
+                category_name=category_data.category_name,
+                description=category_data.description,
+                base_cost=category_data.base_cost)
+            reference_data_cache.invalidate(CAR_CATEGORIES, self.db)
+            return CarCategoryRead.model_validate(category_obj)
\ No newline at end of file
@@ -1,12 +1,17 @@
 from sqlalchemy.orm import Session
 
+from infrastructure.cache import reference_data_cache, CAR_CATEGORIES
 from infrastructure.database.repository import CarCategoryRepository
+from infrastructure.database.unit_of_work import UnitOfWork
 
 
 class DeleteCarCategoryUseCase:
     def __init__(self, db: Session):
         self.db = db
+        self.uow = UnitOfWork(db)
         self.car_category_repo = CarCategoryRepository(db)
 
     def execute(self, category_id: int):
-        return self.car_category_repo.delete(category_id)
\ No newline at end of file
+        with self.uow:
+            self.car_category_repo.delete(category_id)
+            reference_data_cache.invalidate(CAR_CATEGORIES, self.db)
\ No newline at end of file
@@ -3,6 +3,7 @@ from typing import List
 from sqlalchemy.orm import Session
 
 from application.car_category.schemas import CarCategoryRead
+from infrastructure.cache import reference_data_cache, CAR_CATEGORIES
 from infrastructure.database.repository import CarCategoryRepository
 
 
@@ -12,5 +13,6 @@ class GetAllCarCategoriesUseCase:
         self.car_category_repo = CarCategoryRepository(db)
 
     def execute(self) -> List[CarCategoryRead]:
-        categories = self.car_category_repo.get_all()
-        return [CarCategoryRead.model_validate(c) for c in categories]
\ No newline at end of file
+        return reference_data_cache.get_or_load(
+            CAR_CATEGORIES, lambda: [CarCategoryRead.model_validate(c) for c in self.car_category_repo.get_all()]
+        )
\ No newline at end of file
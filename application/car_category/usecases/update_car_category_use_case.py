@@ -2,23 +2,28 @@ from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
 from application.car_category.schemas import CarCategoryUpdate, CarCategoryRead
+from infrastructure.cache import reference_data_cache, CAR_CATEGORIES
 from infrastructure.database.repository import CarCategoryRepository
+from infrastructure.database.unit_of_work import UnitOfWork
 
 
 class UpdateCarCategoryUseCase:
     def __init__(self, db: Session):
         self.db = db
+        self.uow = UnitOfWork(db)
         self.car_category_repo = CarCategoryRepository(db)
 
     def execute(self, category_data: CarCategoryUpdate) -> CarCategoryRead:
-        car_category = self.car_category_repo.get_by_id(category_data.id)
-        if car_category is None:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Статус не найден")
+        with self.uow:
+            car_category = self.car_category_repo.get_by_id(category_data.id)
+            if car_category is None:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Статус не найден")
 
-        category_res = self.car_category_repo.update(
-            category_id=category_data.id,
-            category_name=category_data.category_name,
-            description=category_data.description,
-            base_cost=category_data.base_cost)
+            category_res = self.car_category_repo.update(
+                category_id=category_data.id,
+                category_name=category_data.category_name,
+                description=category_data.description,
+                base_cost=category_data.base_cost)
+            reference_data_cache.invalidate(CAR_CATEGORIES, self.db)
 
-        return CarCategoryRead.model_validate(category_res)
\ No newline at end of file
+            return CarCategoryRead.model_validate(category_res)
\ No newline at end of file
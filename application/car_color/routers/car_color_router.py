@@ -8,7 +8,7 @@ from application.car_color.usecases import CreateCarColorUseCase, DeleteCarColor
     UpdateCarColorUseCase
 from application.dependencies import get_current_user
 from infrastructure.database.database_session import get_db
-from infrastructure.database.models import UserEntity
+from infrastructure.cache import AuthenticatedPrincipal
 
 router = APIRouter(prefix="/car_colors", tags=["Car Colors"])
 
@@ -23,7 +23,7 @@ def get_all_colors(
 @router.post("/", response_model=CarColorRead, status_code=status.HTTP_201_CREATED)
 def add_color(
     color_data: CarColorCreate,
-    current_user: UserEntity = Depends(get_current_user),
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     if current_user.role.role_name != "admin":
@@ -35,7 +35,7 @@ def add_color(
 @router.delete("/{color_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_color(
     color_id: int,
-    current_user: UserEntity = Depends(get_current_user),
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     if current_user.role.role_name != "admin":
@@ -48,7 +48,7 @@ def delete_color(
 @router.put("/{color_id}", response_model=CarColorRead)
 def update_color(
     color_data: CarColorUpdate,
-    current_user: UserEntity = Depends(get_current_user),
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     if current_user.role.role_name != "admin":
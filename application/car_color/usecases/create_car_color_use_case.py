@@ -1,14 +1,19 @@
 from sqlalchemy.orm import Session
 
 from application.car_color.schemas import CarColorCreate, CarColorRead
+from infrastructure.cache import reference_data_cache, CAR_COLORS
 from infrastructure.database.repository import CarColorRepository
+from infrastructure.database.unit_of_work import UnitOfWork
 
 
 class CreateCarColorUseCase:
     def __init__(self, db: Session):
         self.db = db
+        self.uow = UnitOfWork(db)
         self.car_color_repo = CarColorRepository(db)
 
     def execute(self, color_data: CarColorCreate) -> CarColorRead:
-        color_obj = self.car_color_repo.create(color=color_data.color, color_hex=color_data.hex)
-        return CarColorRead.model_validate(color_obj)
\ No newline at end of file
+        with self.uow:
+            color_obj = self.car_color_repo.create(color=color_data.color, color_hex=color_data.hex)
+            reference_data_cache.invalidate(CAR_COLORS, self.db)
+            return CarColorRead.model_validate(color_obj)
\ No newline at end of file
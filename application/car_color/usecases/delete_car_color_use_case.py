@@ -1,12 +1,17 @@
 from sqlalchemy.orm import Session
 
+from infrastructure.cache import reference_data_cache, CAR_COLORS
 from infrastructure.database.repository import CarColorRepository
+from infrastructure.database.unit_of_work import UnitOfWork
 
 
 class DeleteCarColorUseCase:
     def __init__(self, db: Session):
         self.db = db
+        self.uow = UnitOfWork(db)
         self.car_color_repo = CarColorRepository(db)
 
     def execute(self, color_id: int):
-        return self.car_color_repo.delete(color_id)
\ No newline at end of file
+        with self.uow:
+            self.car_color_repo.delete(color_id)
+            reference_data_cache.invalidate(CAR_COLORS, self.db)
\ No newline at end of file
@@ -3,6 +3,7 @@ from typing import List
 from sqlalchemy.orm import Session
 
 from application.car_color.schemas import CarColorRead
+from infrastructure.cache import reference_data_cache, CAR_COLORS
 from infrastructure.database.repository import CarColorRepository
 
 
@@ -12,5 +13,6 @@ class GetAllCarColorsUseCase:
         self.car_color_repo = CarColorRepository(db)
 
     def execute(self) -> List[CarColorRead]:
-        colors = self.car_color_repo.get_all()
-        return [CarColorRead.model_validate(c) for c in colors]
\ No newline at end of file
+        return reference_data_cache.get_or_load(
+            CAR_COLORS, lambda: [CarColorRead.model_validate(c) for c in self.car_color_repo.get_all()]
+        )
\ No newline at end of file
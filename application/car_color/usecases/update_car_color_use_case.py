@@ -2,19 +2,24 @@ from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
 from application.car_color.schemas import CarColorUpdate, CarColorRead
+from infrastructure.cache import reference_data_cache, CAR_COLORS
 from infrastructure.database.repository import CarColorRepository
+from infrastructure.database.unit_of_work import UnitOfWork
 
 
 class UpdateCarColorUseCase:
     def __init__(self, db: Session):
         self.db = db
+        self.uow = UnitOfWork(db)
         self.car_color_repo = CarColorRepository(db)
 
     def execute(self, color_data: CarColorUpdate) -> CarColorRead:
-        color = self.car_color_repo.get_by_id(color_data.id)
-        if color is None:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Цвет не найден")
+        with self.uow:
+            color = self.car_color_repo.get_by_id(color_data.id)
+            if color is None:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Цвет не найден")
 
-        color_res = self.car_color_repo.update(color_data.id, color_data.color, color_data.hex)
+            color_res = self.car_color_repo.update(color_data.id, color_data.color, color_data.hex)
+            reference_data_cache.invalidate(CAR_COLORS, self.db)
 
-        return CarColorRead.model_validate(color_res)
\ No newline at end of file
+            return CarColorRead.model_validate(color_res)
\ No newline at end of file
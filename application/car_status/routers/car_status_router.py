@@ -8,7 +8,7 @@ from application.car_status.usecases import CreateCarStatusUseCase, DeleteCarSta
     UpdateCarStatusUseCase
 from application.dependencies import get_current_user
 from infrastructure.database.database_session import get_db
-from infrastructure.database.models import UserEntity
+from infrastructure.cache import AuthenticatedPrincipal
 
 router = APIRouter(prefix="/car_statuses", tags=["Car Statuses"])
 
@@ -23,7 +23,7 @@ def get_all_statuses(
 @router.post("/", response_model=CarStatusRead, status_code=status.HTTP_201_CREATED)
 def add_status(
     status_data: CarStatusCreate,
-    current_user: UserEntity = Depends(get_current_user),
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     if current_user.role.role_name != "admin":
@@ -35,7 +35,7 @@ def add_status(
 @router.delete("/{status_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_status(
     status_id: int,
-    current_user: UserEntity = Depends(get_current_user),
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     if current_user.role.role_name != "admin":
@@ -48,7 +48,7 @@ def delete_status(
 @router.put("/{status_id}", response_model=CarStatusRead)
 def update_status(
     status_data: CarStatusUpdate,
-    current_user: UserEntity = Depends(get_current_user),
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     if current_user.role.role_name != "admin":
@@ -1,14 +1,19 @@
 from sqlalchemy.orm import Session
 
 from application.car_status.schemas import CarStatusCreate, CarStatusRead
+from infrastructure.cache import reference_data_cache, CAR_STATUSES
 from infrastructure.database.repository import CarStatusRepository
+from infrastructure.database.unit_of_work import UnitOfWork
 
 
 class CreateCarStatusUseCase:
     def __init__(self, db: Session):
         self.db = db
+        self.uow = UnitOfWork(db)
         self.car_status_repo = CarStatusRepository(db)
 
     def execute(self, status_data: CarStatusCreate) -> CarStatusRead:
-        status_obj = self.car_status_repo.create(status=status_data.status)
-        return CarStatusRead.model_validate(status_obj)
\ No newline at end of file
+        with self.uow:
+            status_obj = self.car_status_repo.create(status=status_data.status)
+            reference_data_cache.invalidate(CAR_STATUSES, self.db)
+            return CarStatusRead.model_validate(status_obj)
\ No newline at end of file
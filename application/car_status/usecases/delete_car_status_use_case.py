@@ -1,12 +1,17 @@
 from sqlalchemy.orm import Session
 
+from infrastructure.cache import reference_data_cache, CAR_STATUSES
 from infrastructure.database.repository import CarStatusRepository
+from infrastructure.database.unit_of_work import UnitOfWork
 
 
 class DeleteCarStatusUseCase:
     def __init__(self, db: Session):
         self.db = db
+        self.uow = UnitOfWork(db)
         self.car_status_repo = CarStatusRepository(db)
 
     def execute(self, status_id: int):
-        return self.car_status_repo.delete(status_id)
\ No newline at end of file
+        with self.uow:
+            self.car_status_repo.delete(status_id)
+            reference_data_cache.invalidate(CAR_STATUSES, self.db)
\ No newline at end of file
@@ -3,6 +3,7 @@ from typing import List
 from sqlalchemy.orm import Session
 
 from application.car_status.schemas import CarStatusRead
+from infrastructure.cache import reference_data_cache, CAR_STATUSES
 from infrastructure.database.repository import CarStatusRepository
 
 
@@ -12,5 +13,6 @@ class GetAllCarStatusesUseCase:
         self.car_status_repo = CarStatusRepository(db)
 
     def execute(self) -> List[CarStatusRead]:
-        statuses = self.car_status_repo.get_all()
-        return [CarStatusRead.model_validate(s) for s in statuses]
\ No newline at end of file
+        return reference_data_cache.get_or_load(
+            CAR_STATUSES, lambda: [CarStatusRead.model_validate(s) for s in self.car_status_repo.get_all()]
+        )
\ No newline at end of file
@@ -2,19 +2,24 @@ from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
 from application.car_status.schemas import CarStatusUpdate, CarStatusRead
+from infrastructure.cache import reference_data_cache, CAR_STATUSES
 from infrastructure.database.repository import CarStatusRepository
+from infrastructure.database.unit_of_work import UnitOfWork
 
 
 class UpdateCarStatusUseCase:
     def __init__(self, db: Session):
         self.db = db
+        self.uow = UnitOfWork(db)
         self.car_status_repo = CarStatusRepository(db)
 
     def execute(self, status_data: CarStatusUpdate) -> CarStatusRead:
-        car_status = self.car_status_repo.get_by_id(status_data.id)
-        if car_status is None:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Статус не найден")
+        with self.uow:
+            car_status = self.car_status_repo.get_by_id(status_data.id)
+            if car_status is None:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Статус не найден")
 
-        status_res = self.car_status_repo.update(status_data.id, status_data.status)
+            status_res = self.car_status_repo.update(status_data.id, status_data.status)
+            reference_data_cache.invalidate(CAR_STATUSES, self.db)
 
-        return CarStatusRead.model_validate(status_res)
\ No newline at end of file
+            return CarStatusRead.model_validate(status_res)
\ No newline at end of file
@@ -1,45 +1,76 @@
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 
 from application.client.schemas import ClientRead, ClientCreate, ClientUpdate
-from application.client.usecases import CreateClientUseCase, UpdateClientUseCase, GetAllClientsUseCase
+from application.client.usecases import CreateClientUseCase, UpdateClientUseCase, GetAllClientsUseCase, \
+    GetClientsByIdsUseCase, SearchClientsUseCase
 from application.client.usecases.get_client_by_id_use_case import GetClientByIdUseCase
 from application.client.usecases.get_client_by_user_id_use_case import GetClientByUserIdUseCase
 from application.dependencies import get_current_user
+from application.pagination import Page, PageParams, page_params, MAX_PAGE_LIMIT
 from infrastructure.database.database_session import get_db
-from infrastructure.database.models import UserEntity
+from infrastructure.cache import AuthenticatedPrincipal
 
 router = APIRouter(prefix="/clients", tags=["Client"])
 
 
-@router.get("/", response_model=List[ClientRead])
+@router.get("/", response_model=Page[ClientRead])
 def get_all_clients(
-    current_user: UserEntity = Depends(get_current_user),
+    page: PageParams = Depends(page_params),
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     if current_user.role.role_name != "admin":
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Только администратор может получать список всех клиентов")
 
-    return GetAllClientsUseCase(db).execute()
+    return GetAllClientsUseCase(db).execute(page)
 
 
 @router.get("/profile", response_model=ClientRead)
 def get_profile(
-        current_user: UserEntity = Depends(get_current_user),
+        current_user: AuthenticatedPrincipal = Depends(get_current_user),
         db: Session = Depends(get_db)
 ):
     if current_user.role.role_name != "user":
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Только пользователь может входить в свой профиль")
 
+    if current_user.client_id is not None:
+        return GetClientByIdUseCase(db).execute(current_user.client_id)
+    # Профиль могли заполнить через другой воркер: его кэш принципалов об этом не знает
     return GetClientByUserIdUseCase(db).execute(current_user.id)
 
 
+@router.get("/by-ids", response_model=List[ClientRead])
+def get_clients_by_ids(
+    ids: List[int] = Query(..., max_length=MAX_PAGE_LIMIT, description="Id клиентов (параметр повторяется)"),
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    if current_user.role.role_name != "admin":
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Только администратор может получать клиентов по id")
+
+    return GetClientsByIdsUseCase(db).execute(ids)
+
+
+@router.get("/search", response_model=List[ClientRead])
+def search_clients(
+    q: str = Query(..., min_length=1, max_length=100, description="Фамилия, имя, телефон, email или номер прав"),
+    limit: int = Query(20, ge=1, le=50),
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    if current_user.role.role_name != "admin":
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Только администратор может искать клиентов")
+
+    return SearchClientsUseCase(db).execute(q, limit)
+
+
 @router.get("/{client_id}", response_model=ClientRead)
 def get_client_by_id(
         client_id: int,
-        current_user: UserEntity = Depends(get_current_user),
+        current_user: AuthenticatedPrincipal = Depends(get_current_user),
         db: Session = Depends(get_db)
 ):
     if current_user.role.role_name != "admin":
@@ -51,7 +82,7 @@ def get_client_by_id(
 @router.post("/", response_model=ClientRead, status_code=status.HTTP_201_CREATED)
 def add_client(
     client_data: ClientCreate,
-    current_user: UserEntity = Depends(get_current_user),
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     if not current_user:
@@ -63,7 +94,7 @@ def add_client(
 @router.put("/{client_id}", response_model=ClientRead)
 def update_client(
     client_data: ClientUpdate,
-    current_user: UserEntity = Depends(get_current_user),
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     if current_user.role.role_name != "admin":
@@ -1,3 +1,5 @@
 from .update_client_use_case import UpdateClientUseCase
 from .create_client_use_case import CreateClientUseCase
-from .get_all_clients_use_case import GetAllClientsUseCase
\ No newline at end of file
+from .get_all_clients_use_case import GetAllClientsUseCase
+from .get_clients_by_ids_use_case import GetClientsByIdsUseCase
+from .search_clients_use_case import SearchClientsUseCase
\ No newline at end of file
@@ -1,8 +1,9 @@
-from typing import List
+from typing import Optional
 
 from sqlalchemy.orm import Session
 
 from application.client.schemas import ClientRead
+from application.pagination import Page, PageParams
 from infrastructure.database.repository import ClientRepository
 
 
@@ -11,6 +12,7 @@ class GetAllClientsUseCase:
         self.db = db
         self.client_repo = ClientRepository(db)
 
-    def execute(self) -> List[ClientRead]:
-        clients = self.client_repo.get_all()
-        return [ClientRead.model_validate(c) for c in clients]
\ No newline at end of file
+    def execute(self, page: Optional[PageParams] = None) -> Page[ClientRead]:
+        page = page or PageParams()
+        clients = self.client_repo.get_page(page.limit, page.after, page.with_total)
+        return Page[ClientRead].from_keyset(clients, ClientRead)
\ No newline at end of file
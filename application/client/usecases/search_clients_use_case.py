@@ -0,0 +1,15 @@
+from typing import List
+
+from sqlalchemy.orm import Session
+
+from application.client.schemas import ClientRead
+from infrastructure.database.repository import ClientRepository
+
+
+class SearchClientsUseCase:
+    def __init__(self, db: Session):
+        self.db = db
+        self.client_repo = ClientRepository(db)
+
+    def execute(self, text: str, limit: int) -> List[ClientRead]:
+        return [ClientRead.model_validate(client) for client in self.client_repo.search(text, limit)]
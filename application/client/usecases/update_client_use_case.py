@@ -3,25 +3,28 @@ from sqlalchemy.orm import Session
 
 from application.client.schemas import ClientUpdate, ClientRead
 from infrastructure.database.repository import ClientRepository
+from infrastructure.database.unit_of_work import UnitOfWork
 
 
 class UpdateClientUseCase:
     def __init__(self, db: Session):
         self.db = db
+        self.uow = UnitOfWork(db)
         self.client_repo = ClientRepository(db)
 
     def execute(self, client_data: ClientUpdate) -> ClientRead:
-        client = self.client_repo.get_by_id(client_data.id)
-        if client is None:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Клиент не найден")
+        with self.uow:
+            client = self.client_repo.get_by_id(client_data.id)
+            if client is None:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Клиент не найден")
 
-        client_res = self.client_repo.update(
-            client_id=client_data.id,
-            name = client_data.name,
-            surname = client_data.surname,
-            phone = client_data.phone,
-            email = client_data.email,
-            driver_license = client_data.driver_license
-        )
+            client_res = self.client_repo.update(
+                client_id=client_data.id,
+                name = client_data.name,
+                surname = client_data.surname,
+                phone = client_data.phone,
+                email = client_data.email,
+                driver_license = client_data.driver_license
+            )
 
-        return ClientRead.model_validate(client_res)
\ No newline at end of file
+            return ClientRead.model_validate(client_res)
\ No newline at end of file
@@ -2,6 +2,7 @@ from fastapi import Depends, Request
 from sqlalchemy.orm import Session
 
 from application.auth.utils.jwt import decode_token
+from infrastructure.cache import AuthenticatedPrincipal, principal_cache
 from infrastructure.database.repository import UserRepository
 from infrastructure.database.database_session import get_db
 
@@ -21,8 +22,14 @@ def get_current_user(
     if not user_id:
         return None
 
-    user = UserRepository(db).get_by_id(user_id)
+    principal = principal_cache.get(int(user_id))
+    if principal:
+        return principal
+
+    user, client_id = UserRepository(db).get_with_client_id(int(user_id))
     if not user:
         return None
 
-    return user
+    principal = AuthenticatedPrincipal.from_user(user, client_id)
+    principal_cache.put(principal)
+    return principal
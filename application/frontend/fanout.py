@@ -0,0 +1,142 @@
+import asyncio
+import logging
+import os
+import time
+from threading import Lock
+from typing import Any, Dict, List, Tuple
+
+from fastapi import status
+
+from application.frontend.gateway import GatewayError, page_call
+from infrastructure.metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+FANOUT_CALL_TIMEOUT = float(os.getenv("FRONTEND_FANOUT_CALL_TIMEOUT", 5))
+
+
+class PageLatencyMetrics:
+    def __init__(self):
+        self._pages: Dict[str, dict] = {}
+        self._lock = Lock()
+
+    def record(self, page: str, total_ms: float, calls: Dict[str, float], critical_path: List[str]):
+        with self._lock:
+            stats = self._pages.setdefault(page, {
+                "count": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+                "calls": {},
+            })
+            stats["count"] += 1
+            stats["total_ms"] += total_ms
+            stats["max_ms"] = max(stats["max_ms"], total_ms)
+            stats["last_ms"] = total_ms
+            stats["last_critical_path"] = critical_path
+            for name, duration_ms in calls.items():
+                call_stats = stats["calls"].setdefault(name, {"count": 0, "total_ms": 0.0, "on_critical_path": 0})
+                call_stats["count"] += 1
+                call_stats["total_ms"] += duration_ms
+                if name in critical_path:
+                    call_stats["on_critical_path"] += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                page: {
+                    "count": stats["count"],
+                    "avg_ms": round(stats["total_ms"] / stats["count"], 2),
+                    "max_ms": round(stats["max_ms"], 2),
+                    "last_ms": round(stats["last_ms"], 2),
+                    "last_critical_path": list(stats["last_critical_path"]),
+                    "calls": {
+                        name: {
+                            "avg_ms": round(call["total_ms"] / call["count"], 2),
+                            "critical_path_share": round(call["on_critical_path"] / stats["count"], 2),
+                        }
+                        for name, call in stats["calls"].items()
+                    },
+                }
+                for page, stats in self._pages.items()
+            }
+
+
+page_metrics = PageLatencyMetrics()
+metrics_registry.register("frontend_pages", page_metrics.snapshot)
+
+
+class PageLoad:
+    """Параллельная загрузка данных страницы.
+
+    Каждый вызов gather() - отдельный этап: независимые запросы этапа выполняются конкурентно,
+    этапы идут друг за другом. Критический путь страницы - самые долгие вызовы каждого этапа.
+    In-process вызов этапа получает свою сессию и соединение из пула: страница из N вызовов
+    одновременно занимает до N соединений.
+    """
+
+    def __init__(self, page: str, timeout: float = FANOUT_CALL_TIMEOUT):
+        self.page = page
+        self.timeout = timeout
+        self._started = time.perf_counter()
+        self._calls: Dict[str, float] = {}
+        self._critical_path: List[Tuple[str, float]] = []
+
+    async def _run(self, name: str, awaitable):
+        # Задача копирует контекст при создании: in-process шлюз видит, что вызов конкурентный
+        token = page_call.set(True)
+        try:
+            task = asyncio.ensure_future(awaitable)
+        finally:
+            page_call.reset(token)
+
+        started = time.perf_counter()
+        try:
+            return await asyncio.wait_for(task, self.timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Page %s: call %s timed out after %.1fs", self.page, name, self.timeout)
+            raise GatewayError(status.HTTP_504_GATEWAY_TIMEOUT, "Превышено время ожидания ответа")
+        finally:
+            self._calls[name] = (time.perf_counter() - started) * 1000
+
+    async def gather(self, **calls) -> List[Any]:
+        """Выполняет вызовы конкурентно и возвращает результаты в порядке аргументов.
+
+        Значение аргумента - либо awaitable (обязательный вызов, ошибка пробрасывается),
+        либо пара (awaitable, default) - при ошибке или таймауте вернется default.
+        """
+        names = list(calls)
+        awaitables = []
+        defaults = {}
+        for name, call in calls.items():
+            if isinstance(call, tuple):
+                call, defaults[name] = call
+            awaitables.append(self._run(name, call))
+
+        results = await asyncio.gather(*awaitables, return_exceptions=True)
+
+        if names:
+            slowest = max(names, key=lambda n: self._calls.get(n, 0.0))
+            self._critical_path.append((slowest, self._calls.get(slowest, 0.0)))
+
+        values = []
+        for name, result in zip(names, results):
+            if isinstance(result, GatewayError):
+                if name not in defaults:
+                    raise result
+                values.append(defaults[name])
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                values.append(result)
+        return values
+
+    def finish(self, response):
+        total_ms = (time.perf_counter() - self._started) * 1000
+        page_metrics.record(self.page, total_ms, self._calls, [name for name, _ in self._critical_path])
+
+        timings = [f'{name};dur={duration:.1f}' for name, duration in self._calls.items()]
+        critical_ms = sum(duration for _, duration in self._critical_path)
+        timings.append(f'critical-path;dur={critical_ms:.1f};desc="{" > ".join(n for n, _ in self._critical_path)}"')
+        timings.append(f'total;dur={total_ms:.1f}')
+        response.headers["Server-Timing"] = ", ".join(timings)
+        return response
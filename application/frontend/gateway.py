@@ -0,0 +1,576 @@
+import asyncio
+import os
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Collection, Optional, Union
+
+from fastapi import HTTPException, Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel, ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from application.admin.usecases import RentalStatisticUseCase, DashboardStatisticUseCase, RentalAnalyticsUseCase
+from application.auth.schemas import UserCreate
+from application.auth.usecases import RegisterUserUseCase, LogoutUseCase
+from application.car.schemas import CarCreate, CarUpdate, CarFilter
+from application.car.usecases import CreateCarUseCase, DeleteCarUseCase, GetAllCarUseCase, UpdateCarUseCase, \
+    GetCarUseCase, FilterCarUseCase, SearchCarsUseCase, AutocompleteCarsUseCase, GetCarsByIdsUseCase
+from application.car_category.usecases import GetAllCarCategoriesUseCase
+from application.car_color.usecases import GetAllCarColorsUseCase
+from application.car_status.usecases import GetAllCarStatusesUseCase
+from application.client.schemas import ClientCreate, ClientUpdate
+from application.client.usecases import CreateClientUseCase, UpdateClientUseCase, GetAllClientsUseCase, \
+    GetClientsByIdsUseCase, SearchClientsUseCase
+from application.client.usecases.get_client_by_id_use_case import GetClientByIdUseCase
+from application.client.usecases.get_client_by_user_id_use_case import GetClientByUserIdUseCase
+from application.frontend.http_client import send_request
+from application.pagination import PageParams, DEFAULT_PAGE_LIMIT
+from application.rental.schemas import RentalCreate, RentalUpdate, RentalFilter
+from application.rental.usecases import CreateRentalUseCase, DeleteRentalUseCase, GetAllUserRentalsUseCase, \
+    UpdateRentalUseCase, GetUserRentalByIdUseCase, GetAllRentalsUseCase, GetRentalByIdUseCase, GetRentalBundleUseCase
+from application.rental_status.usecases import GetAllRentalStatusesUseCase
+from application.violation.schemas import ViolationCreate, ViolationUpdate
+from application.violation.usecases import CreateViolationUseCase, DeleteViolationUseCase, \
+    GetAllUserViolationsUseCase, UpdateViolationUseCase, GetViolationByIdUseCase, GetUserViolationByIdUseCase, \
+    GetViolationsByRentalUseCase
+from application.violation_type.schemas import ViolationTypeCreate, ViolationTypeUpdate
+from application.violation_type.usecases import CreateViolationTypeUseCase, DeleteViolationTypeUseCase, \
+    GetAllViolationTypesUseCase, UpdateViolationTypeUseCase, GetViolationTypeByIdUseCase
+from infrastructure.database.database_session import AsyncSessionLocal
+
+# "inprocess" - фронтенд вызывает use case'ы напрямую,
+# "http" - фронтенд ходит в API по HTTP (раздельный деплой фронтенда и API)
+FRONTEND_API_MODE = os.getenv("FRONTEND_API_MODE", "inprocess").lower()
+API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000").rstrip("/")
+
+
+class GatewayError(Exception):
+    def __init__(self, status_code: int, detail: Any = None):
+        super().__init__(status_code, detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+# Вызов выполняется внутри PageLoad конкурентно с другими вызовами страницы
+page_call: ContextVar[bool] = ContextVar("frontend_page_call", default=False)
+
+
+def empty_page() -> dict:
+    return {"items": [], "next_after": None, "total": None, "total_is_estimate": False}
+
+
+def _page_query(limit: int, after: Optional[int], with_total: bool = False) -> dict:
+    params = {"limit": limit}
+    if after is not None:
+        params["after"] = after
+    if with_total:
+        params["with_total"] = "true"
+    return params
+
+
+async def fetch_or_default(awaitable, default):
+    """Возвращает default, если API ответил ошибкой (как прежние `{}` / `[]` заглушки)"""
+    try:
+        return await awaitable
+    except GatewayError:
+        return default
+
+
+def _dump(model):
+    if model is None:
+        return None
+    if isinstance(model, list):
+        return [_dump(m) for m in model]
+    if isinstance(model, BaseModel):
+        return model.model_dump(mode="json")
+    return jsonable_encoder(model)
+
+
+class InProcessGateway:
+    """Доступ к данным через use case'ы в том же процессе, с теми же проверками прав, что и в API роутерах.
+
+    Use case'ы и их репозитории синхронные и выполняются через AsyncSession.run_sync: запросы идут через
+    asyncpg без блокировки event loop, но код use case'а (валидация, сериализация) работает в потоке loop.
+    """
+
+    def __init__(self, db: Union[AsyncSession, Session], current_user=None, refresh_token: Optional[str] = None):
+        self.db = db
+        self.current_user = current_user
+        self.refresh_token = refresh_token
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    async def _call(self, use_case_cls, *args, method: str = "execute"):
+        def run(session: Session):
+            return _dump(getattr(use_case_cls(session), method)(*args))
+
+        if page_call.get() and isinstance(self.db, AsyncSession):
+            # Конкурентные вызовы страницы: у каждого своя сессия, таймаут PageLoad отменяет только свой запрос
+            async with AsyncSessionLocal() as session:
+                return await self._execute(session, run)
+        # Сессия запроса не допускает конкурентного использования
+        async with self._lock:
+            return await self._execute(self.db, run)
+
+    @staticmethod
+    async def _execute(db: Union[AsyncSession, Session], run):
+        try:
+            if isinstance(db, AsyncSession):
+                # Синхронные use case'ы выполняются поверх асинхронного драйвера, не блокируя event loop
+                return await db.run_sync(run)
+            return run(db)
+        except HTTPException as exc:
+            raise GatewayError(exc.status_code, exc.detail)
+        except ValidationError as exc:
+            raise GatewayError(status.HTTP_422_UNPROCESSABLE_ENTITY, exc.errors(include_url=False))
+        except SQLAlchemyError:
+            if isinstance(db, AsyncSession):
+                await db.rollback()
+            else:
+                db.rollback()
+            raise GatewayError(status.HTTP_500_INTERNAL_SERVER_ERROR, "Внутренняя ошибка сервера")
+
+    @staticmethod
+    def _validate(schema, data: dict):
+        try:
+            return schema.model_validate(data)
+        except ValidationError as exc:
+            raise GatewayError(status.HTTP_422_UNPROCESSABLE_ENTITY, exc.errors(include_url=False))
+
+    @classmethod
+    def _page(cls, limit: int, after: Optional[int], with_total: bool = False) -> PageParams:
+        return cls._validate(PageParams, {"limit": limit, "after": after, "with_total": with_total})
+
+    def _role(self) -> Optional[str]:
+        if self.current_user is None:
+            return None
+        return self.current_user.role.role_name
+
+    def _require_user(self):
+        if self.current_user is None:
+            raise GatewayError(status.HTTP_401_UNAUTHORIZED, "Требуется авторизация")
+
+    def _require_role(self, role_name: str, detail: str):
+        self._require_user()
+        if self._role() != role_name:
+            raise GatewayError(status.HTTP_403_FORBIDDEN, detail)
+
+    # Auth
+
+    async def register(self, username: str, password: str):
+        user_data = self._validate(UserCreate, {"username": username, "password": password})
+        return await self._call(RegisterUserUseCase, user_data, method="register_user")
+
+    async def logout(self):
+        return await self._call(LogoutUseCase, self.refresh_token, Response())
+
+    # Cars
+
+    async def get_cars(self, after: Optional[int] = None, limit: int = DEFAULT_PAGE_LIMIT, with_total: bool = False):
+        return await self._call(GetAllCarUseCase, self._page(limit, after, with_total))
+
+    async def filter_cars(self, filters: dict, after: Optional[int] = None, limit: int = DEFAULT_PAGE_LIMIT,
+                          with_total: bool = False):
+        return await self._call(
+            FilterCarUseCase, self._validate(CarFilter, filters), self._page(limit, after, with_total)
+        )
+
+    async def search_cars(self, text: str, filters: dict, limit: int = DEFAULT_PAGE_LIMIT):
+        return await self._call(SearchCarsUseCase, text, self._validate(CarFilter, filters), limit)
+
+    async def autocomplete_cars(self, prefix: str, limit: int = 10):
+        return await self._call(AutocompleteCarsUseCase, prefix, limit)
+
+    async def get_car(self, car_id: int):
+        return await self._call(GetCarUseCase, car_id)
+
+    async def get_cars_by_ids(self, car_ids: Collection[int]):
+        if not car_ids:
+            return []
+        return await self._call(GetCarsByIdsUseCase, car_ids)
+
+    async def create_car(self, car_data: dict):
+        self._require_role("admin", "Только администратор может добавлять машины")
+        return await self._call(CreateCarUseCase, self._validate(CarCreate, car_data))
+
+    async def update_car(self, car_id: int, car_data: dict):
+        self._require_role("admin", "Только администратор может изменять машины")
+        return await self._call(UpdateCarUseCase, self._validate(CarUpdate, car_data))
+
+    async def delete_car(self, car_id: int):
+        self._require_role("admin", "Только администратор может удалять машины")
+        return await self._call(DeleteCarUseCase, car_id)
+
+    async def get_car_categories(self):
+        return await self._call(GetAllCarCategoriesUseCase)
+
+    async def get_car_colors(self):
+        return await self._call(GetAllCarColorsUseCase)
+
+    async def get_car_statuses(self):
+        return await self._call(GetAllCarStatusesUseCase)
+
+    # Clients
+
+    async def get_clients(self, after: Optional[int] = None, limit: int = DEFAULT_PAGE_LIMIT,
+                          with_total: bool = False):
+        self._require_role("admin", "Только администратор может получать список всех клиентов")
+        return await self._call(GetAllClientsUseCase, self._page(limit, after, with_total))
+
+    async def get_client(self, client_id: int):
+        self._require_role("admin", "Только администратор может получать клиента по id")
+        return await self._call(GetClientByIdUseCase, client_id)
+
+    async def get_clients_by_ids(self, client_ids: Collection[int]):
+        self._require_role("admin", "Только администратор может получать клиентов по id")
+        if not client_ids:
+            return []
+        return await self._call(GetClientsByIdsUseCase, client_ids)
+
+    async def search_clients(self, text: str, limit: int = 20):
+        self._require_role("admin", "Только администратор может искать клиентов")
+        return await self._call(SearchClientsUseCase, text, limit)
+
+    async def get_profile(self):
+        self._require_role("user", "Только пользователь может входить в свой профиль")
+        if self.current_user.client_id is not None:
+            return await self._call(GetClientByIdUseCase, self.current_user.client_id)
+        # Профиль могли заполнить через другой воркер: его кэш принципалов об этом не знает
+        return await self._call(GetClientByUserIdUseCase, self.current_user.id)
+
+    async def create_client(self, client_data: dict):
+        if self.current_user is None:
+            raise GatewayError(
+                status.HTTP_403_FORBIDDEN,
+                "Только авторизованные пользователи могут заполнить данные о клиенте"
+            )
+        return await self._call(CreateClientUseCase, self._validate(ClientCreate, client_data))
+
+    async def update_client(self, client_id: int, client_data: dict):
+        self._require_role("admin", "Только администратор может изменять данные клиента")
+        return await self._call(UpdateClientUseCase, self._validate(ClientUpdate, client_data))
+
+    # Rentals
+
+    async def get_rental_statuses(self):
+        return await self._call(GetAllRentalStatusesUseCase)
+
+    async def get_rentals(self, car_id: Optional[int] = None, client_id: Optional[int] = None,
+                          after: Optional[int] = None, limit: int = DEFAULT_PAGE_LIMIT, with_total: bool = False):
+        self._require_role("admin", "Только админ может просматривать все аренды")
+        filters = RentalFilter(car_id=car_id, client_id=client_id)
+        return await self._call(GetAllRentalsUseCase, filters, self._page(limit, after, with_total))
+
+    async def get_my_rentals(self, after: Optional[int] = None, limit: int = DEFAULT_PAGE_LIMIT):
+        self._require_user()
+        return await self._call(GetAllUserRentalsUseCase, self.current_user.id, self._page(limit, after))
+
+    async def get_rental(self, rental_id: int):
+        self._require_user()
+        if self._role() == "admin":
+            return await self._call(GetRentalByIdUseCase, rental_id)
+        return await self._call(GetUserRentalByIdUseCase, self.current_user.id, rental_id)
+
+    async def get_rental_bundle(self, rental_id: int):
+        self._require_role("admin", "Только админ может просматривать аренду целиком")
+        return await self._call(GetRentalBundleUseCase, rental_id)
+
+    async def create_rental(self, rental_data: dict):
+        self._require_user()
+        if self.current_user.client_id is None:
+            try:
+                await self._call(GetClientByUserIdUseCase, self.current_user.id)
+            except GatewayError as exc:
+                if exc.status_code == status.HTTP_404_NOT_FOUND:
+                    raise GatewayError(status.HTTP_403_FORBIDDEN, "Только авторизованный пользователь может арендовать авто")
+                raise
+        self._require_role("user", "Только пользователь с заполненными данными о себе может арендовать авто")
+        return await self._call(CreateRentalUseCase, self._validate(RentalCreate, rental_data))
+
+    async def update_rental(self, rental_id: int, rental_data: dict):
+        self._require_role("admin", "Только администратор может изменить аренду")
+        return await self._call(UpdateRentalUseCase, self._validate(RentalUpdate, rental_data))
+
+    async def delete_rental(self, rental_id: int):
+        self._require_role("admin", "Только администратор может удалить аренду")
+        return await self._call(DeleteRentalUseCase, rental_id)
+
+    # Violations
+
+    async def get_my_violations(self, after: Optional[int] = None, limit: int = DEFAULT_PAGE_LIMIT):
+        self._require_user()
+        return await self._call(GetAllUserViolationsUseCase, self.current_user.id, self._page(limit, after))
+
+    async def get_violation(self, violation_id: int):
+        self._require_user()
+        if self._role() == "admin":
+            return await self._call(GetViolationByIdUseCase, violation_id)
+        return await self._call(GetUserViolationByIdUseCase, self.current_user.id, violation_id)
+
+    async def get_violations_by_rental(self, rental_id: int):
+        self._require_role("admin", "Только администратор может просматривать нарушения аренды")
+        return await self._call(GetViolationsByRentalUseCase, rental_id)
+
+    async def create_violation(self, violation_data: dict):
+        self._require_role("admin", "Только администратор может добавлять нарушения")
+        return await self._call(CreateViolationUseCase, self._validate(ViolationCreate, violation_data))
+
+    async def update_violation(self, violation_id: int, violation_data: dict):
+        self._require_role("admin", "Только администратор может изменять нарушения")
+        return await self._call(UpdateViolationUseCase, self._validate(ViolationUpdate, violation_data))
+
+    async def delete_violation(self, violation_id: int):
+        self._require_role("admin", "Только администратор может удалять нарушения")
+        return await self._call(DeleteViolationUseCase, violation_id)
+
+    # Violation types
+
+    async def get_violation_types(self):
+        return await self._call(GetAllViolationTypesUseCase)
+
+    async def get_violation_type(self, violation_type_id: int):
+        return await self._call(GetViolationTypeByIdUseCase, violation_type_id)
+
+    async def create_violation_type(self, type_data: dict):
+        self._require_role("admin", "Только администратор может добавлять типы нарушений")
+        return await self._call(CreateViolationTypeUseCase, self._validate(ViolationTypeCreate, type_data))
+
+    async def update_violation_type(self, violation_type_id: int, type_data: dict):
+        self._require_role("admin", "Только администратор может изменять нарушения")
+        type_model = self._validate(ViolationTypeUpdate, type_data)
+        if type_model.id != violation_type_id:
+            raise GatewayError(status.HTTP_400_BAD_REQUEST, "ID типа нарушения в пути и теле запроса не совпадают")
+        return await self._call(UpdateViolationTypeUseCase, type_model)
+
+    async def delete_violation_type(self, violation_type_id: int):
+        self._require_role("admin", "Только администратор может удалять нарушения")
+        return await self._call(DeleteViolationTypeUseCase, violation_type_id)
+
+    # Statistics
+
+    async def get_rental_statistic(self, start_date: str, end_date: str):
+        self._require_role("admin", "Только администратор может просматривать статистику")
+        try:
+            start_dt = datetime.fromisoformat(start_date)
+            end_dt = datetime.fromisoformat(end_date)
+        except ValueError as e:
+            raise GatewayError(status.HTTP_400_BAD_REQUEST, f"Неправильный формат даты: {str(e)}")
+        return await self._call(RentalStatisticUseCase, start_dt, end_dt)
+
+    async def get_rental_analytics(self, start_date: str, end_date: str):
+        self._require_role("admin", "Только администратор может просматривать статистику")
+        try:
+            start_dt = datetime.fromisoformat(start_date)
+            end_dt = datetime.fromisoformat(end_date)
+        except ValueError as e:
+            raise GatewayError(status.HTTP_400_BAD_REQUEST, f"Неправильный формат даты: {str(e)}")
+        return await self._call(RentalAnalyticsUseCase, start_dt, end_dt)
+
+    async def get_dashboard_statistic(self):
+        self._require_role("admin", "Только администратор может просматривать статистику")
+        return await self._call(DashboardStatisticUseCase)
+
+
+class HttpGateway:
+    """Доступ к данным через HTTP API, когда фронтенд и API развернуты отдельно"""
+
+    def __init__(self, cookies: Optional[dict] = None, base_url: str = API_BASE_URL):
+        self.cookies = cookies or {}
+        self.base_url = base_url
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    async def _request(self, method: str, path: str, params: dict = None, json: dict = None,
+                       expected: tuple = (status.HTTP_200_OK,)):
+        response = await send_request(
+            method, f"{self.base_url}{path}", cookies=self.cookies, params=params, json=json
+        )
+        if response.status_code not in expected:
+            try:
+                detail = response.json().get("detail")
+            except ValueError:
+                detail = None
+            raise GatewayError(response.status_code, detail)
+        if response.status_code == status.HTTP_204_NO_CONTENT or not response.content:
+            return None
+        return response.json()
+
+    async def _get(self, path: str, params: dict = None):
+        return await self._request("GET", path, params=params)
+
+    async def _post(self, path: str, json: dict = None):
+        return await self._request("POST", path, json=json, expected=(status.HTTP_200_OK, status.HTTP_201_CREATED))
+
+    async def _put(self, path: str, json: dict):
+        return await self._request("PUT", path, json=json)
+
+    async def _delete(self, path: str):
+        return await self._request("DELETE", path, expected=(status.HTTP_200_OK, status.HTTP_204_NO_CONTENT))
+
+    # Auth
+
+    async def register(self, username: str, password: str):
+        return await self._post("/auth/register", {"username": username, "password": password})
+
+    async def logout(self):
+        return await self._post("/auth/logout")
+
+    # Cars
+
+    async def get_cars(self, after: Optional[int] = None, limit: int = DEFAULT_PAGE_LIMIT, with_total: bool = False):
+        return await self._get("/cars/", params=_page_query(limit, after, with_total))
+
+    async def filter_cars(self, filters: dict, after: Optional[int] = None, limit: int = DEFAULT_PAGE_LIMIT,
+                          with_total: bool = False):
+        return await self._get("/cars/filter", params={**filters, **_page_query(limit, after, with_total)})
+
+    async def search_cars(self, text: str, filters: dict, limit: int = DEFAULT_PAGE_LIMIT):
+        return await self._get("/cars/search", params={**filters, "q": text, "limit": limit})
+
+    async def autocomplete_cars(self, prefix: str, limit: int = 10):
+        return await self._get("/cars/autocomplete", params={"q": prefix, "limit": limit})
+
+    async def get_car(self, car_id: int):
+        return await self._get(f"/cars/{car_id}")
+
+    async def get_cars_by_ids(self, car_ids: Collection[int]):
+        if not car_ids:
+            return []
+        return await self._get("/cars/by-ids", params={"ids": list(car_ids)})
+
+    async def create_car(self, car_data: dict):
+        return await self._post("/cars/", car_data)
+
+    async def update_car(self, car_id: int, car_data: dict):
+        return await self._put(f"/cars/{car_id}", car_data)
+
+    async def delete_car(self, car_id: int):
+        return await self._delete(f"/cars/{car_id}")
+
+    async def get_car_categories(self):
+        return await self._get("/car_categories/")
+
+    async def get_car_colors(self):
+        return await self._get("/car_colors/")
+
+    async def get_car_statuses(self):
+        return await self._get("/car_statuses/")
+
+    # Clients
+
+    async def get_clients(self, after: Optional[int] = None, limit: int = DEFAULT_PAGE_LIMIT,
+                          with_total: bool = False):
+        return await self._get("/clients/", params=_page_query(limit, after, with_total))
+
+    async def get_client(self, client_id: int):
+        return await self._get(f"/clients/{client_id}")
+
+    async def get_clients_by_ids(self, client_ids: Collection[int]):
+        if not client_ids:
+            return []
+        return await self._get("/clients/by-ids", params={"ids": list(client_ids)})
+
+    async def search_clients(self, text: str, limit: int = 20):
+        return await self._get("/clients/search", params={"q": text, "limit": limit})
+
+    async def get_profile(self):
+        return await self._get("/clients/profile")
+
+    async def create_client(self, client_data: dict):
+        return await self._post("/clients/", client_data)
+
+    async def update_client(self, client_id: int, client_data: dict):
+        return await self._put(f"/clients/{client_id}", client_data)
+
+    # Rentals
+
+    async def get_rental_statuses(self):
+        return await self._get("/rental_statuses/")
+
+    async def get_rentals(self, car_id: Optional[int] = None, client_id: Optional[int] = None,
+                          after: Optional[int] = None, limit: int = DEFAULT_PAGE_LIMIT, with_total: bool = False):
+        params = {key: value for key, value in {"car_id": car_id, "client_id": client_id}.items() if value}
+        return await self._get("/rentals/", params={**params, **_page_query(limit, after, with_total)})
+
+    async def get_my_rentals(self, after: Optional[int] = None, limit: int = DEFAULT_PAGE_LIMIT):
+        return await self._get("/rentals/my", params=_page_query(limit, after))
+
+    async def get_rental(self, rental_id: int):
+        return await self._get(f"/rentals/{rental_id}")
+
+    async def get_rental_bundle(self, rental_id: int):
+        return await self._get(f"/rentals/{rental_id}/bundle")
+
+    async def create_rental(self, rental_data: dict):
+        return await self._post("/rentals/", rental_data)
+
+    async def update_rental(self, rental_id: int, rental_data: dict):
+        return await self._put(f"/rentals/{rental_id}", rental_data)
+
+    async def delete_rental(self, rental_id: int):
+        return await self._delete(f"/rentals/{rental_id}")
+
+    # Violations
+
+    async def get_my_violations(self, after: Optional[int] = None, limit: int = DEFAULT_PAGE_LIMIT):
+        return await self._get("/violations/", params=_page_query(limit, after))
+
+    async def get_violation(self, violation_id: int):
+        return await self._get(f"/violations/{violation_id}")
+
+    async def get_violations_by_rental(self, rental_id: int):
+        return await self._get(f"/violations/rental/{rental_id}")
+
+    async def create_violation(self, violation_data: dict):
+        return await self._post("/violations/", violation_data)
+
+    async def update_violation(self, violation_id: int, violation_data: dict):
+        return await self._put(f"/violations/{violation_id}", violation_data)
+
+    async def delete_violation(self, violation_id: int):
+        return await self._delete(f"/violations/{violation_id}")
+
+    # Violation types
+
+    async def get_violation_types(self):
+        return await self._get("/violation_types/")
+
+    async def get_violation_type(self, violation_type_id: int):
+        return await self._get(f"/violation_types/{violation_type_id}")
+
+    async def create_violation_type(self, type_data: dict):
+        return await self._post("/violation_types/", type_data)
+
+    async def update_violation_type(self, violation_type_id: int, type_data: dict):
+        return await self._put(f"/violation_types/{violation_type_id}", type_data)
+
+    async def delete_violation_type(self, violation_type_id: int):
+        return await self._delete(f"/violation_types/{violation_type_id}")
+
+    # Statistics
+
+    async def get_rental_statistic(self, start_date: str, end_date: str):
+        return await self._get("/admin/rental-statistic", params={"start_date": start_date, "end_date": end_date})
+
+    async def get_rental_analytics(self, start_date: str, end_date: str):
+        return await self._get("/admin/rental-analytics", params={"start_date": start_date, "end_date": end_date})
+
+    async def get_dashboard_statistic(self):
+        return await self._get("/admin/dashboard-statistic")
+
+
+def frontend_gateway(request: Request, db: Union[AsyncSession, Session], current_user=None):
+    if FRONTEND_API_MODE == "http":
+        return HttpGateway(cookies=dict(request.cookies))
+    return InProcessGateway(db, current_user, refresh_token=request.cookies.get("refresh_token"))
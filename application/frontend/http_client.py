@@ -0,0 +1,142 @@
+import logging
+import os
+import time
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from threading import Lock
+from typing import Optional, Tuple
+
+import httpx
+
+from infrastructure.metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+HTTP_MAX_CONNECTIONS = int(os.getenv("FRONTEND_HTTP_MAX_CONNECTIONS", 100))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("FRONTEND_HTTP_MAX_KEEPALIVE_CONNECTIONS", 20))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("FRONTEND_HTTP_KEEPALIVE_EXPIRY", 30))
+HTTP_TIMEOUT = float(os.getenv("FRONTEND_HTTP_TIMEOUT", 10))
+HTTP_POOL_TIMEOUT = float(os.getenv("FRONTEND_HTTP_POOL_TIMEOUT", 5))
+HTTP2_ENABLED = os.getenv("FRONTEND_HTTP2", "false").lower() in ("1", "true", "yes")
+
+# Первое событие httpcore после получения соединения из пула
+_CONNECTION_ACQUIRED_EVENTS = (
+    "connection.connect_tcp.started",
+    "http11.send_request_headers.started",
+    "http2.send_request_headers.started",
+)
+
+
+class HttpPoolMetrics:
+    def __init__(self):
+        self._lock = Lock()
+        self._requests = 0
+        self._wait_total_ms = 0.0
+        self._wait_max_ms = 0.0
+        self._pool_timeouts = 0
+
+    def record_wait(self, wait_ms: float):
+        with self._lock:
+            self._requests += 1
+            self._wait_total_ms += wait_ms
+            self._wait_max_ms = max(self._wait_max_ms, wait_ms)
+
+    def record_pool_timeout(self):
+        with self._lock:
+            self._pool_timeouts += 1
+
+    def snapshot(self) -> dict:
+        usage = _pool_usage()
+        with self._lock:
+            return {
+                "started": _client is not None,
+                "http2": HTTP2_ENABLED,
+                "max_connections": HTTP_MAX_CONNECTIONS,
+                "max_keepalive_connections": HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                "in_use": usage[0] if usage else None,
+                "idle": usage[1] if usage else None,
+                "requests": self._requests,
+                "wait_avg_ms": round(self._wait_total_ms / self._requests, 2) if self._requests else 0.0,
+                "wait_max_ms": round(self._wait_max_ms, 2),
+                "pool_timeouts": self._pool_timeouts,
+            }
+
+
+pool_metrics = HttpPoolMetrics()
+metrics_registry.register("frontend_http_pool", pool_metrics.snapshot)
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _pool_usage() -> Optional[Tuple[int, int]]:
+    """(занятые, простаивающие) соединения пула; None, если внутреннее устройство httpx/httpcore изменилось"""
+    if _client is None:
+        return 0, 0
+    # Пул httpcore не имеет публичного API для статистики: читаются приватные атрибуты
+    try:
+        connections = list(_client._transport._pool.connections)
+        in_use = sum(1 for connection in connections if not connection.is_idle())
+    except (AttributeError, TypeError):
+        return None
+    return in_use, len(connections) - in_use
+
+
+def _create_client() -> httpx.AsyncClient:
+    # Клиент общий для всех пользователей: ответные cookie не сохраняются,
+    # cookie текущего пользователя передаются в заголовке каждого запроса
+    cookies = CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+    limits = httpx.Limits(
+        max_connections=HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+    )
+    timeout = httpx.Timeout(HTTP_TIMEOUT, pool=HTTP_POOL_TIMEOUT)
+    try:
+        return httpx.AsyncClient(
+            cookies=cookies, limits=limits, timeout=timeout, http2=HTTP2_ENABLED, follow_redirects=False
+        )
+    except ImportError:
+        logger.warning("HTTP/2 requested but the h2 package is not installed, falling back to HTTP/1.1")
+        return httpx.AsyncClient(cookies=cookies, limits=limits, timeout=timeout, follow_redirects=False)
+
+
+async def start_http_client():
+    global _client
+    if _client is None:
+        _client = _create_client()
+
+
+async def close_http_client():
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        # Используется вне жизненного цикла приложения (скрипты, тесты)
+        logger.warning("Shared HTTP client is not started, creating it lazily")
+        _client = _create_client()
+    return _client
+
+
+async def send_request(method: str, url: str, cookies: Optional[dict] = None, **kwargs) -> httpx.Response:
+    started = time.perf_counter()
+    acquired = False
+
+    async def trace(event_name: str, info: dict):
+        nonlocal acquired
+        if not acquired and event_name in _CONNECTION_ACQUIRED_EVENTS:
+            acquired = True
+            pool_metrics.record_wait((time.perf_counter() - started) * 1000)
+
+    headers = dict(kwargs.pop("headers", None) or {})
+    if cookies:
+        headers["Cookie"] = "; ".join(f"{name}={value}" for name, value in cookies.items())
+
+    try:
+        return await get_http_client().request(method, url, headers=headers, extensions={"trace": trace}, **kwargs)
+    except httpx.PoolTimeout:
+        pool_metrics.record_pool_timeout()
+        raise
@@ -1,78 +1,80 @@
-from fastapi import APIRouter, Depends, Request, Form, HTTPException, status
+from fastapi import APIRouter, Depends, Request, Form, Query, HTTPException, status
 from fastapi.responses import HTMLResponse, RedirectResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 from decimal import Decimal
 
+from application.frontend.fanout import PageLoad
+from application.frontend.gateway import frontend_gateway, fetch_or_default, GatewayError, empty_page
 from application.frontend.templates import templates
-from application.frontend.utils import get_current_user_async
-from infrastructure.database.database_session import get_db
-import httpx
+from application.frontend.utils import get_current_user_async, parse_page_after, pagination_context
+from infrastructure.database.database_session import get_async_db
 
 router = APIRouter(tags=["Frontend Admin CRUD"])
 
-BASE_URL = "http://localhost:8000"
-
 
 def check_admin(current_user):
     if not current_user or current_user.role.role_name != "admin":
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Доступ запрещен")
 
 
+async def _load_car_references(api, page: PageLoad):
+    return await page.gather(
+        car_categories=(api.get_car_categories(), []),
+        car_colors=(api.get_car_colors(), []),
+        car_statuses=(api.get_car_statuses(), []),
+    )
+
+
 @router.get("/admin/cars", response_class=HTMLResponse)
-async def admin_cars(request: Request, db: Session = Depends(get_db)):
+async def admin_cars(
+    request: Request,
+    after: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_async_db)
+):
     current_user = await get_current_user_async(request, db)
     check_admin(current_user)
     
-    cookies = dict(request.cookies)
-    
-    async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-        response = await client.get(f"{BASE_URL}/cars/")
-        cars = response.json() if response.status_code == 200 else []
-        
-        # Получаем дополнительные данные
-        categories_resp = await client.get(f"{BASE_URL}/car_categories/")
-        categories = {c["id"]: c for c in categories_resp.json()} if categories_resp.status_code == 200 else {}
-        
-        colors_resp = await client.get(f"{BASE_URL}/car_colors/")
-        colors = {c["id"]: c for c in colors_resp.json()} if colors_resp.status_code == 200 else {}
-        
-        statuses_resp = await client.get(f"{BASE_URL}/car_statuses/")
-        statuses = {s["id"]: s for s in statuses_resp.json()} if statuses_resp.status_code == 200 else {}
-        
-        for car in cars:
-            car["category"] = categories.get(car.get("category_id"), {})
-            car["color"] = colors.get(car.get("color_id"), {})
-            car["status"] = statuses.get(car.get("car_status_id"), {})
-    
-    return templates.TemplateResponse(
+    page = PageLoad("admin_cars")
+    async with frontend_gateway(request, db, current_user) as api:
+        cars_page, categories, colors, statuses = await page.gather(
+            cars=(api.get_cars(after=parse_page_after(after), with_total=True), empty_page()),
+            car_categories=(api.get_car_categories(), []),
+            car_colors=(api.get_car_colors(), []),
+            car_statuses=(api.get_car_statuses(), []),
+        )
+    
+    categories = {c["id"]: c for c in categories}
+    colors = {c["id"]: c for c in colors}
+    statuses = {s["id"]: s for s in statuses}
+    
+    cars = cars_page["items"]
+    for car in cars:
+        car["category"] = categories.get(car.get("category_id"), {})
+        car["color"] = colors.get(car.get("color_id"), {})
+        car["status"] = statuses.get(car.get("car_status_id"), {})
+    
+    return page.finish(templates.TemplateResponse(
         "admin/cars/list.html",
         {
             "request": request,
             "current_user": current_user,
-            "cars": cars
+            "cars": cars,
+            "pagination": pagination_context(request, cars_page)
         }
-    )
+    ))
 
 
 @router.get("/admin/cars/create", response_class=HTMLResponse)
-async def admin_car_create_page(request: Request, db: Session = Depends(get_db)):
+async def admin_car_create_page(request: Request, db: AsyncSession = Depends(get_async_db)):
     current_user = await get_current_user_async(request, db)
     check_admin(current_user)
     
-    cookies = dict(request.cookies)
+    page = PageLoad("admin_car_create")
+    async with frontend_gateway(request, db, current_user) as api:
+        categories, colors, statuses = await _load_car_references(api, page)
     
-    async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-        categories_resp = await client.get(f"{BASE_URL}/car_categories/")
-        categories = categories_resp.json() if categories_resp.status_code == 200 else []
-        
-        colors_resp = await client.get(f"{BASE_URL}/car_colors/")
-        colors = colors_resp.json() if colors_resp.status_code == 200 else []
-        
-        statuses_resp = await client.get(f"{BASE_URL}/car_statuses/")
-        statuses = statuses_resp.json() if statuses_resp.status_code == 200 else []
-    
-    return templates.TemplateResponse(
+    return page.finish(templates.TemplateResponse(
         "admin/cars/create.html",
         {
             "request": request,
@@ -81,7 +83,7 @@ async def admin_car_create_page(request: Request, db: Session = Depends(get_db))
             "colors": colors,
             "statuses": statuses
         }
-    )
+    ))
 
 
 @router.post("/admin/cars/create", response_class=HTMLResponse)
@@ -95,13 +97,11 @@ async def admin_car_create_submit(
     color_id: int = Form(...),
     daily_cost: str = Form(...),
     car_status_id: int = Form(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     current_user = await get_current_user_async(request, db)
     check_admin(current_user)
     
-    cookies = dict(request.cookies)
-    
     car_data = {
         "brand": brand,
         "model": model,
@@ -113,20 +113,13 @@ async def admin_car_create_submit(
         "car_status_id": car_status_id
     }
     
-    async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-        response = await client.post(f"{BASE_URL}/cars/", json=car_data)
-        
-        if response.status_code == 201:
-            car = response.json()
+    async with frontend_gateway(request, db, current_user) as api:
+        try:
+            await api.create_car(car_data)
             return RedirectResponse(url=f"/admin/cars", status_code=302)
-        else:
-            error = response.json().get("detail", "Ошибка при создании")
-            categories_resp = await client.get(f"{BASE_URL}/car_categories/")
-            categories = categories_resp.json() if categories_resp.status_code == 200 else []
-            colors_resp = await client.get(f"{BASE_URL}/car_colors/")
-            colors = colors_resp.json() if colors_resp.status_code == 200 else []
-            statuses_resp = await client.get(f"{BASE_URL}/car_statuses/")
-            statuses = statuses_resp.json() if statuses_resp.status_code == 200 else []
+        except GatewayError as exc:
+            error = exc.detail or "Ошибка при создании"
+            categories, colors, statuses = await _load_car_references(api, PageLoad("admin_car_form"))
             
             return templates.TemplateResponse(
                 "admin/cars/create.html",
@@ -145,30 +138,24 @@ async def admin_car_create_submit(
 async def admin_car_edit_page(
     request: Request,
     car_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     current_user = await get_current_user_async(request, db)
     check_admin(current_user)
     
-    cookies = dict(request.cookies)
-    
-    async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-        response = await client.get(f"{BASE_URL}/cars/{car_id}")
-        if response.status_code != 200:
+    page = PageLoad("admin_car_edit")
+    async with frontend_gateway(request, db, current_user) as api:
+        try:
+            car, categories, colors, statuses = await page.gather(
+                car=api.get_car(car_id),
+                car_categories=(api.get_car_categories(), []),
+                car_colors=(api.get_car_colors(), []),
+                car_statuses=(api.get_car_statuses(), []),
+            )
+        except GatewayError:
             return RedirectResponse(url="/admin/cars", status_code=302)
-        
-        car = response.json()
-        
-        categories_resp = await client.get(f"{BASE_URL}/car_categories/")
-        categories = categories_resp.json() if categories_resp.status_code == 200 else []
-        
-        colors_resp = await client.get(f"{BASE_URL}/car_colors/")
-        colors = colors_resp.json() if colors_resp.status_code == 200 else []
-        
-        statuses_resp = await client.get(f"{BASE_URL}/car_statuses/")
-        statuses = statuses_resp.json() if statuses_resp.status_code == 200 else []
     
-    return templates.TemplateResponse(
+    return page.finish(templates.TemplateResponse(
         "admin/cars/edit.html",
         {
             "request": request,
@@ -178,7 +165,7 @@ async def admin_car_edit_page(
             "colors": colors,
             "statuses": statuses
         }
-    )
+    ))
 
 
 @router.post("/admin/cars/{car_id}/edit", response_class=HTMLResponse)
@@ -193,13 +180,11 @@ async def admin_car_edit_submit(
     color_id: int = Form(...),
     daily_cost: str = Form(...),
     car_status_id: int = Form(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     current_user = await get_current_user_async(request, db)
     check_admin(current_user)
     
-    cookies = dict(request.cookies)
-    
     car_data = {
         "id": car_id,
         "brand": brand,
@@ -212,19 +197,13 @@ async def admin_car_edit_submit(
         "car_status_id": car_status_id
     }
     
-    async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-        response = await client.put(f"{BASE_URL}/cars/{car_id}", json=car_data)
-        
-        if response.status_code == 200:
+    async with frontend_gateway(request, db, current_user) as api:
+        try:
+            await api.update_car(car_id, car_data)
             return RedirectResponse(url="/admin/cars", status_code=302)
-        else:
-            error = response.json().get("detail", "Ошибка при обновлении")
-            categories_resp = await client.get(f"{BASE_URL}/car_categories/")
-            categories = categories_resp.json() if categories_resp.status_code == 200 else []
-            colors_resp = await client.get(f"{BASE_URL}/car_colors/")
-            colors = colors_resp.json() if colors_resp.status_code == 200 else []
-            statuses_resp = await client.get(f"{BASE_URL}/car_statuses/")
-            statuses = statuses_resp.json() if statuses_resp.status_code == 200 else []
+        except GatewayError as exc:
+            error = exc.detail or "Ошибка при обновлении"
+            categories, colors, statuses = await _load_car_references(api, PageLoad("admin_car_form"))
             
             return templates.TemplateResponse(
                 "admin/cars/edit.html",
@@ -244,15 +223,13 @@ async def admin_car_edit_submit(
 async def admin_car_delete(
     request: Request,
     car_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     current_user = await get_current_user_async(request, db)
     check_admin(current_user)
     
-    cookies = dict(request.cookies)
-    
-    async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-        await client.delete(f"{BASE_URL}/cars/{car_id}")
+    async with frontend_gateway(request, db, current_user) as api:
+        await fetch_or_default(api.delete_car(car_id), None)
     
     return RedirectResponse(url="/admin/cars", status_code=302)
 
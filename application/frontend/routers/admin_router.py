@@ -1,30 +1,24 @@
 import logging
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Iterable, Dict
 from urllib.parse import quote_plus
 
 import httpx
 from fastapi import APIRouter, Depends, Request, Form, Query, HTTPException, status
-from fastapi.responses import HTMLResponse, RedirectResponse
-from sqlalchemy.orm import Session
+from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from application.car.usecases import GetCarUseCase
-from application.client.usecases.get_client_by_id_use_case import GetClientByIdUseCase
+from application.frontend.fanout import PageLoad
+from application.frontend.gateway import frontend_gateway, fetch_or_default, GatewayError, InProcessGateway, empty_page
 from application.frontend.templates import templates
-from application.frontend.utils import get_current_user_async
-from application.rental.usecases import GetRentalByIdUseCase
-from application.rental_status.usecases import GetAllRentalStatusesUseCase
-from application.violation.usecases import GetViolationsByRentalUseCase
-from application.violation_type.usecases import GetAllViolationTypesUseCase
-from infrastructure.database.database_session import get_db
+from application.frontend.utils import get_current_user_async, parse_page_after, pagination_context
+from infrastructure.database.database_session import get_async_db
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["Frontend Admin"])
 
-BASE_URL = "http://localhost:8000"
-
 
 def check_admin(current_user):
     if not current_user or current_user.role.role_name != "admin":
@@ -46,164 +40,103 @@ def _format_datetime_local(datetime_str: Optional[str]) -> Optional[str]:
         return datetime_str[:16]
 
 
-async def _fetch_violation_types(client: httpx.AsyncClient):
-    response = await client.get(f"{BASE_URL}/violation_types/")
-    if response.status_code == 200:
-        return response.json()
-    return []
-
-
-async def _load_rental_detail(
-    client: httpx.AsyncClient,
-    rental_id: int
-):
-    rental_resp = await client.get(f"{BASE_URL}/rentals/{rental_id}")
-    if rental_resp.status_code != 200:
-        return None, [], []
-
-    rental = rental_resp.json()
-
-    status_resp = await client.get(f"{BASE_URL}/rental_statuses/")
-    statuses = {s["id"]: s for s in status_resp.json()} if status_resp.status_code == 200 else {}
+# Сколько вариантов показывает поиск машины или клиента в выпадающих списках
+LOOKUP_LIMIT = 20
 
-    car_resp = await client.get(f"{BASE_URL}/cars/{rental.get('car_id')}")
-    car = car_resp.json() if car_resp.status_code == 200 else {}
 
-    client_resp = await client.get(f"{BASE_URL}/clients/{rental.get('client_id')}")
-    client_data = client_resp.json() if client_resp.status_code == 200 else {}
+def _car_label(car: dict) -> str:
+    return f"{car['brand']} {car['model']} ({car['license_plate']})"
 
-    rental["status"] = statuses.get(rental.get("rental_status_id"), {})
-    rental["car"] = car
-    rental["client"] = client_data
 
-    violations_resp = await client.get(f"{BASE_URL}/violations/rental/{rental_id}")
-    violations = violations_resp.json() if violations_resp.status_code == 200 else []
+def _client_label(client: dict) -> str:
+    return f"{client['name']} {client['surname']}"
 
-    violation_types = await _fetch_violation_types(client)
-    violation_types_map = {v["id"]: v for v in violation_types}
 
-    for violation in violations:
-        violation["type"] = violation_types_map.get(violation.get("violation_type_id"), {})
-
-    return rental, violations, violation_types
+async def _load_rental_parties(
+        api, page: PageLoad, car_ids: Iterable[Optional[int]], client_ids: Iterable[Optional[int]]
+) -> Tuple[Dict[int, dict], Dict[int, dict]]:
+    """Машины и клиенты по id: загружаются только записи, которые есть на странице"""
+    cars, clients = await page.gather(
+        cars=(api.get_cars_by_ids(sorted({car_id for car_id in car_ids if car_id is not None})), []),
+        clients=(api.get_clients_by_ids(sorted({client_id for client_id in client_ids if client_id is not None})), []),
+    )
+    return {car["id"]: car for car in cars}, {client["id"]: client for client in clients}
 
 
-def _load_rental_detail_from_db(
-    db: Session,
-    rental_id: int
-) -> Tuple[Optional[dict], list, list]:
+async def _load_rental_detail(api, rental_id: int, page: PageLoad):
     try:
-        rental_model = GetRentalByIdUseCase(db).execute(rental_id)
-    except HTTPException:
+        rental, = await page.gather(rental_bundle=api.get_rental_bundle(rental_id))
+    except GatewayError:
         return None, [], []
 
-    rental = rental_model.model_dump(mode="json")
-
-    try:
-        car_model = GetCarUseCase(db).execute(rental["car_id"])
-        rental["car"] = car_model.model_dump(mode="json")
-    except HTTPException:
-        rental["car"] = {}
-
-    try:
-        client_model = GetClientByIdUseCase(db).execute(rental["client_id"])
-        rental["client"] = client_model.model_dump(mode="json")
-    except HTTPException:
-        rental["client"] = {}
-
-    try:
-        statuses = GetAllRentalStatusesUseCase(db).execute()
-        statuses_map = {status.id: status.model_dump(mode="json") for status in statuses}
-    except Exception:
-        statuses_map = {}
-    rental["status"] = statuses_map.get(rental.get("rental_status_id"), {})
-
-    try:
-        violation_types_models = GetAllViolationTypesUseCase(db).execute()
-        violation_types = [v.model_dump(mode="json") for v in violation_types_models]
-    except Exception:
-        violation_types = []
-
-    violation_types_map = {v["id"]: v for v in violation_types}
-
-    try:
-        violations_models = GetViolationsByRentalUseCase(db).execute(rental_id)
-        violations = [violation.model_dump(mode="json") for violation in violations_models]
-    except Exception:
-        violations = []
+    rental["status"] = rental.get("status") or {}
+    rental["car"] = rental.get("car") or {}
+    rental["client"] = rental.get("client") or {}
 
+    violations = rental.pop("violations", [])
     for violation in violations:
-        violation["type"] = violation_types_map.get(violation.get("violation_type_id"), {})
+        violation["type"] = violation.get("type") or {}
 
-    return rental, violations, violation_types
+    return rental, violations, rental.pop("violation_types", [])
 
 
 async def _get_rental_detail_data(
+    request: Request,
     rental_id: int,
-    cookies: dict,
-    db: Session
+    db: AsyncSession,
+    current_user,
+    page: PageLoad
 ) -> Tuple[Optional[dict], list, list]:
     try:
-        async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-            rental, violations, violation_types = await _load_rental_detail(client, rental_id)
+        async with frontend_gateway(request, db, current_user) as api:
+            return await _load_rental_detail(api, rental_id, page)
     except httpx.HTTPError as exc:
         logger.warning("Failed to load rental %s via API: %s. Falling back to DB.", rental_id, exc)
-        return _load_rental_detail_from_db(db, rental_id)
-
-    if rental is None:
-        return None, [], []
-
-    return rental, violations, violation_types
+        return await _load_rental_detail(InProcessGateway(db, current_user), rental_id, page)
 
 
 @router.get("/admin/dashboard", response_class=HTMLResponse)
-async def admin_dashboard(request: Request, db: Session = Depends(get_db)):
+async def admin_dashboard(request: Request, db: AsyncSession = Depends(get_async_db)):
     current_user = await get_current_user_async(request, db)
     check_admin(current_user)
     
-    cookies = dict(request.cookies)
-    
-    async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-        stats_resp = await client.get(f"{BASE_URL}/cars/")
-        cars_count = len(stats_resp.json()) if stats_resp.status_code == 200 else 0
-        
-        clients_resp = await client.get(f"{BASE_URL}/clients/")
-        clients_count = len(clients_resp.json()) if clients_resp.status_code == 200 else 0
-
-        rentals_resp = await client.get(f"{BASE_URL}/rentals/")
-        rentals_count = len(rentals_resp.json()) if rentals_resp.status_code == 200 else 0
+    page = PageLoad("admin_dashboard")
+    async with frontend_gateway(request, db, current_user) as api:
+        stats, = await page.gather(
+            dashboard_statistic=(api.get_dashboard_statistic(), {"cars": 0, "clients": 0, "rentals": 0}),
+        )
     
-    return templates.TemplateResponse(
+    return page.finish(templates.TemplateResponse(
         "admin/dashboard.html",
         {
             "request": request,
             "current_user": current_user,
-            "stats": {
-                "cars": cars_count,
-                "clients": clients_count,
-                "rentals": rentals_count
-            }
+            "stats": stats
         }
-    )
+    ))
 
 
 @router.get("/admin/clients", response_class=HTMLResponse)
-async def admin_clients(request: Request, db: Session = Depends(get_db)):
+async def admin_clients(
+    request: Request,
+    after: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_async_db)
+):
     current_user = await get_current_user_async(request, db)
     check_admin(current_user)
     
-    cookies = dict(request.cookies)
-    
-    async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-        response = await client.get(f"{BASE_URL}/clients/")
-        clients = response.json() if response.status_code == 200 else []
+    async with frontend_gateway(request, db, current_user) as api:
+        clients_page = await fetch_or_default(
+            api.get_clients(after=parse_page_after(after), with_total=True), empty_page()
+        )
     
     return templates.TemplateResponse(
         "admin/clients/list.html",
         {
             "request": request,
             "current_user": current_user,
-            "clients": clients
+            "clients": clients_page["items"],
+            "pagination": pagination_context(request, clients_page)
         }
     )
 
@@ -212,19 +145,16 @@ async def admin_clients(request: Request, db: Session = Depends(get_db)):
 async def admin_client_detail(
     request: Request,
     client_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     current_user = await get_current_user_async(request, db)
     check_admin(current_user)
     
-    cookies = dict(request.cookies)
-    
-    async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-        response = await client.get(f"{BASE_URL}/clients/{client_id}")
-        if response.status_code != 200:
+    async with frontend_gateway(request, db, current_user) as api:
+        try:
+            client_data = await api.get_client(client_id)
+        except GatewayError:
             return RedirectResponse(url="/admin/clients", status_code=302)
-        
-        client_data = response.json()
     
     return templates.TemplateResponse(
         "admin/clients/detail.html",
@@ -240,19 +170,16 @@ async def admin_client_detail(
 async def admin_client_edit_page(
     request: Request,
     client_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     current_user = await get_current_user_async(request, db)
     check_admin(current_user)
     
-    cookies = dict(request.cookies)
-    
-    async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-        response = await client.get(f"{BASE_URL}/clients/{client_id}")
-        if response.status_code != 200:
+    async with frontend_gateway(request, db, current_user) as api:
+        try:
+            client_data = await api.get_client(client_id)
+        except GatewayError:
             return RedirectResponse(url="/admin/clients", status_code=302)
-        
-        client_data = response.json()
     
     return templates.TemplateResponse(
         "admin/clients/edit.html",
@@ -275,13 +202,11 @@ async def admin_client_edit_submit(
     email: str = Form(...),
     driver_license: str = Form(...),
     license_expiry_date: str = Form(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     current_user = await get_current_user_async(request, db)
     check_admin(current_user)
     
-    cookies = dict(request.cookies)
-    
     client_data = {
         "id": client_id,
         "name": name,
@@ -294,18 +219,16 @@ async def admin_client_edit_submit(
         "user_id": client_id  # Нужно получить из существующего клиента
     }
     
-    async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-        get_resp = await client.get(f"{BASE_URL}/clients/{client_id}")
-        if get_resp.status_code == 200:
-            existing = get_resp.json()
+    async with frontend_gateway(request, db, current_user) as api:
+        existing = await fetch_or_default(api.get_client(client_id), None)
+        if existing:
             client_data["user_id"] = existing.get("user_id")
         
-        response = await client.put(f"{BASE_URL}/clients/{client_id}", json=client_data)
-        
-        if response.status_code == 200:
+        try:
+            await api.update_client(client_id, client_data)
             return RedirectResponse(url=f"/admin/clients/{client_id}", status_code=302)
-        else:
-            error = response.json().get("detail", "Ошибка при обновлении")
+        except GatewayError as exc:
+            error = exc.detail or "Ошибка при обновлении"
             return templates.TemplateResponse(
                 "admin/clients/edit.html",
                 {
@@ -317,19 +240,50 @@ async def admin_client_edit_submit(
             )
 
 
+@router.get("/admin/lookup/cars")
+async def admin_lookup_cars(
+    request: Request,
+    q: str = Query("", max_length=100),
+    db: AsyncSession = Depends(get_async_db)
+):
+    current_user = await get_current_user_async(request, db)
+    check_admin(current_user)
+    if not q.strip():
+        return JSONResponse([])
+
+    async with frontend_gateway(request, db, current_user) as api:
+        cars = await fetch_or_default(api.search_cars(q, {}, limit=LOOKUP_LIMIT), [])
+    return JSONResponse([{"id": car["id"], "label": _car_label(car)} for car in cars])
+
+
+@router.get("/admin/lookup/clients")
+async def admin_lookup_clients(
+    request: Request,
+    q: str = Query("", max_length=100),
+    db: AsyncSession = Depends(get_async_db)
+):
+    current_user = await get_current_user_async(request, db)
+    check_admin(current_user)
+    if not q.strip():
+        return JSONResponse([])
+
+    async with frontend_gateway(request, db, current_user) as api:
+        clients = await fetch_or_default(api.search_clients(q, limit=LOOKUP_LIMIT), [])
+    return JSONResponse([{"id": client["id"], "label": _client_label(client)} for client in clients])
+
+
 @router.get("/admin/rentals", response_class=HTMLResponse)
 async def admin_rentals(
     request: Request,
     car_id: Optional[str] = Query(None),
     client_id: Optional[str] = Query(None),
-    db: Session = Depends(get_db)
+    after: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_async_db)
 ):
     current_user = await get_current_user_async(request, db)
     check_admin(current_user)
     
-    cookies = dict(request.cookies)
     filters = {}
-    params = {}
 
     def parse_int_or_none(value: Optional[str]) -> Optional[int]:
         if value is None or value == "":
@@ -344,62 +298,61 @@ async def admin_rentals(
     
     if car_id_int:
         filters["car_id"] = car_id_int
-        params["car_id"] = car_id_int
     if client_id_int:
         filters["client_id"] = client_id_int
-        params["client_id"] = client_id_int
     
-    async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-        if params:
-            response = await client.get(f"{BASE_URL}/rentals/", params=params)
-        else:
-            response = await client.get(f"{BASE_URL}/rentals/")
-        rentals = response.json() if response.status_code == 200 else []
-
-        status_resp = await client.get(f"{BASE_URL}/rental_statuses/")
-        statuses = {s["id"]: s for s in status_resp.json()} if status_resp.status_code == 200 else {}
-        
-        cars_resp = await client.get(f"{BASE_URL}/cars/")
-        cars = {c["id"]: c for c in cars_resp.json()} if cars_resp.status_code == 200 else {}
-        
-        clients_resp = await client.get(f"{BASE_URL}/clients/")
-        clients = {c["id"]: c for c in clients_resp.json()} if clients_resp.status_code == 200 else {}
-        
-        for rental in rentals:
-            rental["status"] = statuses.get(rental.get("rental_status_id"), {})
-            rental["car"] = cars.get(rental.get("car_id"), {})
-            rental["client"] = clients.get(rental.get("client_id"), {})
+    page = PageLoad("admin_rentals")
+    async with frontend_gateway(request, db, current_user) as api:
+        rentals_page, statuses = await page.gather(
+            rentals=(api.get_rentals(**filters, after=parse_page_after(after), with_total=True), empty_page()),
+            rental_statuses=(api.get_rental_statuses(), []),
+        )
+        rentals = rentals_page["items"]
+        cars, clients = await _load_rental_parties(
+            api, page,
+            [rental.get("car_id") for rental in rentals] + [filters.get("car_id")],
+            [rental.get("client_id") for rental in rentals] + [filters.get("client_id")],
+        )
+
+    statuses = {s["id"]: s for s in statuses}
+
+    for rental in rentals:
+        rental["status"] = statuses.get(rental.get("rental_status_id"), {})
+        rental["car"] = cars.get(rental.get("car_id"), {})
+        rental["client"] = clients.get(rental.get("client_id"), {})
     
-    return templates.TemplateResponse(
+    return page.finish(templates.TemplateResponse(
         "admin/rentals/list.html",
         {
             "request": request,
             "current_user": current_user,
             "rentals": rentals,
-            "cars": list(cars.values()),
-            "clients": list(clients.values()),
-            "filters": filters
+            # В фильтрах - только выбранные значения, остальные находит поиск
+            "cars": [cars[filters["car_id"]]] if filters.get("car_id") in cars else [],
+            "clients": [clients[filters["client_id"]]] if filters.get("client_id") in clients else [],
+            "filters": filters,
+            "pagination": pagination_context(request, rentals_page)
         }
-    )
+    ))
 
 
 @router.get("/admin/rentals/{rental_id}", response_class=HTMLResponse)
 async def admin_rental_detail(
     request: Request,
     rental_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     current_user = await get_current_user_async(request, db)
     check_admin(current_user)
 
     message = request.query_params.get("message")
-    cookies = dict(request.cookies)
 
-    rental, violations, violation_types = await _get_rental_detail_data(rental_id, cookies, db)
+    page = PageLoad("admin_rental_detail")
+    rental, violations, violation_types = await _get_rental_detail_data(request, rental_id, db, current_user, page)
     if rental is None:
         return RedirectResponse(url="/admin/rentals", status_code=302)
 
-    return templates.TemplateResponse(
+    return page.finish(templates.TemplateResponse(
         "admin/rentals/detail.html",
         {
             "request": request,
@@ -410,7 +363,7 @@ async def admin_rental_detail(
             "current_time_iso": _current_time_iso(),
             "message": message
         }
-    )
+    ))
 
 
 @router.post("/admin/rentals/{rental_id}/violations", response_class=HTMLResponse)
@@ -422,12 +375,11 @@ async def admin_rental_add_violation(
     fine_amount: str = Form(...),
     violation_date: str = Form(...),
     is_paid: Optional[str] = Form(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     current_user = await get_current_user_async(request, db)
     check_admin(current_user)
 
-    cookies = dict(request.cookies)
     form_data = {
         "violation_type_id": violation_type_id,
         "description": description,
@@ -440,7 +392,9 @@ async def admin_rental_add_violation(
         fine_value = str(Decimal(fine_amount))
     except InvalidOperation:
         error = "Некорректная сумма штрафа"
-        rental, violations, violation_types = await _get_rental_detail_data(rental_id, cookies, db)
+        rental, violations, violation_types = await _get_rental_detail_data(
+            request, rental_id, db, current_user, PageLoad("admin_rental_detail")
+        )
         if rental is None:
             return RedirectResponse(url="/admin/rentals", status_code=302)
         return templates.TemplateResponse(
@@ -470,17 +424,20 @@ async def admin_rental_add_violation(
         "is_paid": bool(is_paid)
     }
 
-    async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-        response = await client.post(f"{BASE_URL}/violations/", json=payload)
-        if response.status_code == 201:
+    async with frontend_gateway(request, db, current_user) as api:
+        try:
+            await api.create_violation(payload)
             success_message = quote_plus("Нарушение добавлено")
             return RedirectResponse(
                 url=f"/admin/rentals/{rental_id}?message={success_message}",
                 status_code=303
             )
-        error_detail = response.json().get("detail", "Не удалось сохранить нарушение")
+        except GatewayError as exc:
+            error_detail = exc.detail or "Не удалось сохранить нарушение"
 
-    rental, violations, violation_types = await _get_rental_detail_data(rental_id, cookies, db)
+    rental, violations, violation_types = await _get_rental_detail_data(
+        request, rental_id, db, current_user, PageLoad("admin_rental_detail")
+    )
     if rental is None:
         return RedirectResponse(url="/admin/rentals", status_code=302)
 
@@ -504,25 +461,25 @@ async def admin_rental_violation_edit_page(
     request: Request,
     rental_id: int,
     violation_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     current_user = await get_current_user_async(request, db)
     check_admin(current_user)
 
-    cookies = dict(request.cookies)
-
-    async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-        violation_resp = await client.get(f"{BASE_URL}/violations/{violation_id}")
-        if violation_resp.status_code != 200:
-            return RedirectResponse(url=f"/admin/rentals/{rental_id}", status_code=302)
-
-        violation = violation_resp.json()
-        if violation.get("rental_id") != rental_id:
+    page = PageLoad("admin_violation_edit")
+    async with frontend_gateway(request, db, current_user) as api:
+        try:
+            violation, violation_types = await page.gather(
+                violation=api.get_violation(violation_id),
+                violation_types=(api.get_violation_types(), []),
+            )
+        except GatewayError:
             return RedirectResponse(url=f"/admin/rentals/{rental_id}", status_code=302)
 
-        violation_types = await _fetch_violation_types(client)
+    if violation.get("rental_id") != rental_id:
+        return RedirectResponse(url=f"/admin/rentals/{rental_id}", status_code=302)
 
-    return templates.TemplateResponse(
+    return page.finish(templates.TemplateResponse(
         "admin/violations/edit.html",
         {
             "request": request,
@@ -531,7 +488,7 @@ async def admin_rental_violation_edit_page(
             "violation_types": violation_types,
             "violation_date_value": _format_datetime_local(violation.get("violation_date"))
         }
-    )
+    ))
 
 
 @router.post("/admin/rentals/{rental_id}/violations/{violation_id}/edit", response_class=HTMLResponse)
@@ -544,12 +501,11 @@ async def admin_rental_violation_edit_submit(
     fine_amount: str = Form(...),
     violation_date: str = Form(...),
     is_paid: Optional[str] = Form(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     current_user = await get_current_user_async(request, db)
     check_admin(current_user)
 
-    cookies = dict(request.cookies)
     violation = {
         "id": violation_id,
         "rental_id": rental_id,
@@ -563,8 +519,8 @@ async def admin_rental_violation_edit_submit(
     try:
         fine_value = str(Decimal(fine_amount))
     except InvalidOperation:
-        async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-            violation_types = await _fetch_violation_types(client)
+        async with frontend_gateway(request, db, current_user) as api:
+            violation_types = await fetch_or_default(api.get_violation_types(), [])
         return templates.TemplateResponse(
             "admin/violations/edit.html",
             {
@@ -591,17 +547,18 @@ async def admin_rental_violation_edit_submit(
         "is_paid": bool(is_paid)
     }
 
-    async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-        response = await client.put(f"{BASE_URL}/violations/{violation_id}", json=payload)
-        if response.status_code == 200:
+    async with frontend_gateway(request, db, current_user) as api:
+        try:
+            await api.update_violation(violation_id, payload)
             success_message = quote_plus("Нарушение обновлено")
             return RedirectResponse(
                 url=f"/admin/rentals/{rental_id}?message={success_message}",
                 status_code=303
             )
+        except GatewayError as exc:
+            error_detail = exc.detail or "Не удалось обновить нарушение"
 
-        violation_types = await _fetch_violation_types(client)
-        error_detail = response.json().get("detail", "Не удалось обновить нарушение")
+        violation_types = await fetch_or_default(api.get_violation_types(), [])
 
     return templates.TemplateResponse(
         "admin/violations/edit.html",
@@ -621,24 +578,25 @@ async def admin_rental_violation_delete(
     request: Request,
     rental_id: int,
     violation_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     current_user = await get_current_user_async(request, db)
     check_admin(current_user)
 
-    cookies = dict(request.cookies)
-
-    async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-        response = await client.delete(f"{BASE_URL}/violations/{violation_id}")
-        if response.status_code in (200, 204):
+    async with frontend_gateway(request, db, current_user) as api:
+        try:
+            await api.delete_violation(violation_id)
             success_message = quote_plus("Нарушение удалено")
             return RedirectResponse(
                 url=f"/admin/rentals/{rental_id}?message={success_message}",
                 status_code=303
             )
-        error_detail = response.json().get("detail", "Не удалось удалить нарушение")
+        except GatewayError as exc:
+            error_detail = exc.detail or "Не удалось удалить нарушение"
 
-    rental, violations, violation_types = await _get_rental_detail_data(rental_id, cookies, db)
+    rental, violations, violation_types = await _get_rental_detail_data(
+        request, rental_id, db, current_user, PageLoad("admin_rental_detail")
+    )
     if rental is None:
         return RedirectResponse(url="/admin/rentals", status_code=302)
 
@@ -660,40 +618,33 @@ async def admin_rental_violation_delete(
 async def admin_rental_edit_page(
     request: Request,
     rental_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     current_user = await get_current_user_async(request, db)
     check_admin(current_user)
     
-    cookies = dict(request.cookies)
-    
-    async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-        response = await client.get(f"{BASE_URL}/rentals/{rental_id}")
-        if response.status_code != 200:
+    page = PageLoad("admin_rental_edit")
+    async with frontend_gateway(request, db, current_user) as api:
+        try:
+            rental, statuses = await page.gather(
+                rental=api.get_rental(rental_id),
+                rental_statuses=(api.get_rental_statuses(), []),
+            )
+        except GatewayError:
             return RedirectResponse(url="/admin/rentals", status_code=302)
-        
-        rental = response.json()
-
-        status_resp = await client.get(f"{BASE_URL}/rental_statuses/")
-        statuses = status_resp.json() if status_resp.status_code == 200 else []
-        
-        cars_resp = await client.get(f"{BASE_URL}/cars/")
-        cars = cars_resp.json() if cars_resp.status_code == 200 else []
-        
-        clients_resp = await client.get(f"{BASE_URL}/clients/")
-        clients = clients_resp.json() if clients_resp.status_code == 200 else []
+        cars, clients = await _load_rental_parties(api, page, [rental.get("car_id")], [rental.get("client_id")])
     
-    return templates.TemplateResponse(
+    return page.finish(templates.TemplateResponse(
         "admin/rentals/edit.html",
         {
             "request": request,
             "current_user": current_user,
             "rental": rental,
             "statuses": statuses,
-            "cars": cars,
-            "clients": clients
+            "cars": list(cars.values()),
+            "clients": list(clients.values())
         }
-    )
+    ))
 
 
 @router.post("/admin/rentals/{rental_id}/edit", response_class=HTMLResponse)
@@ -706,13 +657,11 @@ async def admin_rental_edit_submit(
     end_date: str = Form(...),
     total_amount: str = Form(...),
     rental_status_id: int = Form(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     current_user = await get_current_user_async(request, db)
     check_admin(current_user)
     
-    cookies = dict(request.cookies)
-    
     rental_data = {
         "id": rental_id,
         "client_id": client_id,
@@ -723,19 +672,15 @@ async def admin_rental_edit_submit(
         "rental_status_id": rental_status_id
     }
     
-    async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-        response = await client.put(f"{BASE_URL}/rentals/{rental_id}", json=rental_data)
-        
-        if response.status_code == 200:
+    async with frontend_gateway(request, db, current_user) as api:
+        try:
+            await api.update_rental(rental_id, rental_data)
             return RedirectResponse(url=f"/admin/rentals/{rental_id}", status_code=302)
-        else:
-            error = response.json().get("detail", "Ошибка при обновлении")
-            status_resp = await client.get(f"{BASE_URL}/rental_statuses/")
-            statuses = status_resp.json() if status_resp.status_code == 200 else []
-            cars_resp = await client.get(f"{BASE_URL}/cars/")
-            cars = cars_resp.json() if cars_resp.status_code == 200 else []
-            clients_resp = await client.get(f"{BASE_URL}/clients/")
-            clients = clients_resp.json() if clients_resp.status_code == 200 else []
+        except GatewayError as exc:
+            error = exc.detail or "Ошибка при обновлении"
+            page = PageLoad("admin_rental_edit")
+            statuses, = await page.gather(rental_statuses=(api.get_rental_statuses(), []))
+            cars, clients = await _load_rental_parties(api, page, [car_id], [client_id])
             
             return templates.TemplateResponse(
                 "admin/rentals/edit.html",
@@ -744,8 +689,8 @@ async def admin_rental_edit_submit(
                     "current_user": current_user,
                     "rental": rental_data,
                     "statuses": statuses,
-                    "cars": cars,
-                    "clients": clients,
+                    "cars": list(cars.values()),
+                    "clients": list(clients.values()),
                     "error": error
                 }
             )
@@ -755,15 +700,13 @@ async def admin_rental_edit_submit(
 async def admin_rental_delete(
     request: Request,
     rental_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     current_user = await get_current_user_async(request, db)
     check_admin(current_user)
     
-    cookies = dict(request.cookies)
-    
-    async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-        await client.delete(f"{BASE_URL}/rentals/{rental_id}")
+    async with frontend_gateway(request, db, current_user) as api:
+        await fetch_or_default(api.delete_rental(rental_id), None)
     
     return RedirectResponse(url="/admin/rentals", status_code=302)
 
@@ -771,16 +714,15 @@ async def admin_rental_delete(
 @router.get("/admin/violation-types", response_class=HTMLResponse)
 async def admin_violation_types(
     request: Request,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     current_user = await get_current_user_async(request, db)
     check_admin(current_user)
 
     message = request.query_params.get("message")
-    cookies = dict(request.cookies)
 
-    async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-        violation_types = await _fetch_violation_types(client)
+    async with frontend_gateway(request, db, current_user) as api:
+        violation_types = await fetch_or_default(api.get_violation_types(), [])
 
     return templates.TemplateResponse(
         "admin/violation_types/list.html",
@@ -799,12 +741,11 @@ async def admin_violation_type_create(
     type_name: str = Form(...),
     default_fine: str = Form(...),
     description: str = Form(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     current_user = await get_current_user_async(request, db)
     check_admin(current_user)
 
-    cookies = dict(request.cookies)
     form_data = {
         "type_name": type_name,
         "default_fine": default_fine,
@@ -814,8 +755,8 @@ async def admin_violation_type_create(
     try:
         fine_value = str(Decimal(default_fine))
     except InvalidOperation:
-        async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-            violation_types = await _fetch_violation_types(client)
+        async with frontend_gateway(request, db, current_user) as api:
+            violation_types = await fetch_or_default(api.get_violation_types(), [])
         return templates.TemplateResponse(
             "admin/violation_types/list.html",
             {
@@ -833,14 +774,15 @@ async def admin_violation_type_create(
         "description": description
     }
 
-    async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-        response = await client.post(f"{BASE_URL}/violation_types/", json=payload)
-        if response.status_code == 201:
+    async with frontend_gateway(request, db, current_user) as api:
+        try:
+            await api.create_violation_type(payload)
             success_message = quote_plus("Тип нарушения добавлен")
             return RedirectResponse(url=f"/admin/violation-types?message={success_message}", status_code=303)
+        except GatewayError as exc:
+            error_detail = exc.detail or "Не удалось создать тип нарушения"
 
-        violation_types = await _fetch_violation_types(client)
-        error_detail = response.json().get("detail", "Не удалось создать тип нарушения")
+        violation_types = await fetch_or_default(api.get_violation_types(), [])
 
     return templates.TemplateResponse(
         "admin/violation_types/list.html",
@@ -858,18 +800,16 @@ async def admin_violation_type_create(
 async def admin_violation_type_edit_page(
     request: Request,
     violation_type_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     current_user = await get_current_user_async(request, db)
     check_admin(current_user)
 
-    cookies = dict(request.cookies)
-
-    async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-        response = await client.get(f"{BASE_URL}/violation_types/{violation_type_id}")
-        if response.status_code != 200:
+    async with frontend_gateway(request, db, current_user) as api:
+        try:
+            violation_type = await api.get_violation_type(violation_type_id)
+        except GatewayError:
             return RedirectResponse(url="/admin/violation-types", status_code=302)
-        violation_type = response.json()
 
     return templates.TemplateResponse(
         "admin/violation_types/edit.html",
@@ -888,12 +828,11 @@ async def admin_violation_type_edit_submit(
     type_name: str = Form(...),
     default_fine: str = Form(...),
     description: str = Form(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     current_user = await get_current_user_async(request, db)
     check_admin(current_user)
 
-    cookies = dict(request.cookies)
     violation_type = {
         "id": violation_type_id,
         "type_name": type_name,
@@ -921,16 +860,16 @@ async def admin_violation_type_edit_submit(
         "description": description
     }
 
-    async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-        response = await client.put(f"{BASE_URL}/violation_types/{violation_type_id}", json=payload)
-        if response.status_code == 200:
+    async with frontend_gateway(request, db, current_user) as api:
+        try:
+            await api.update_violation_type(violation_type_id, payload)
             success_message = quote_plus("Тип нарушения обновлен")
             return RedirectResponse(
                 url=f"/admin/violation-types?message={success_message}",
                 status_code=303
             )
-
-        error_detail = response.json().get("detail", "Не удалось обновить тип нарушения")
+        except GatewayError as exc:
+            error_detail = exc.detail or "Не удалось обновить тип нарушения"
 
     return templates.TemplateResponse(
         "admin/violation_types/edit.html",
@@ -947,24 +886,23 @@ async def admin_violation_type_edit_submit(
 async def admin_violation_type_delete(
     request: Request,
     violation_type_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     current_user = await get_current_user_async(request, db)
     check_admin(current_user)
 
-    cookies = dict(request.cookies)
-
-    async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-        response = await client.delete(f"{BASE_URL}/violation_types/{violation_type_id}")
-        if response.status_code in (200, 204):
+    async with frontend_gateway(request, db, current_user) as api:
+        try:
+            await api.delete_violation_type(violation_type_id)
             success_message = quote_plus("Тип нарушения удален")
             return RedirectResponse(
                 url=f"/admin/violation-types?message={success_message}",
                 status_code=303
             )
+        except GatewayError as exc:
+            error_detail = exc.detail or "Не удалось удалить тип нарушения"
 
-        violation_types = await _fetch_violation_types(client)
-        error_detail = response.json().get("detail", "Не удалось удалить тип нарушения")
+        violation_types = await fetch_or_default(api.get_violation_types(), [])
 
     return templates.TemplateResponse(
         "admin/violation_types/list.html",
@@ -982,13 +920,13 @@ async def admin_statistics(
     request: Request,
     start_date: Optional[str] = Query(None),
     end_date: Optional[str] = Query(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     current_user = await get_current_user_async(request, db)
     check_admin(current_user)
     
-    cookies = dict(request.cookies)
     stats = None
+    analytics = None
     
     if start_date and end_date:
         try:
@@ -1005,13 +943,9 @@ async def admin_statistics(
             start_date_iso = start_date
             end_date_iso = end_date
         
-        async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-            response = await client.get(
-                f"{BASE_URL}/admin/rental-statistic",
-                params={"start_date": start_date_iso, "end_date": end_date_iso}
-            )
-            if response.status_code == 200:
-                stats = response.json()
+        async with frontend_gateway(request, db, current_user) as api:
+            stats = await fetch_or_default(api.get_rental_statistic(start_date_iso, end_date_iso), None)
+            analytics = await fetch_or_default(api.get_rental_analytics(start_date_iso, end_date_iso), None)
     
     return templates.TemplateResponse(
         "admin/statistics.html",
@@ -1019,6 +953,7 @@ async def admin_statistics(
             "request": request,
             "current_user": current_user,
             "stats": stats,
+            "analytics": analytics,
             "start_date": start_date,
             "end_date": end_date
         }
@@ -1,21 +1,22 @@
 from fastapi import APIRouter, Depends, Request, Query
-from fastapi.responses import HTMLResponse, RedirectResponse
-from sqlalchemy.orm import Session
+from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import date, datetime, time, timedelta
 from typing import Optional
 
+from application.frontend.fanout import PageLoad
+from application.frontend.gateway import frontend_gateway, GatewayError, empty_page
 from application.frontend.templates import templates
-from application.frontend.utils import get_current_user_async
-from infrastructure.database.database_session import get_db
-import httpx
+from application.frontend.utils import get_current_user_async, parse_page_after, pagination_context
+from infrastructure.database.database_session import get_async_db
 
 router = APIRouter(tags=["Frontend Cars"], include_in_schema=False)
 
-BASE_URL = "http://localhost:8000"
-
 
 @router.get("/catalog", response_class=HTMLResponse)
 async def cars_list(
     request: Request,
+    q: Optional[str] = Query(None),
     brand: Optional[str] = Query(None),
     model: Optional[str] = Query(None),
     category_id: Optional[str] = Query(None),
@@ -24,7 +25,10 @@ async def cars_list(
     max_year: Optional[str] = Query(None),
     min_cost: Optional[str] = Query(None),
     max_cost: Optional[str] = Query(None),
-    db: Session = Depends(get_db)
+    available_from: Optional[str] = Query(None),
+    available_to: Optional[str] = Query(None),
+    after: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_async_db)
 ):
     current_user = await get_current_user_async(request, db)
 
@@ -73,27 +77,40 @@ async def cars_list(
     max_cost_value = parse_float(max_cost)
     if max_cost_value is not None:
         filters["max_cost"] = max_cost_value
-    
-    cookies = dict(request.cookies)
 
-    async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-        if filters:
-            response = await client.get(f"{BASE_URL}/cars/filter", params=filters)
-        else:
-            response = await client.get(f"{BASE_URL}/cars/")
-        
-        if response.status_code == 200:
-            cars = response.json()
-        else:
-            cars = []
+    def parse_date(value: Optional[str]) -> Optional[date]:
+        if not value:
+            return None
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            return None
 
-        categories_resp = await client.get(f"{BASE_URL}/car_categories/")
-        categories = categories_resp.json() if categories_resp.status_code == 200 else []
-        
-        colors_resp = await client.get(f"{BASE_URL}/car_colors/")
-        colors = colors_resp.json() if colors_resp.status_code == 200 else []
+    # Даты в форме - дни включительно, в запросе - период [начало первого дня, начало дня после последнего)
+    available_from_value = parse_date(available_from)
+    available_to_value = parse_date(available_to)
+    if available_from_value and available_to_value and available_from_value <= available_to_value:
+        filters["available_from"] = datetime.combine(available_from_value, time.min).isoformat()
+        filters["available_to"] = datetime.combine(available_to_value + timedelta(days=1), time.min).isoformat()
+    
+    page = PageLoad("catalog")
+    async with frontend_gateway(request, db, current_user) as api:
+        after_value = parse_page_after(after)
+        if q and q.strip():
+            # Поиск ранжирует по похожести, поэтому выдается одной страницей
+            cars_call = _as_page(api.search_cars(q, filters))
+        elif filters:
+            cars_call = api.filter_cars(filters, after=after_value)
+        else:
+            cars_call = api.get_cars(after=after_value)
+        cars_page, categories, colors = await page.gather(
+            cars=(cars_call, empty_page()),
+            car_categories=(api.get_car_categories(), []),
+            car_colors=(api.get_car_colors(), []),
+        )
     
     form_state = {
+        "q": q or "",
         "brand": brand or "",
         "model": model or "",
         "category_id": category_id_value,
@@ -102,58 +119,80 @@ async def cars_list(
         "max_year": max_year if max_year not in (None, "") else "",
         "min_cost": min_cost if min_cost not in (None, "") else "",
         "max_cost": max_cost if max_cost not in (None, "") else "",
+        "available_from": available_from_value.isoformat() if available_from_value else "",
+        "available_to": available_to_value.isoformat() if available_to_value else "",
     }
 
-    return templates.TemplateResponse(
+    return page.finish(templates.TemplateResponse(
         "cars/list.html",
         {
             "request": request,
             "current_user": current_user,
-            "cars": cars,
+            "cars": cars_page["items"],
             "categories": categories,
             "colors": colors,
             "filters": filters,
             "form_state": form_state,
+            "pagination": pagination_context(request, cars_page),
         }
-    )
+    ))
+
+
+async def _as_page(search_call):
+    return {**empty_page(), "items": await search_call}
+
+
+@router.get("/catalog/autocomplete")
+async def cars_autocomplete(
+    request: Request,
+    q: str = Query("", max_length=100),
+    db: AsyncSession = Depends(get_async_db)
+):
+    if not q.strip():
+        return JSONResponse([])
+
+    current_user = await get_current_user_async(request, db)
+    async with frontend_gateway(request, db, current_user) as api:
+        try:
+            suggestions = await api.autocomplete_cars(q)
+        except GatewayError:
+            suggestions = []
+    return JSONResponse(suggestions)
 
 
 @router.get("/catalog/{car_id}", response_class=HTMLResponse)
 async def car_detail(
     request: Request,
     car_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     current_user = await get_current_user_async(request, db)
-    cookies = dict(request.cookies)
-    
-    async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-        response = await client.get(f"{BASE_URL}/cars/{car_id}")
-        
-        if response.status_code != 200:
+    page = PageLoad("catalog_car_detail")
+    async with frontend_gateway(request, db, current_user) as api:
+        try:
+            car, categories, colors, statuses = await page.gather(
+                car=api.get_car(car_id),
+                car_categories=(api.get_car_categories(), []),
+                car_colors=(api.get_car_colors(), []),
+                car_statuses=(api.get_car_statuses(), []),
+            )
+        except GatewayError:
             return RedirectResponse(url="/catalog", status_code=302)
-        
-        car = response.json()
-
-        category_resp = await client.get(f"{BASE_URL}/car_categories/")
-        categories = {c["id"]: c for c in category_resp.json()} if category_resp.status_code == 200 else {}
-        
-        color_resp = await client.get(f"{BASE_URL}/car_colors/")
-        colors = {c["id"]: c for c in color_resp.json()} if color_resp.status_code == 200 else {}
-        
-        status_resp = await client.get(f"{BASE_URL}/car_statuses/")
-        statuses = {s["id"]: s for s in status_resp.json()} if status_resp.status_code == 200 else {}
-        
-        car["category"] = categories.get(car.get("category_id"), {})
-        car["color"] = colors.get(car.get("color_id"), {})
-        car["status"] = statuses.get(car.get("car_status_id"), {})
+
+    categories = {c["id"]: c for c in categories}
+    colors = {c["id"]: c for c in colors}
+    statuses = {s["id"]: s for s in statuses}
+
+    car["category"] = categories.get(car.get("category_id"), {})
+    car["color"] = colors.get(car.get("color_id"), {})
+    car["status"] = statuses.get(car.get("car_status_id"), {})
     
-    return templates.TemplateResponse(
+    return page.finish(templates.TemplateResponse(
         "cars/detail.html",
         {
             "request": request,
             "current_user": current_user,
             "car": car
         }
-    )
+    ))
 
@@ -1,35 +1,18 @@
 from fastapi import APIRouter, Depends, Request, Form, HTTPException, status
 from fastapi.responses import HTMLResponse, RedirectResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 from datetime import datetime, date
 from decimal import Decimal
 
+from application.frontend.gateway import frontend_gateway, GatewayError
 from application.frontend.templates import templates
 from application.frontend.utils import get_current_user_async
-from infrastructure.database.database_session import get_db
+from infrastructure.database.database_session import get_async_db
 from infrastructure.database.models import UserEntity
 
-# Импорты для API вызовов
-import httpx
-
 router = APIRouter(tags=["Frontend"])
 
-BASE_URL = "http://localhost:8000"
-
-
-async def make_api_request(method: str, url: str, data: dict = None, cookies: dict = None):
-    async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-        if method == "GET":
-            response = await client.get(url, params=data)
-        elif method == "POST":
-            response = await client.post(url, json=data)
-        elif method == "PUT":
-            response = await client.put(url, json=data)
-        elif method == "DELETE":
-            response = await client.delete(url)
-        return response
-
 
 @router.get("/", response_class=HTMLResponse)
 async def index(request: Request):
@@ -37,7 +20,7 @@ async def index(request: Request):
 
 
 @router.get("/login", response_class=HTMLResponse)
-async def login_page(request: Request, db: Session = Depends(get_db)):
+async def login_page(request: Request, db: AsyncSession = Depends(get_async_db)):
     current_user = await get_current_user_async(request, db)
     if current_user:
         if current_user.role.role_name == "admin":
@@ -53,7 +36,7 @@ async def login_submit(
     request: Request,
     username: str = Form(...),
     password: str = Form(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     from fastapi import Response as FastAPIResponse
     from application.auth.schemas import UserLogin
@@ -62,10 +45,10 @@ async def login_submit(
     
     try:
         login_data = UserLogin(username=username, password=password)
-        login_use_case = LoginUserUseCase(db)
-
         temp_response = FastAPIResponse()
-        user_data = login_use_case.login_user(login_data, temp_response)
+        user_data = await db.run_sync(
+            lambda session: LoginUserUseCase(session).login_user(login_data, temp_response)
+        )
 
         redirect_response = RedirectResponse(
             url="/profile" if user_data.role == "user" else "/admin/dashboard",
@@ -111,13 +94,13 @@ async def login_submit(
             refresh_token_value, expires_at = create_refresh_token(payload)
             
             from infrastructure.database.models import RefreshTokenEntity
-            refresh_token_repo = RefreshTokenRepository(db)
             refresh_token_entity = RefreshTokenEntity(
                 user_id=user_data.id,
                 token=refresh_token_value,
                 expires_at=expires_at
             )
-            refresh_token_repo.add(refresh_token_entity)
+            await db.run_sync(lambda session: RefreshTokenRepository(session).add(refresh_token_entity))
+            await db.commit()
             
             redirect_response.set_cookie(
                 key="access_token",
@@ -148,7 +131,7 @@ async def login_submit(
 
 
 @router.get("/register", response_class=HTMLResponse)
-async def register_page(request: Request, db: Session = Depends(get_db)):
+async def register_page(request: Request, db: AsyncSession = Depends(get_async_db)):
     current_user = await get_current_user_async(request, db)
     if current_user:
         return RedirectResponse(url="/profile", status_code=302)
@@ -160,23 +143,18 @@ async def register_page(request: Request, db: Session = Depends(get_db)):
 async def register_submit(
     request: Request,
     username: str = Form(...),
-    password: str = Form(...)
+    password: str = Form(...),
+    db: AsyncSession = Depends(get_async_db)
 ):
     try:
-        async with httpx.AsyncClient(follow_redirects=False) as client:
-            response = await client.post(
-                f"{BASE_URL}/auth/register",
-                json={"username": username, "password": password}
-            )
-            
-            if response.status_code == 201:
-                return RedirectResponse(url="/login", status_code=302)
-            else:
-                error = response.json().get("detail", "Ошибка регистрации")
-                return templates.TemplateResponse(
-                    "register.html",
-                    {"request": request, "current_user": None, "error": error}
-                )
+        async with frontend_gateway(request, db) as api:
+            await api.register(username, password)
+        return RedirectResponse(url="/login", status_code=302)
+    except GatewayError as e:
+        return templates.TemplateResponse(
+            "register.html",
+            {"request": request, "current_user": None, "error": e.detail or "Ошибка регистрации"}
+        )
     except Exception as e:
         return templates.TemplateResponse(
             "register.html",
@@ -185,11 +163,10 @@ async def register_submit(
 
 
 @router.post("/logout", response_class=HTMLResponse)
-async def logout(request: Request):
-    cookies = dict(request.cookies)
+async def logout(request: Request, db: AsyncSession = Depends(get_async_db)):
     try:
-        async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-            await client.post(f"{BASE_URL}/auth/logout")
+        async with frontend_gateway(request, db) as api:
+            await api.logout()
     except:
         pass
     
@@ -200,7 +177,7 @@ async def logout(request: Request):
 
 
 @router.get("/about", response_class=HTMLResponse)
-async def about_page(request: Request, db: Session = Depends(get_db)):
+async def about_page(request: Request, db: AsyncSession = Depends(get_async_db)):
     current_user = await get_current_user_async(request, db)
     return templates.TemplateResponse(
         "about.html",
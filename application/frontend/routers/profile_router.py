@@ -1,20 +1,18 @@
 from fastapi import APIRouter, Depends, Request, Form, HTTPException, status
 from fastapi.responses import HTMLResponse, RedirectResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import date
 
+from application.frontend.gateway import frontend_gateway, GatewayError
 from application.frontend.templates import templates
 from application.frontend.utils import get_current_user_async
-from infrastructure.database.database_session import get_db
-import httpx
+from infrastructure.database.database_session import get_async_db
 
 router = APIRouter(tags=["Frontend Profile"])
 
-BASE_URL = "http://localhost:8000"
-
 
 @router.get("/profile", response_class=HTMLResponse)
-async def profile_page(request: Request, db: Session = Depends(get_db)):
+async def profile_page(request: Request, db: AsyncSession = Depends(get_async_db)):
     current_user = await get_current_user_async(request, db)
     
     if not current_user:
@@ -23,16 +21,12 @@ async def profile_page(request: Request, db: Session = Depends(get_db)):
     if current_user.role.role_name != "user":
         return RedirectResponse(url="/admin/dashboard", status_code=302)
     
-    cookies = dict(request.cookies)
-    
-    async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-        response = await client.get(f"{BASE_URL}/clients/profile")
-        
-        if response.status_code == 200:
-            client_data = response.json()
-        elif response.status_code == 404:
-            return RedirectResponse(url="/profile/fill", status_code=302)
-        else:
+    async with frontend_gateway(request, db, current_user) as api:
+        try:
+            client_data = await api.get_profile()
+        except GatewayError as exc:
+            if exc.status_code == 404:
+                return RedirectResponse(url="/profile/fill", status_code=302)
             client_data = None
     
     return templates.TemplateResponse(
@@ -46,7 +40,7 @@ async def profile_page(request: Request, db: Session = Depends(get_db)):
 
 
 @router.get("/profile/fill", response_class=HTMLResponse)
-async def fill_profile_page(request: Request, db: Session = Depends(get_db)):
+async def fill_profile_page(request: Request, db: AsyncSession = Depends(get_async_db)):
     current_user = await get_current_user_async(request, db)
     
     if not current_user:
@@ -74,15 +68,13 @@ async def fill_profile_submit(
     email: str = Form(...),
     driver_license: str = Form(...),
     license_expiry_date: str = Form(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     current_user = await get_current_user_async(request, db)
     
     if not current_user:
         return RedirectResponse(url="/login", status_code=302)
     
-    cookies = dict(request.cookies)
-    
     client_data = {
         "name": name,
         "surname": surname,
@@ -95,21 +87,18 @@ async def fill_profile_submit(
     }
     
     try:
-        async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-            response = await client.post(f"{BASE_URL}/clients/", json=client_data)
-            
-            if response.status_code == 201:
-                return RedirectResponse(url="/profile", status_code=302)
-            else:
-                error = response.json().get("detail", "Ошибка при сохранении данных")
-                return templates.TemplateResponse(
-                    "profile/fill.html",
-                    {
-                        "request": request,
-                        "current_user": current_user,
-                        "error": error
-                    }
-                )
+        async with frontend_gateway(request, db, current_user) as api:
+            await api.create_client(client_data)
+        return RedirectResponse(url="/profile", status_code=302)
+    except GatewayError as e:
+        return templates.TemplateResponse(
+            "profile/fill.html",
+            {
+                "request": request,
+                "current_user": current_user,
+                "error": e.detail or "Ошибка при сохранении данных"
+            }
+        )
     except Exception as e:
         return templates.TemplateResponse(
             "profile/fill.html",
@@ -1,21 +1,24 @@
 from fastapi import APIRouter, Depends, Request, Form, Query
 from fastapi.responses import HTMLResponse, RedirectResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 from datetime import datetime
 
+from application.frontend.fanout import PageLoad
+from application.frontend.gateway import frontend_gateway, GatewayError, empty_page
 from application.frontend.templates import templates
-from application.frontend.utils import get_current_user_async
-from infrastructure.database.database_session import get_db
-import httpx
+from application.frontend.utils import get_current_user_async, parse_page_after, pagination_context
+from infrastructure.database.database_session import get_async_db
 
 router = APIRouter(tags=["Frontend Rentals"], include_in_schema=False)
 
-BASE_URL = "http://localhost:8000"
-
 
 @router.get("/account/rentals", response_class=HTMLResponse)
-async def my_rentals(request: Request, db: Session = Depends(get_db)):
+async def my_rentals(
+    request: Request,
+    after: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_async_db)
+):
     current_user = await get_current_user_async(request, db)
     
     if not current_user:
@@ -24,108 +27,100 @@ async def my_rentals(request: Request, db: Session = Depends(get_db)):
     if current_user.role.role_name != "user":
         return RedirectResponse(url="/admin/rentals", status_code=302)
     
-    cookies = dict(request.cookies)
-    
-    async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-        response = await client.get(f"{BASE_URL}/rentals/my")
-        
-        if response.status_code == 200:
-            rentals = response.json()
-        else:
-            rentals = []
-        
-        status_resp = await client.get(f"{BASE_URL}/rental_statuses/")
-        statuses = {s["id"]: s for s in status_resp.json()} if status_resp.status_code == 200 else {}
-        
-        cars_resp = await client.get(f"{BASE_URL}/cars/")
-        cars = {c["id"]: c for c in cars_resp.json()} if cars_resp.status_code == 200 else {}
-        
-        for rental in rentals:
-            rental["status"] = statuses.get(rental.get("rental_status_id"), {})
-            rental["car"] = cars.get(rental.get("car_id"), {})
+    page = PageLoad("my_rentals")
+    async with frontend_gateway(request, db, current_user) as api:
+        rentals_page, statuses = await page.gather(
+            rentals=(api.get_my_rentals(after=parse_page_after(after)), empty_page()),
+            rental_statuses=(api.get_rental_statuses(), []),
+        )
+        rentals = rentals_page["items"]
+        # Только машины аренд этой страницы
+        cars, = await page.gather(cars=(api.get_cars_by_ids({rental["car_id"] for rental in rentals}), []))
+
+    statuses = {s["id"]: s for s in statuses}
+    cars = {c["id"]: c for c in cars}
+
+    for rental in rentals:
+        rental["status"] = statuses.get(rental.get("rental_status_id"), {})
+        rental["car"] = cars.get(rental.get("car_id"), {})
     
-    return templates.TemplateResponse(
+    return page.finish(templates.TemplateResponse(
         "rentals/my.html",
         {
             "request": request,
             "current_user": current_user,
-            "rentals": rentals
+            "rentals": rentals,
+            "pagination": pagination_context(request, rentals_page)
         }
-    )
+    ))
 
 
 @router.get("/account/rentals/{rental_id}", response_class=HTMLResponse)
 async def rental_detail(
     request: Request,
     rental_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     current_user = await get_current_user_async(request, db)
     
     if not current_user:
         return RedirectResponse(url="/login", status_code=302)
     
-    cookies = dict(request.cookies)
-    
-    async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-        response = await client.get(f"{BASE_URL}/rentals/{rental_id}")
-        
-        if response.status_code != 200:
+    page = PageLoad("rental_detail")
+    async with frontend_gateway(request, db, current_user) as api:
+        rental, statuses = await page.gather(
+            rental=(api.get_rental(rental_id), None),
+            rental_statuses=(api.get_rental_statuses(), []),
+        )
+
+        if not rental:
             return RedirectResponse(
                 url="/account/rentals" if current_user.role.role_name == "user" else "/admin/rentals",
                 status_code=302
             )
         
-        rental = response.json()
-        
-        status_resp = await client.get(f"{BASE_URL}/rental_statuses/")
-        statuses = {s["id"]: s for s in status_resp.json()} if status_resp.status_code == 200 else {}
-        
-        car_resp = await client.get(f"{BASE_URL}/cars/{rental.get('car_id')}")
-        car = car_resp.json() if car_resp.status_code == 200 else {}
-        
-        rental["status"] = statuses.get(rental.get("rental_status_id"), {})
-        rental["car"] = car
+        car, = await page.gather(car=(api.get_car(rental.get("car_id")), {}))
+    
+    statuses = {s["id"]: s for s in statuses}
+    rental["status"] = statuses.get(rental.get("rental_status_id"), {})
+    rental["car"] = car
     
-    return templates.TemplateResponse(
+    return page.finish(templates.TemplateResponse(
         "rentals/detail.html",
         {
             "request": request,
             "current_user": current_user,
             "rental": rental
         }
-    )
+    ))
 
 
 @router.get("/rentals/create/{car_id}", response_class=HTMLResponse)
 async def create_rental_page(
     request: Request,
     car_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     current_user = await get_current_user_async(request, db)
     
     if not current_user:
         return RedirectResponse(url="/login", status_code=302)
     
-    cookies = dict(request.cookies)
-    
-    async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-        client_resp = await client.get(f"{BASE_URL}/clients/profile")
-        if client_resp.status_code != 200:
-            return RedirectResponse(url="/profile/fill", status_code=302)
-        
-        client_data = client_resp.json()
-        
-        car_resp = await client.get(f"{BASE_URL}/cars/{car_id}")
-        if car_resp.status_code != 200:
-            return RedirectResponse(url="/catalog", status_code=302)
-        
-        car = car_resp.json()
+    page = PageLoad("create_rental")
+    async with frontend_gateway(request, db, current_user) as api:
+        client_data, car = await page.gather(
+            profile=(api.get_profile(), None),
+            car=(api.get_car(car_id), None),
+        )
+
+    if client_data is None:
+        return RedirectResponse(url="/profile/fill", status_code=302)
+    if car is None:
+        return RedirectResponse(url="/catalog", status_code=302)
 
     start_date_value = datetime.now().strftime("%Y-%m-%dT%H:%M")
     
-    return templates.TemplateResponse(
+    return page.finish(templates.TemplateResponse(
         "rentals/create.html",
         {
             "request": request,
@@ -134,7 +129,7 @@ async def create_rental_page(
             "client": client_data,
             "start_date_value": start_date_value
         }
-    )
+    ))
 
 
 @router.post("/rentals/create", response_class=HTMLResponse)
@@ -142,28 +137,24 @@ async def create_rental_submit(
     request: Request,
     car_id: int = Form(...),
     end_date: str = Form(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     current_user = await get_current_user_async(request, db)
     
     if not current_user:
         return RedirectResponse(url="/login", status_code=302)
     
-    cookies = dict(request.cookies)
-    
-    async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-        client_resp = await client.get(f"{BASE_URL}/clients/profile")
-        if client_resp.status_code != 200:
+    async with frontend_gateway(request, db, current_user) as api:
+        try:
+            client_data = await api.get_profile()
+        except GatewayError:
             return RedirectResponse(url="/profile/fill", status_code=302)
         
-        client_data = client_resp.json()
-        
-        car_resp = await client.get(f"{BASE_URL}/cars/{car_id}")
-        if car_resp.status_code != 200:
+        try:
+            car = await api.get_car(car_id)
+        except GatewayError:
             return RedirectResponse(url="/catalog", status_code=302)
         
-        car = car_resp.json()
-        
         start = datetime.now()
         end = datetime.fromisoformat(end_date.replace("T", " "))
 
@@ -195,13 +186,11 @@ async def create_rental_submit(
             "rental_status_id": None
         }
         
-        response = await client.post(f"{BASE_URL}/rentals/", json=rental_data)
-        
-        if response.status_code == 201:
-            rental = response.json()
+        try:
+            rental = await api.create_rental(rental_data)
             return RedirectResponse(url=f"/account/rentals/{rental['id']}", status_code=302)
-        else:
-            error = response.json().get("detail", "Ошибка при создании аренды")
+        except GatewayError as exc:
+            error = exc.detail or "Ошибка при создании аренды"
             start_date_value = start.strftime("%Y-%m-%dT%H:%M")
             return templates.TemplateResponse(
                 "rentals/create.html",
@@ -1,104 +1,105 @@
-from fastapi import APIRouter, Depends, Request
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Request, Query
 from fastapi.responses import HTMLResponse, RedirectResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from application.frontend.fanout import PageLoad
+from application.frontend.gateway import frontend_gateway, fetch_or_default, GatewayError, empty_page
 from application.frontend.templates import templates
-from application.frontend.utils import get_current_user_async
-from infrastructure.database.database_session import get_db
-import httpx
+from application.frontend.utils import get_current_user_async, parse_page_after, pagination_context
+from infrastructure.database.database_session import get_async_db
 
 router = APIRouter(tags=["Frontend Violations"], include_in_schema=False)
 
-BASE_URL = "http://localhost:8000"
-
 
 @router.get("/account/violations", response_class=HTMLResponse)
-async def my_violations(request: Request, db: Session = Depends(get_db)):
+async def my_violations(
+    request: Request,
+    after: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_async_db)
+):
     current_user = await get_current_user_async(request, db)
     
     if not current_user:
         return RedirectResponse(url="/login", status_code=302)
     
-    cookies = dict(request.cookies)
+    page = PageLoad("my_violations")
+    async with frontend_gateway(request, db, current_user) as api:
+        violations_page, types = await page.gather(
+            violations=(api.get_my_violations(after=parse_page_after(after)), empty_page()),
+            violation_types=(api.get_violation_types(), []),
+        )
+        violations = violations_page["items"]
+
+        # Аренды загружаются один раз на каждый rental_id, все одновременно
+        rental_ids = list(dict.fromkeys(v["rental_id"] for v in violations if v.get("rental_id")))
+        rentals = await page.gather(**{
+            f"rental_{rental_id}": (api.get_rental(rental_id), {}) for rental_id in rental_ids
+        })
     
-    async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-        response = await client.get(f"{BASE_URL}/violations/")
-        
-        if response.status_code == 200:
-            violations = response.json()
-        else:
-            violations = []
-        
-        types_resp = await client.get(f"{BASE_URL}/violation_types/")
-        types = {t["id"]: t for t in types_resp.json()} if types_resp.status_code == 200 else {}
-        
-        for violation in violations:
-            violation["type"] = types.get(violation.get("violation_type_id"), {})
-            if violation.get("rental_id"):
-                rental_resp = await client.get(f"{BASE_URL}/rentals/{violation['rental_id']}")
-                violation["rental"] = rental_resp.json() if rental_resp.status_code == 200 else {}
+    types = {t["id"]: t for t in types}
+    rentals = dict(zip(rental_ids, rentals))
+
+    for violation in violations:
+        violation["type"] = types.get(violation.get("violation_type_id"), {})
+        if violation.get("rental_id"):
+            violation["rental"] = rentals.get(violation["rental_id"], {})
     
-    return templates.TemplateResponse(
+    return page.finish(templates.TemplateResponse(
         "violations/my.html",
         {
             "request": request,
             "current_user": current_user,
-            "violations": violations
+            "violations": violations,
+            "pagination": pagination_context(request, violations_page)
         }
-    )
+    ))
 
 
 @router.get("/account/violations/{violation_id}", response_class=HTMLResponse)
 async def violation_detail(
     request: Request,
     violation_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     current_user = await get_current_user_async(request, db)
     
     if not current_user:
         return RedirectResponse(url="/login", status_code=302)
     
-    cookies = dict(request.cookies)
-    
-    async with httpx.AsyncClient(cookies=cookies, follow_redirects=False) as client:
-        response = await client.get(f"{BASE_URL}/violations/{violation_id}")
-        
-        if response.status_code != 200:
+    page = PageLoad("violation_detail")
+    async with frontend_gateway(request, db, current_user) as api:
+        try:
+            violation, types = await page.gather(
+                violation=api.get_violation(violation_id),
+                violation_types=(api.get_violation_types(), []),
+            )
+        except GatewayError:
             return RedirectResponse(url="/account/violations", status_code=302)
         
-        violation = response.json()
-        
-        types_resp = await client.get(f"{BASE_URL}/violation_types/")
-        types = {t["id"]: t for t in types_resp.json()} if types_resp.status_code == 200 else {}
-        
-        violation["type"] = types.get(violation.get("violation_type_id"), {})
-        
         if violation.get("rental_id"):
-            rental_resp = await client.get(f"{BASE_URL}/rentals/{violation['rental_id']}")
-            violation["rental"] = rental_resp.json() if rental_resp.status_code == 200 else {}
+            violation["rental"], = await page.gather(rental=(api.get_rental(violation["rental_id"]), {}))
     
-    return templates.TemplateResponse(
+    types = {t["id"]: t for t in types}
+    violation["type"] = types.get(violation.get("violation_type_id"), {})
+    
+    return page.finish(templates.TemplateResponse(
         "violations/detail.html",
         {
             "request": request,
             "current_user": current_user,
             "violation": violation
         }
-    )
+    ))
 
 
 @router.get("/info/violation-types", response_class=HTMLResponse)
-async def violation_types_list(request: Request, db: Session = Depends(get_db)):
+async def violation_types_list(request: Request, db: AsyncSession = Depends(get_async_db)):
     current_user = await get_current_user_async(request, db)
     
-    async with httpx.AsyncClient(follow_redirects=False) as client:
-        response = await client.get(f"{BASE_URL}/violation_types/")
-        
-        if response.status_code == 200:
-            violation_types = response.json()
-        else:
-            violation_types = []
+    async with frontend_gateway(request, db, current_user) as api:
+        violation_types = await fetch_or_default(api.get_violation_types(), [])
     
     return templates.TemplateResponse(
         "violation_types/list.html",
@@ -1,16 +1,14 @@
+from typing import Optional
+
 from fastapi import Request
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from application.auth.utils.jwt import decode_token
-from infrastructure.database.repository import UserRepository
-from infrastructure.database.database_session import get_db
+from infrastructure.cache import AuthenticatedPrincipal, principal_cache
+from infrastructure.database.repository import AsyncUserRepository
 
 
-async def get_current_user_async(request: Request, db: Session = None):
-    """Асинхронная версия get_current_user для фронтенда"""
-    if db is None:
-        from infrastructure.database.database_session import get_db
-        db = next(get_db())
-    
+async def get_current_user_async(request: Request, db: AsyncSession):
+    """Асинхронная версия get_current_user для фронтенда, использует сессию текущего запроса"""
     token = request.cookies.get("access_token")
     if not token:
         return None
@@ -23,9 +21,35 @@ async def get_current_user_async(request: Request, db: Session = None):
     if not user_id:
         return None
 
-    user = UserRepository(db).get_by_id(user_id)
+    principal = principal_cache.get(int(user_id))
+    if principal:
+        return principal
+
+    user, client_id = await AsyncUserRepository(db).get_with_client_id(int(user_id))
     if not user:
         return None
 
-    return user
+    principal = AuthenticatedPrincipal.from_user(user, client_id)
+    principal_cache.put(principal)
+    return principal
+
+
+def parse_page_after(value: Optional[str]) -> Optional[int]:
+    if value is None or value == "":
+        return None
+    try:
+        after = int(value)
+    except ValueError:
+        return None
+    return after if after >= 0 else None
+
 
+def pagination_context(request: Request, page: dict) -> dict:
+    """Ссылки на следующую и первую страницы списка с сохранением остальных параметров запроса"""
+    next_after = page.get("next_after")
+    return {
+        "next_url": str(request.url.include_query_params(after=next_after)) if next_after is not None else None,
+        "first_url": str(request.url.remove_query_params("after")) if "after" in request.query_params else None,
+        "total": page.get("total"),
+        "total_is_estimate": page.get("total_is_estimate", False),
+    }
\ No newline at end of file
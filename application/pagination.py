@@ -0,0 +1,39 @@
+from typing import Generic, List, Optional, TypeVar
+
+from fastapi import Query
+from pydantic import BaseModel, Field
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_LIMIT = 50
+MAX_PAGE_LIMIT = 500
+
+
+class PageParams(BaseModel):
+    limit: int = Field(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT, description="Размер страницы")
+    after: Optional[int] = Field(None, ge=0, description="id последней записи предыдущей страницы")
+    with_total: bool = Field(False, description="Вернуть общее количество записей")
+
+
+class Page(BaseModel, Generic[T]):
+    items: List[T]
+    next_after: Optional[int] = Field(None, description="Значение after для следующей страницы")
+    total: Optional[int] = None
+    total_is_estimate: bool = False
+
+    @classmethod
+    def from_keyset(cls, page, schema) -> "Page":
+        return cls(
+            items=[schema.model_validate(item) for item in page.items],
+            next_after=page.next_after,
+            total=page.total,
+            total_is_estimate=page.total_is_estimate
+        )
+
+
+def page_params(
+        limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+        after: Optional[int] = Query(None, ge=0),
+        with_total: bool = Query(False)
+) -> PageParams:
+    return PageParams(limit=limit, after=after, with_total=with_total)
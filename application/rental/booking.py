@@ -0,0 +1,39 @@
+from datetime import datetime
+from typing import Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+
+from infrastructure.cache import status_registry
+from infrastructure.database.models import CarEntity
+from infrastructure.database.repository import RentalRepository, CarRepository
+from infrastructure.database.repository.car_repository import CarLockTimeoutError
+
+
+def check_booking_period(start_date: datetime, end_date: datetime):
+    if start_date >= end_date:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Дата окончания должна быть позже даты начала")
+
+
+def lock_bookable_car(
+        db: Session, car_id: int, start_date: datetime, end_date: datetime, exclude_rental_id: Optional[int] = None
+) -> CarEntity:
+    """Блокирует машину до конца транзакции и проверяет, что ее можно забронировать на период.
+
+    Бронирования одной машины выполняются по очереди, поэтому проверка пересечений
+    видит аренды, зафиксированные конкурирующими запросами. exclude_rental_id - изменяемая аренда.
+    """
+    car_repo = CarRepository(db)
+    try:
+        car = car_repo.lock_for_booking(car_id)
+    except CarLockTimeoutError:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Машину сейчас бронирует другой клиент")
+    if car is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Машина не найдена")
+
+    statuses = status_registry.get(db)
+    if car.car_status_id not in (statuses.available_car, statuses.rented_car) or RentalRepository(db).has_overlapping(
+            car.id, start_date, end_date, exclude_rental_id
+    ):
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Машина недоступна для аренды")
+    return car
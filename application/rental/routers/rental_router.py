@@ -1,24 +1,29 @@
-from typing import List, Optional
+from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from application.dependencies import get_current_user
+from application.pagination import Page, PageParams, page_params
+from application.streaming import ExportFormat, EXPORT_MEDIA_TYPES
 from application.client.usecases.get_client_by_user_id_use_case import GetClientByUserIdUseCase
-from application.rental.schemas import RentalRead, RentalCreate, RentalUpdate, RentalFilter
+from application.rental.schemas import RentalRead, RentalCreate, RentalUpdate, RentalFilter, RentalBundleRead
 from application.rental.usecases import CreateRentalUseCase, DeleteRentalUseCase, GetAllUserRentalsUseCase, \
-    UpdateRentalUseCase, GetUserRentalByIdUseCase, GetAllRentalsUseCase, GetRentalByIdUseCase
+    UpdateRentalUseCase, GetUserRentalByIdUseCase, GetAllRentalsUseCase, GetRentalByIdUseCase, GetRentalBundleUseCase, \
+    ExportRentalsUseCase
 from infrastructure.database.database_session import get_db
-from infrastructure.database.models import UserEntity
+from infrastructure.cache import AuthenticatedPrincipal
 
 router = APIRouter(prefix="/rentals", tags=["Rentals"])
 
 
-@router.get("/", response_model=List[RentalRead])
+@router.get("/", response_model=Page[RentalRead])
 def get_all_rentals(
         car_id: Optional[int] = None,
         client_id: Optional[int] = None,
-        current_user: UserEntity = Depends(get_current_user),
+        page: PageParams = Depends(page_params),
+        current_user: AuthenticatedPrincipal = Depends(get_current_user),
         db: Session = Depends(get_db)
 ):
     if current_user.role.role_name != "admin":
@@ -28,21 +33,38 @@ def get_all_rentals(
         car_id=car_id,
         client_id=client_id
     )
-    return GetAllRentalsUseCase(db).execute(filters)
+    return GetAllRentalsUseCase(db).execute(filters, page)
 
 
-@router.get("/my", response_model=List[RentalRead])
+@router.get("/my", response_model=Page[RentalRead])
 def get_all_user_rentals(
-        current_user: UserEntity = Depends(get_current_user),
+        page: PageParams = Depends(page_params),
+        current_user: AuthenticatedPrincipal = Depends(get_current_user),
         db: Session = Depends(get_db)
 ):
-    return GetAllUserRentalsUseCase(db).execute(current_user.id)
+    return GetAllUserRentalsUseCase(db).execute(current_user.id, page)
+
+
+@router.get("/export")
+def export_rentals(
+        format: ExportFormat = ExportFormat.ndjson,
+        current_user: AuthenticatedPrincipal = Depends(get_current_user),
+        db: Session = Depends(get_db)
+):
+    if current_user.role.role_name != "admin":
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Только админ может выгружать аренды")
+
+    return StreamingResponse(
+        ExportRentalsUseCase(db).execute(format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="rentals.{format.value}"'}
+    )
 
 
 @router.get("/{rental_id}", response_model=RentalRead)
 def get_user_rental_by_id(
         rental_id: int,
-        current_user: UserEntity = Depends(get_current_user),
+        current_user: AuthenticatedPrincipal = Depends(get_current_user),
         db: Session = Depends(get_db)
 ):
     if current_user.role.role_name == "admin":
@@ -51,19 +73,33 @@ def get_user_rental_by_id(
         return GetUserRentalByIdUseCase(db).execute(current_user.id, rental_id)
 
 
+@router.get("/{rental_id}/bundle", response_model=RentalBundleRead)
+def get_rental_bundle(
+        rental_id: int,
+        current_user: AuthenticatedPrincipal = Depends(get_current_user),
+        db: Session = Depends(get_db)
+):
+    if current_user.role.role_name != "admin":
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Только админ может просматривать аренду целиком")
+
+    return GetRentalBundleUseCase(db).execute(rental_id)
+
+
 @router.post("/", response_model=RentalRead, status_code=status.HTTP_201_CREATED)
 def add_rental(
     rental_data: RentalCreate,
-    current_user: UserEntity = Depends(get_current_user),
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    try:
-        GetClientByUserIdUseCase(db).execute(current_user.id)
-    except HTTPException as exc:
-        if exc.status_code == status.HTTP_404_NOT_FOUND:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN,
-                                detail="Только авторизованный пользователь может арендовать авто")
-        raise
+    # Профиль могли заполнить через другой воркер: его кэш принципалов об этом не знает
+    if current_user.client_id is None:
+        try:
+            GetClientByUserIdUseCase(db).execute(current_user.id)
+        except HTTPException as exc:
+            if exc.status_code == status.HTTP_404_NOT_FOUND:
+                raise HTTPException(status_code=status.HTTP_403_FORBIDDEN,
+                                    detail="Только авторизованный пользователь может арендовать авто")
+            raise
 
     if current_user.role.role_name != "user":
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Только пользователь с заполненными данными о себе может арендовать авто")
@@ -74,7 +110,7 @@ def add_rental(
 @router.delete("/{rental_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_rental(
     rental_id: int,
-    current_user: UserEntity = Depends(get_current_user),
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     if current_user.role.role_name != "admin":
@@ -87,7 +123,7 @@ def delete_rental(
 @router.put("/{rental_id}", response_model=RentalRead)
 def update_rental(
     rental_data: RentalUpdate,
-    current_user: UserEntity = Depends(get_current_user),
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     if current_user.role.role_name != "admin":
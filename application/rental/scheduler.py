@@ -0,0 +1,99 @@
+import asyncio
+import logging
+import os
+from typing import Optional
+
+from sqlalchemy import select, func
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from application.rental.usecases import CompleteExpiredRentalsUseCase
+from infrastructure.cache import status_registry
+from infrastructure.database import database_session
+from infrastructure.database.status_indexes import sync_status_indexes
+
+logger = logging.getLogger(__name__)
+
+RENTAL_EXPIRATION_ENABLED = os.getenv("RENTAL_EXPIRATION_ENABLED", "true").lower() in ("1", "true", "yes")
+RENTAL_EXPIRATION_INTERVAL = float(os.getenv("RENTAL_EXPIRATION_INTERVAL", 60))
+RENTAL_EXPIRATION_BATCH_SIZE = int(os.getenv("RENTAL_EXPIRATION_BATCH_SIZE", 1000))
+
+# Ключ advisory lock'а Postgres: завершение аренд выполняет только один воркер uvicorn
+RENTAL_EXPIRATION_LOCK_KEY = 7_240_001
+
+
+class RentalExpirationScheduler:
+    """Периодически завершает просроченные аренды и освобождает машины"""
+
+    def __init__(self, interval: float = RENTAL_EXPIRATION_INTERVAL, batch_size: int = RENTAL_EXPIRATION_BATCH_SIZE):
+        self.interval = interval
+        self.batch_size = batch_size
+        self._task: Optional[asyncio.Task] = None
+        # Id активного статуса, под который созданы частичные индексы
+        self._indexed_active_status: Optional[int] = None
+
+    async def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self):
+        while True:
+            try:
+                result = await run_in_threadpool(self.sweep)
+                if result["completed_rentals"]:
+                    logger.info(
+                        "Completed %s expired rentals, released %s cars in %s batches",
+                        result["completed_rentals"], result["released_cars"], result["batches"]
+                    )
+            except Exception:
+                logger.exception("Expired rentals sweep failed")
+            await asyncio.sleep(self.interval)
+
+    def sweep(self) -> dict:
+        # Сессионный advisory lock держится на одном соединении на протяжении всего прохода
+        with database_session.engine.connect() as connection:
+            locked = connection.scalar(select(func.pg_try_advisory_lock(RENTAL_EXPIRATION_LOCK_KEY)))
+            connection.commit()
+            if not locked:
+                return {"completed_rentals": 0, "released_cars": 0, "batches": 0}
+
+            db = database_session.SessionLocal(bind=connection)
+            try:
+                self._sync_status_indexes(db)
+                return CompleteExpiredRentalsUseCase(db, self.batch_size).execute()
+            finally:
+                db.close()
+                connection.rollback()
+                connection.execute(select(func.pg_advisory_unlock(RENTAL_EXPIRATION_LOCK_KEY)))
+                connection.commit()
+
+    def _sync_status_indexes(self, db: Session):
+        """Частичные индексы по активному статусу - под его текущий id (статус могли пересоздать)"""
+        ids = status_registry.get(db)
+        if ids.active_rental == self._indexed_active_status:
+            return
+        # CREATE INDEX CONCURRENTLY ждет завершения открытых транзакций, в том числе этой
+        db.rollback()
+        try:
+            created = sync_status_indexes(database_session.engine, ids)
+        except SQLAlchemyError:
+            # Без частичных индексов завершение аренд работает по (rental_status_id, end_date)
+            logger.exception("Partial status indexes sync failed")
+            return
+        if created:
+            logger.info("Created partial status indexes: %s", ", ".join(created))
+        self._indexed_active_status = ids.active_rental
+
+
+rental_expiration_scheduler = RentalExpirationScheduler()
@@ -3,5 +3,7 @@ from .rental_schema import (
     RentalCreate,
     RentalUpdate,
     RentalRead,
-    RentalFilter
+    RentalFilter,
+    RentalBundleRead,
+    RentalBundleViolationRead
 )
\ No newline at end of file
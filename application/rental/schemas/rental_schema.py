@@ -1,9 +1,15 @@
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import Optional, List
 
 from pydantic import BaseModel, Field, ConfigDict
 
+from application.car.schemas import CarRead
+from application.client.schemas import ClientRead
+from application.rental_status.schemas import RentalStatusRead
+from application.violation.schemas import ViolationRead
+from application.violation_type.schemas import ViolationTypeRead
+
 
 class RentalBase(BaseModel):
     client_id: int
@@ -32,4 +38,16 @@ class RentalRead(RentalBase):
 
 class RentalFilter(BaseModel):
     car_id: Optional[int] = Field(None, description="Машина")
-    client_id: Optional[int] = Field(None, description="Клиент")
\ No newline at end of file
+    client_id: Optional[int] = Field(None, description="Клиент")
+
+
+class RentalBundleViolationRead(ViolationRead):
+    type: Optional[ViolationTypeRead] = Field(None, validation_alias="violation_type")
+
+
+class RentalBundleRead(RentalRead):
+    status: Optional[RentalStatusRead] = Field(None, validation_alias="rental_status")
+    car: Optional[CarRead] = None
+    client: Optional[ClientRead] = None
+    violations: List[RentalBundleViolationRead] = []
+    violation_types: List[ViolationTypeRead] = []
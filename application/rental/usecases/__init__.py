@@ -4,4 +4,7 @@ from .update_rental_use_case import UpdateRentalUseCase
 from .get_all_user_rentals_use_case import GetAllUserRentalsUseCase
 from .get_user_rental_by_id_use_case import GetUserRentalByIdUseCase
 from .get_all_rentals_use_case import GetAllRentalsUseCase
-from .get_rental_by_id_use_case import GetRentalByIdUseCase
\ No newline at end of file
+from .get_rental_by_id_use_case import GetRentalByIdUseCase
+from .get_rental_bundle_use_case import GetRentalBundleUseCase
+from .complete_expired_rentals_use_case import CompleteExpiredRentalsUseCase
+from .export_rentals_use_case import ExportRentalsUseCase
\ No newline at end of file
@@ -1,60 +1,39 @@
-from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
+from application.rental.booking import check_booking_period, lock_bookable_car
 from application.rental.schemas import RentalCreate, RentalRead
-from infrastructure.database.repository import (
-    RentalRepository,
-    CarRepository,
-    CarStatusRepository,
-    RentalStatusRepository,
-)
+from infrastructure.cache import status_registry
+from infrastructure.database.repository import RentalRepository, CarRepository
+from infrastructure.database.unit_of_work import UnitOfWork
 
 
 class CreateRentalUseCase:
-    ACTIVE_RENTAL_STATUS = "Активна"
-    RENTED_CAR_STATUS = "В аренде"
-
     def __init__(self, db: Session):
         self.db = db
+        self.uow = UnitOfWork(db)
         self.rental_repo = RentalRepository(db)
         self.car_repo = CarRepository(db)
-        self.car_status_repo = CarStatusRepository(db)
-        self.rental_status_repo = RentalStatusRepository(db)
 
     def execute(self, rental_data: RentalCreate) -> RentalRead:
-        car = self.car_repo.get_by_id(rental_data.car_id)
-        if car is None:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Машина не найдена")
-
-        current_car_status = getattr(car.car_status, "status", None)
-        if current_car_status and current_car_status.lower() == self.RENTED_CAR_STATUS.lower():
-            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Машина недоступна для аренды")
-
-        rental_status_id = rental_data.rental_status_id
-        if rental_status_id is None:
-            rental_status = self.rental_status_repo.get_by_status(self.ACTIVE_RENTAL_STATUS)
-            if rental_status is None:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Active rental status is not configured"
+        check_booking_period(rental_data.start_date, rental_data.end_date)
+
+        with self.uow:
+            # Бронирование - одна транзакция: строка машины блокируется до коммита аренды и статуса машины
+            car = lock_bookable_car(self.db, rental_data.car_id, rental_data.start_date, rental_data.end_date)
+
+            statuses = status_registry.get(self.db)
+            rental_status_id = rental_data.rental_status_id
+            if rental_status_id is None:
+                rental_status_id = statuses.active_rental
+
+            self.car_repo.update_status(car.id, statuses.rented_car)
+            rental_obj = self.rental_repo.create(
+                client_id=rental_data.client_id,
+                car_id=rental_data.car_id,
+                start_date=rental_data.start_date,
+                end_date=rental_data.end_date,
+                total_amount=rental_data.total_amount,
+                rental_status_id=rental_status_id
                 )
-            rental_status_id = rental_status.id
-
-        rental_obj = self.rental_repo.create(
-            client_id=rental_data.client_id,
-            car_id=rental_data.car_id,
-            start_date=rental_data.start_date,
-            end_date=rental_data.end_date,
-            total_amount=rental_data.total_amount,
-            rental_status_id=rental_status_id
-            )
-
-        rented_status = self.car_status_repo.get_by_status(self.RENTED_CAR_STATUS)
-        if rented_status is None:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Rented car status is not configured"
-            )
-        self.car_repo.update_status(rental_data.car_id, rented_status.id)
-
-        return RentalRead.model_validate(rental_obj)
\ No newline at end of file
+
+            return RentalRead.model_validate(rental_obj)
@@ -1,12 +1,15 @@
 from sqlalchemy.orm import Session
 
 from infrastructure.database.repository import RentalRepository
+from infrastructure.database.unit_of_work import UnitOfWork
 
 
 class DeleteRentalUseCase:
     def __init__(self, db: Session):
         self.db = db
+        self.uow = UnitOfWork(db)
         self.rental_repo = RentalRepository(db)
 
     def execute(self, rental_id: int):
-        return self.rental_repo.delete(rental_id)
\ No newline at end of file
+        with self.uow:
+            return self.rental_repo.delete(rental_id)
\ No newline at end of file
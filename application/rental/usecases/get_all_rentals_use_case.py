@@ -1,10 +1,10 @@
-from typing import List
+from typing import Optional
 
 from sqlalchemy.orm import Session
 
+from application.pagination import Page, PageParams
 from application.rental.schemas import RentalRead, RentalFilter
 from infrastructure.database.repository import RentalRepository
-from application.rental.usecases.complete_expired_rentals_use_case import CompleteExpiredRentalsUseCase
 
 
 class GetAllRentalsUseCase:
@@ -12,11 +12,13 @@ class GetAllRentalsUseCase:
         self.db = db
         self.rental_repo = RentalRepository(db)
 
-    def execute(self, filters: RentalFilter) -> List[RentalRead]:
-        CompleteExpiredRentalsUseCase(self.db).execute()
-        
-        rentals = self.rental_repo.filter(
+    def execute(self, filters: RentalFilter, page: Optional[PageParams] = None) -> Page[RentalRead]:
+        page = page or PageParams()
+        rentals = self.rental_repo.filter_page(
+            limit=page.limit,
+            after=page.after,
+            with_total=page.with_total,
             car_id=filters.car_id,
             client_id=filters.client_id
         )
-        return [RentalRead.model_validate(r) for r in rentals]
\ No newline at end of file
+        return Page[RentalRead].from_keyset(rentals, RentalRead)
\ No newline at end of file
@@ -1,10 +1,10 @@
-from typing import List
+from typing import Optional
 
 from sqlalchemy.orm import Session
 
+from application.pagination import Page, PageParams
 from application.rental.schemas import RentalRead
 from infrastructure.database.repository import RentalRepository
-from application.rental.usecases.complete_expired_rentals_use_case import CompleteExpiredRentalsUseCase
 
 
 class GetAllUserRentalsUseCase:
@@ -12,8 +12,7 @@ class GetAllUserRentalsUseCase:
         self.db = db
         self.rental_repo = RentalRepository(db)
 
-    def execute(self, current_user_id: int) -> List[RentalRead]:
-        CompleteExpiredRentalsUseCase(self.db).execute()
-        
-        rentals = self.rental_repo.get_by_user_id(current_user_id)
-        return [RentalRead.model_validate(r) for r in rentals]
\ No newline at end of file
+    def execute(self, current_user_id: int, page: Optional[PageParams] = None) -> Page[RentalRead]:
+        page = page or PageParams()
+        rentals = self.rental_repo.get_user_page(current_user_id, page.limit, page.after, page.with_total)
+        return Page[RentalRead].from_keyset(rentals, RentalRead)
\ No newline at end of file
@@ -0,0 +1,22 @@
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+
+from application.rental.schemas import RentalBundleRead
+from application.violation_type.usecases import GetAllViolationTypesUseCase
+from infrastructure.database.repository import RentalRepository
+
+
+class GetRentalBundleUseCase:
+    def __init__(self, db: Session):
+        self.db = db
+        self.rental_repo = RentalRepository(db)
+
+    def execute(self, rental_id: int) -> RentalBundleRead:
+        rental = self.rental_repo.get_bundle(rental_id)
+        if rental is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Аренда не найдена")
+
+        bundle = RentalBundleRead.model_validate(rental)
+        # Справочник типов нарушений - из кэша справочников, как и в остальных use case'ах
+        bundle.violation_types = GetAllViolationTypesUseCase(self.db).execute()
+        return bundle
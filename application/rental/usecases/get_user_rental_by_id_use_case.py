@@ -2,7 +2,6 @@ from sqlalchemy.orm import Session
 
 from application.rental.schemas import RentalRead
 from infrastructure.database.repository import RentalRepository
-from application.rental.usecases.complete_expired_rentals_use_case import CompleteExpiredRentalsUseCase
 
 
 class GetUserRentalByIdUseCase:
@@ -11,7 +10,5 @@ class GetUserRentalByIdUseCase:
         self.rental_repo = RentalRepository(db)
 
     def execute(self, current_user_id: int, rental_id: int) -> RentalRead:
-        CompleteExpiredRentalsUseCase(self.db).execute()
-        
         rental = self.rental_repo.get_by_user_and_id(current_user_id, rental_id)
         return RentalRead.model_validate(rental)
\ No newline at end of file
@@ -1,27 +1,46 @@
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
+from application.rental.booking import check_booking_period, lock_bookable_car
 from application.rental.schemas import RentalRead, RentalUpdate
+from infrastructure.cache import status_registry
 from infrastructure.database.repository import RentalRepository
+from infrastructure.database.unit_of_work import UnitOfWork
 
 
 class UpdateRentalUseCase:
     def __init__(self, db: Session):
         self.db = db
+        self.uow = UnitOfWork(db)
         self.rental_repo = RentalRepository(db)
 
     def execute(self, rental_data: RentalUpdate) -> RentalRead:
-        rental = self.rental_repo.get_by_id(rental_data.id)
-        if rental is None:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Аренда не найдена")
-
-        rental_res = self.rental_repo.update(
-            rental_id=rental.id,
-            car_id=rental.car_id,
-            start_date=rental.start_date,
-            end_date=rental.end_date,
-            total_amount=rental.total_amount,
-            rental_status_id=rental.rental_status_id
-        )
-
-        return RentalRead.model_validate(rental_res)
\ No newline at end of file
+        check_booking_period(rental_data.start_date, rental_data.end_date)
+
+        with self.uow:
+            rental = self.rental_repo.get_by_id(rental_data.id)
+            if rental is None:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Аренда не найдена")
+
+            # Активная аренда занимает машину: смена машины, дат или возврат в активные
+            # проверяется так же, как новое бронирование
+            active_rental = status_registry.get(self.db).active_rental
+            occupies_new_period = rental.rental_status_id != active_rental or (
+                rental.car_id, rental.start_date, rental.end_date
+            ) != (rental_data.car_id, rental_data.start_date, rental_data.end_date)
+            if rental_data.rental_status_id == active_rental and occupies_new_period:
+                lock_bookable_car(
+                    self.db, rental_data.car_id, rental_data.start_date, rental_data.end_date,
+                    exclude_rental_id=rental.id
+                )
+
+            rental_res = self.rental_repo.update(
+                rental_id=rental.id,
+                car_id=rental_data.car_id,
+                start_date=rental_data.start_date,
+                end_date=rental_data.end_date,
+                total_amount=rental_data.total_amount,
+                rental_status_id=rental_data.rental_status_id
+            )
+
+            return RentalRead.model_validate(rental_res)
\ No newline at end of file
@@ -8,7 +8,7 @@ from application.rental_status.schemas import RentalStatusRead, RentalStatusCrea
 from application.rental_status.usecases import CreateRentalStatusUseCase, DeleteRentalStatusUseCase, \
     GetAllRentalStatusesUseCase, UpdateRentalStatusUseCase
 from infrastructure.database.database_session import get_db
-from infrastructure.database.models import UserEntity
+from infrastructure.cache import AuthenticatedPrincipal
 
 router = APIRouter(prefix="/rental_statuses", tags=["Rental Statuses"])
 
@@ -23,7 +23,7 @@ def get_all_statuses(
 @router.post("/", response_model=RentalStatusRead, status_code=status.HTTP_201_CREATED)
 def add_status(
     status_data: RentalStatusCreate,
-    current_user: UserEntity = Depends(get_current_user),
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     if current_user.role.role_name != "admin":
@@ -35,7 +35,7 @@ def add_status(
 @router.delete("/{status_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_status(
     status_id: int,
-    current_user: UserEntity = Depends(get_current_user),
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     if current_user.role.role_name != "admin":
@@ -48,7 +48,7 @@ def delete_status(
 @router.put("/{status_id}", response_model=RentalStatusRead)
 def update_status(
     status_data: RentalStatusUpdate,
-    current_user: UserEntity = Depends(get_current_user),
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     if current_user.role.role_name != "admin":
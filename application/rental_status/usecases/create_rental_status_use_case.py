@@ -1,14 +1,19 @@
 from sqlalchemy.orm import Session
 
 from application.rental_status.schemas import RentalStatusCreate, RentalStatusRead
+from infrastructure.cache import reference_data_cache, RENTAL_STATUSES
 from infrastructure.database.repository import RentalStatusRepository
+from infrastructure.database.unit_of_work import UnitOfWork
 
 
 class CreateRentalStatusUseCase:
     def __init__(self, db: Session):
         self.db = db
+        self.uow = UnitOfWork(db)
         self.rental_status_repo = RentalStatusRepository(db)
 
     def execute(self, status_data: RentalStatusCreate) -> RentalStatusRead:
-        status_obj = self.rental_status_repo.create(status=status_data.status)
-        return RentalStatusRead.model_validate(status_obj)
\ No newline at end of file
+        with self.uow:
+            status_obj = self.rental_status_repo.create(status=status_data.status)
+            reference_data_cache.invalidate(RENTAL_STATUSES, self.db)
+            return RentalStatusRead.model_validate(status_obj)
\ No newline at end of file
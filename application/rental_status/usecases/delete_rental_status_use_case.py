@@ -1,12 +1,17 @@
 from sqlalchemy.orm import Session
 
+from infrastructure.cache import reference_data_cache, RENTAL_STATUSES
 from infrastructure.database.repository import RentalStatusRepository
+from infrastructure.database.unit_of_work import UnitOfWork
 
 
 class DeleteRentalStatusUseCase:
     def __init__(self, db: Session):
         self.db = db
+        self.uow = UnitOfWork(db)
         self.rental_status_repo = RentalStatusRepository(db)
 
     def execute(self, status_id: int):
-        return self.rental_status_repo.delete(status_id)
\ No newline at end of file
+        with self.uow:
+            self.rental_status_repo.delete(status_id)
+            reference_data_cache.invalidate(RENTAL_STATUSES, self.db)
\ No newline at end of file
@@ -3,6 +3,7 @@ from typing import List
 from sqlalchemy.orm import Session
 
 from application.rental_status.schemas import RentalStatusRead
+from infrastructure.cache import reference_data_cache, RENTAL_STATUSES
 from infrastructure.database.repository import RentalStatusRepository
 
 
@@ -12,5 +13,6 @@ class GetAllRentalStatusesUseCase:
         self.rental_status_repo = RentalStatusRepository(db)
 
     def execute(self) -> List[RentalStatusRead]:
-        statuses = self.rental_status_repo.get_all()
-        return [RentalStatusRead.model_validate(s) for s in statuses]
\ No newline at end of file
+        return reference_data_cache.get_or_load(
+            RENTAL_STATUSES, lambda: [RentalStatusRead.model_validate(s) for s in self.rental_status_repo.get_all()]
+        )
\ No newline at end of file
@@ -2,19 +2,24 @@ from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
 from application.rental_status.schemas import RentalStatusUpdate, RentalStatusRead
+from infrastructure.cache import reference_data_cache, RENTAL_STATUSES
 from infrastructure.database.repository import RentalStatusRepository
+from infrastructure.database.unit_of_work import UnitOfWork
 
 
 class UpdateRentalStatusUseCase:
     def __init__(self, db: Session):
         self.db = db
+        self.uow = UnitOfWork(db)
         self.rental_status_repo = RentalStatusRepository(db)
 
     def execute(self, status_data: RentalStatusUpdate) -> RentalStatusRead:
-        rental_status = self.rental_status_repo.get_by_id(status_data.id)
-        if rental_status is None:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Статус не найден")
+        with self.uow:
+            rental_status = self.rental_status_repo.get_by_id(status_data.id)
+            if rental_status is None:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Статус не найден")
 
-        status_res = self.rental_status_repo.update(status_data.id, status_data.status)
+            status_res = self.rental_status_repo.update(status_data.id, status_data.status)
+            reference_data_cache.invalidate(RENTAL_STATUSES, self.db)
 
-        return RentalStatusRead.model_validate(status_res)
\ No newline at end of file
+            return RentalStatusRead.model_validate(status_res)
\ No newline at end of file
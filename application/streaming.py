@@ -0,0 +1,93 @@
+import csv
+import io
+import json
+import os
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Iterable, Iterator, List, Mapping
+
+# Сколько строк читается из серверного курсора за раз и сколько строк уходит клиенту одним чанком
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", 1000))
+
+
+class ExportFormat(str, Enum):
+    ndjson = "ndjson"
+    json = "json"
+    csv = "csv"
+
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.ndjson: "application/x-ndjson",
+    ExportFormat.json: "application/json",
+    ExportFormat.csv: "text/csv; charset=utf-8",
+}
+
+
+def _default(value: Any):
+    # Те же представления, что и в ответах API (Pydantic): Decimal строкой, даты в ISO 8601
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _dumps(row: Mapping) -> str:
+    return json.dumps(dict(row), default=_default, ensure_ascii=False, separators=(",", ":"))
+
+
+def stream_ndjson(rows: Iterable[Mapping], chunk_size: int = EXPORT_BATCH_SIZE) -> Iterator[str]:
+    chunk = []
+    for row in rows:
+        chunk.append(_dumps(row))
+        if len(chunk) >= chunk_size:
+            yield "\n".join(chunk) + "\n"
+            chunk = []
+    if chunk:
+        yield "\n".join(chunk) + "\n"
+
+
+def stream_json_array(rows: Iterable[Mapping], chunk_size: int = EXPORT_BATCH_SIZE) -> Iterator[str]:
+    yield "["
+    first = True
+    chunk = []
+    for row in rows:
+        chunk.append(_dumps(row))
+        if len(chunk) >= chunk_size:
+            yield ("" if first else ",") + ",".join(chunk)
+            first = False
+            chunk = []
+    if chunk:
+        yield ("" if first else ",") + ",".join(chunk)
+    yield "]"
+
+
+def stream_csv(rows: Iterable[Mapping], fields: List[str], chunk_size: int = EXPORT_BATCH_SIZE) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    written = 0
+    for row in rows:
+        writer.writerow([_csv_value(row[name]) for name in fields])
+        written += 1
+        if written >= chunk_size:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            written = 0
+    yield buffer.getvalue()
+
+
+def _csv_value(value: Any):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def stream_rows(rows: Iterable[Mapping], export_format: ExportFormat, fields: List[str]) -> Iterator[str]:
+    if export_format == ExportFormat.json:
+        return stream_json_array(rows)
+    if export_format == ExportFormat.csv:
+        return stream_csv(rows, fields)
+    return stream_ndjson(rows)
@@ -1,30 +1,65 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query, File, UploadFile
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
+from application.bulk_import import ImportFormat, ImportResult, upload_rows
 from application.dependencies import get_current_user
+from application.pagination import Page, PageParams, page_params
+from application.streaming import ExportFormat, EXPORT_MEDIA_TYPES
 from application.violation.schemas import ViolationRead, ViolationCreate, ViolationUpdate
 from application.violation.usecases import CreateViolationUseCase, DeleteViolationUseCase, GetAllUserViolationsUseCase, \
-    UpdateViolationUseCase, GetViolationByIdUseCase, GetUserViolationByIdUseCase, GetViolationsByRentalUseCase
+    UpdateViolationUseCase, GetViolationByIdUseCase, GetUserViolationByIdUseCase, GetViolationsByRentalUseCase, \
+    ExportViolationsUseCase, IngestViolationsUseCase
 from infrastructure.database.database_session import get_db
-from infrastructure.database.models import UserEntity
+from infrastructure.cache import AuthenticatedPrincipal
 
 router = APIRouter(prefix="/violations", tags=["Violations"])
 
 
-@router.get("/", response_model=List[ViolationRead])
+@router.get("/", response_model=Page[ViolationRead])
 def get_all_violations(
-        current_user: UserEntity = Depends(get_current_user),
+        page: PageParams = Depends(page_params),
+        current_user: AuthenticatedPrincipal = Depends(get_current_user),
         db: Session = Depends(get_db)
 ):
-    return GetAllUserViolationsUseCase(db).execute(current_user.id)
+    return GetAllUserViolationsUseCase(db).execute(current_user.id, page)
+
+
+@router.get("/export")
+def export_violations(
+        format: ExportFormat = ExportFormat.ndjson,
+        current_user: AuthenticatedPrincipal = Depends(get_current_user),
+        db: Session = Depends(get_db)
+):
+    if current_user.role.role_name != "admin":
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Только администратор может выгружать нарушения")
+
+    return StreamingResponse(
+        ExportViolationsUseCase(db).execute(format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="violations.{format.value}"'}
+    )
+
+
+@router.post("/import", response_model=ImportResult)
+def import_violations(
+        file: UploadFile = File(..., description="События камер: CSV с заголовком или NDJSON в UTF-8"),
+        format: Optional[ImportFormat] = Query(None, description="По умолчанию определяется по расширению файла"),
+        current_user: AuthenticatedPrincipal = Depends(get_current_user),
+        db: Session = Depends(get_db)
+):
+    if current_user.role.role_name != "admin":
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Только администратор может добавлять нарушения")
+
+    return IngestViolationsUseCase(db).execute(upload_rows(file, format))
 
 
 @router.get("/rental/{rental_id}", response_model=List[ViolationRead])
 def get_violations_by_rental(
         rental_id: int,
-        current_user: UserEntity = Depends(get_current_user),
+        current_user: AuthenticatedPrincipal = Depends(get_current_user),
         db: Session = Depends(get_db)
 ):
     if current_user.role.role_name != "admin":
@@ -36,7 +71,7 @@ def get_violations_by_rental(
 @router.get("/{violation_id}", response_model=ViolationRead)
 def get_violation_by_id(
         violation_id: int,
-        current_user: UserEntity = Depends(get_current_user),
+        current_user: AuthenticatedPrincipal = Depends(get_current_user),
         db: Session = Depends(get_db)
 ):
     if current_user.role.role_name == "admin":
@@ -48,7 +83,7 @@ def get_violation_by_id(
 @router.post("/", response_model=ViolationRead, status_code=status.HTTP_201_CREATED)
 def add_violation(
     violation_data: ViolationCreate,
-    current_user: UserEntity = Depends(get_current_user),
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     if current_user.role.role_name != "admin":
@@ -60,7 +95,7 @@ def add_violation(
 @router.delete("/{violation_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_violation(
     violation_id: int,
-    current_user: UserEntity = Depends(get_current_user),
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     if current_user.role.role_name != "admin":
@@ -73,7 +108,7 @@ def delete_violation(
 @router.put("/{violation_id}", response_model=ViolationRead)
 def update_violation(
     violation_data: ViolationUpdate,
-    current_user: UserEntity = Depends(get_current_user),
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     if current_user.role.role_name != "admin":
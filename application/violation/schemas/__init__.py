@@ -2,5 +2,6 @@ from .violation_schema import (
     ViolationBase,
     ViolationRead,
     ViolationCreate,
-    ViolationUpdate
+    ViolationUpdate,
+    ViolationEventRow
 )
\ No newline at end of file
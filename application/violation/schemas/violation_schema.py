@@ -1,7 +1,8 @@
 from datetime import datetime
 from decimal import Decimal
+from typing import Optional
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, field_validator, model_validator
 
 
 class ViolationBase(BaseModel):
@@ -26,4 +27,33 @@ class ViolationUpdate(ViolationBase):
 class ViolationRead(ViolationBase):
     id: int
 
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ViolationEventRow(BaseModel):
+    """Событие камеры: машина определяется по номеру, аренда - по времени нарушения"""
+    external_id: str = Field(..., min_length=1, max_length=100, description="Идентификатор события у источника")
+    license_plate: str = Field(..., min_length=1, max_length=20)
+    violation_date: datetime
+    violation_type: Optional[str] = None
+    violation_type_id: Optional[int] = None
+    description: Optional[str] = Field(None, description="По умолчанию - название типа нарушения")
+    fine_amount: Optional[Decimal] = Field(
+        None, gt=0, max_digits=10, decimal_places=2, description="По умолчанию - штраф типа нарушения"
+    )
+
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    @field_validator("violation_date")
+    @classmethod
+    def to_local_time(cls, value: datetime) -> datetime:
+        # Даты в базе хранятся без часового пояса, в локальном времени сервера
+        if value.tzinfo is not None:
+            return value.astimezone().replace(tzinfo=None)
+        return value
+
+    @model_validator(mode="after")
+    def check_violation_type(self):
+        if self.violation_type is None and self.violation_type_id is None:
+            raise ValueError("Не указан тип нарушения (violation_type или violation_type_id)")
+        return self
\ No newline at end of file
@@ -4,4 +4,6 @@ from .delete_violation_use_case import DeleteViolationUseCase
 from .get_all_violation_use_case import GetAllUserViolationsUseCase
 from .get_violation_by_id_use_case import GetViolationByIdUseCase
 from .get_user_violation_by_id_use_case import GetUserViolationByIdUseCase
-from .get_violations_by_rental_use_case import GetViolationsByRentalUseCase
\ No newline at end of file
+from .get_violations_by_rental_use_case import GetViolationsByRentalUseCase
+from .export_violations_use_case import ExportViolationsUseCase
+from .ingest_violations_use_case import IngestViolationsUseCase
\ No newline at end of file
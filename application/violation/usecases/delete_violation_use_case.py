@@ -1,12 +1,15 @@
 from sqlalchemy.orm import Session
 
 from infrastructure.database.repository import ViolationRepository
+from infrastructure.database.unit_of_work import UnitOfWork
 
 
 class DeleteViolationUseCase:
     def __init__(self, db: Session):
         self.db = db
+        self.uow = UnitOfWork(db)
         self.violation_repo = ViolationRepository(db)
 
     def execute(self, violation_id: int):
-        return self.violation_repo.delete(violation_id)
\ No newline at end of file
+        with self.uow:
+            return self.violation_repo.delete(violation_id)
\ No newline at end of file
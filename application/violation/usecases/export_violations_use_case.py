@@ -0,0 +1,19 @@
+from typing import Iterator
+
+from sqlalchemy.orm import Session
+
+from application.streaming import ExportFormat, EXPORT_BATCH_SIZE, stream_rows
+from application.violation.schemas import ViolationRead
+from infrastructure.database.repository import ViolationRepository
+
+
+class ExportViolationsUseCase:
+    def __init__(self, db: Session, batch_size: int = EXPORT_BATCH_SIZE):
+        self.db = db
+        self.batch_size = batch_size
+        self.violation_repo = ViolationRepository(db)
+
+    def execute(self, export_format: ExportFormat) -> Iterator[str]:
+        fields = list(ViolationRead.model_fields)
+        rows = ({name: row[name] for name in fields} for row in self.violation_repo.iter_rows(self.batch_size))
+        return stream_rows(rows, export_format, fields)
\ No newline at end of file
@@ -1,7 +1,8 @@
-from typing import List
+from typing import Optional
 
 from sqlalchemy.orm import Session
 
+from application.pagination import Page, PageParams
 from application.violation.schemas import ViolationRead
 from infrastructure.database.repository import ViolationRepository
 
@@ -11,6 +12,7 @@ class GetAllUserViolationsUseCase:
         self.db = db
         self.violation_repo = ViolationRepository(db)
 
-    def execute(self, current_user_id: int) -> List[ViolationRead]:
-        violations = self.violation_repo.get_by_user_id(current_user_id)
-        return [ViolationRead.model_validate(v) for v in violations]
\ No newline at end of file
+    def execute(self, current_user_id: int, page: Optional[PageParams] = None) -> Page[ViolationRead]:
+        page = page or PageParams()
+        violations = self.violation_repo.get_user_page(current_user_id, page.limit, page.after, page.with_total)
+        return Page[ViolationRead].from_keyset(violations, ViolationRead)
\ No newline at end of file
@@ -0,0 +1,123 @@
+from bisect import bisect_right
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Set, Tuple
+
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session
+
+from application.bulk_import import ImportResult, ImportRow, IMPORT_BATCH_SIZE, ReferenceLookup, batched, validate_batch
+from application.violation.schemas import ViolationEventRow
+from application.violation_type.usecases import GetAllViolationTypesUseCase
+from infrastructure.database.repository import ViolationRepository, RentalRepository, CarRepository
+from infrastructure.database.unit_of_work import UnitOfWork
+
+VIOLATION_EVENTS_ADAPTER = TypeAdapter(List[ViolationEventRow])
+
+
+class CarRentals:
+    """Аренды одной машины, упорядоченные по началу"""
+
+    def __init__(self, rentals: List[Tuple[int, datetime, datetime]]):
+        self.rentals = sorted(rentals, key=lambda rental: rental[1])
+        self.starts = [start for _, start, _ in self.rentals]
+
+    def at(self, moment: datetime):
+        """Id аренды, идущей в момент moment (последней начавшейся из подходящих)"""
+        for rental_id, start, end in reversed(self.rentals[:bisect_right(self.starts, moment)]):
+            if moment < end:
+                return rental_id
+        return None
+
+
+class IngestViolationsUseCase:
+    """Загрузка нарушений из файлов камер: событие (номер машины + время) сопоставляется с арендой.
+
+    Повторная загрузка того же файла ничего не добавляет: события различаются по external_id.
+    """
+
+    def __init__(self, db: Session, batch_size: int = IMPORT_BATCH_SIZE):
+        self.db = db
+        self.uow = UnitOfWork(db)
+        self.batch_size = batch_size
+        self.violation_repo = ViolationRepository(db)
+        self.rental_repo = RentalRepository(db)
+        self.car_repo = CarRepository(db)
+
+    def _rentals_by_car(self, events: List[ViolationEventRow]) -> Dict[int, CarRentals]:
+        car_ids = self.car_repo.ids_by_plates(event.license_plate for event in events)
+        if not car_ids:
+            return {}
+        moments = [event.violation_date for event in events]
+        rentals = defaultdict(list)
+        # Все аренды машин пачки за интервал ее событий - одним запросом по индексу (car_id, период)
+        for rental_id, car_id, start, end in self.rental_repo.periods_of_cars(
+                car_ids.values(), min(moments), max(moments) + timedelta(microseconds=1)
+        ):
+            rentals[car_id].append((rental_id, start, end))
+        return {plate: CarRentals(rentals[car_id]) for plate, car_id in car_ids.items()}
+
+    def execute(self, rows: Iterable[ImportRow]) -> ImportResult:
+        violation_types = ReferenceLookup(GetAllViolationTypesUseCase(self.db).execute(), "type_name", "Тип нарушения")
+
+        result = ImportResult()
+        seen_events: Set[str] = set()
+        for batch in batched(rows, self.batch_size):
+            result.total += len(batch)
+            errors: Dict[int, List[str]] = {}
+            parsed = []
+            for row, values, error in batch:
+                if error is not None:
+                    errors[row] = [error]
+                else:
+                    parsed.append((row, values))
+
+            valid, validation_errors = validate_batch(VIOLATION_EVENTS_ADAPTER, parsed)
+            errors.update(validation_errors)
+
+            events = []
+            for row, event in valid:
+                if event.external_id in seen_events:
+                    result.skipped += 1
+                    continue
+                seen_events.add(event.external_id)
+                events.append((row, event))
+
+            cars = self._rentals_by_car([event for _, event in events]) if events else {}
+            violations: List[dict] = []
+            for row, event in events:
+                row_errors: List[str] = []
+                violation_type_id = violation_types.resolve(event.violation_type, event.violation_type_id, row_errors)
+                rental_id = None
+                if event.license_plate not in cars:
+                    row_errors.append(f"Машина с номером {event.license_plate} не найдена")
+                else:
+                    rental_id = cars[event.license_plate].at(event.violation_date)
+                    if rental_id is None:
+                        row_errors.append(
+                            f"Нет аренды машины {event.license_plate} на {event.violation_date:%d.%m.%Y %H:%M}"
+                        )
+                if row_errors:
+                    errors[row] = row_errors
+                    continue
+
+                violation_type = violation_types.items[violation_type_id]
+                violations.append(dict(
+                    external_id=event.external_id,
+                    rental_id=rental_id,
+                    violation_type_id=violation_type_id,
+                    description=event.description or violation_type.type_name,
+                    fine_amount=event.fine_amount if event.fine_amount is not None else violation_type.default_fine,
+                    violation_date=event.violation_date,
+                    is_paid=False,
+                ))
+
+            with self.uow:
+                inserted = self.violation_repo.bulk_create(violations)
+            result.imported += len(inserted)
+            result.skipped += len(violations) - len(inserted)
+
+            for row in sorted(errors):
+                result.add_error(row, *errors[row])
+
+        return result
@@ -8,7 +8,7 @@ from application.violation_type.schemas import ViolationTypeRead, ViolationTypeC
 from application.violation_type.usecases import CreateViolationTypeUseCase, DeleteViolationTypeUseCase, \
     GetAllViolationTypesUseCase, UpdateViolationTypeUseCase, GetViolationTypeByIdUseCase
 from infrastructure.database.database_session import get_db
-from infrastructure.database.models import UserEntity
+from infrastructure.cache import AuthenticatedPrincipal
 
 router = APIRouter(prefix="/violation_types", tags=["Violation Types"])
 
@@ -31,7 +31,7 @@ def get_violation_type_by_id(
 @router.post("/", response_model=ViolationTypeRead, status_code=status.HTTP_201_CREATED)
 def add_violation_type(
     type_data: ViolationTypeCreate,
-    current_user: UserEntity = Depends(get_current_user),
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     if current_user.role.role_name != "admin":
@@ -43,7 +43,7 @@ def add_violation_type(
 @router.delete("/{violation_type_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_violation_type(
     violation_type_id: int,
-    current_user: UserEntity = Depends(get_current_user),
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     if current_user.role.role_name != "admin":
@@ -57,7 +57,7 @@ def delete_violation_type(
 def update_violation_type(
     violation_type_id: int,
     type_data: ViolationTypeUpdate,
-    current_user: UserEntity = Depends(get_current_user),
+    current_user: AuthenticatedPrincipal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     if current_user.role.role_name != "admin":
@@ -1,18 +1,23 @@
 from sqlalchemy.orm import Session
 
 from application.violation_type.schemas import ViolationTypeCreate, ViolationTypeRead
+from infrastructure.cache import reference_data_cache, VIOLATION_TYPES
 from infrastructure.database.repository import ViolationTypeRepository
+from infrastructure.database.unit_of_work import UnitOfWork
 
 
 class CreateViolationTypeUseCase:
     def __init__(self, db: Session):
         self.db = db
+        self.uow = UnitOfWork(db)
         self.violation_type_repo = ViolationTypeRepository(db)
 
     def execute(self, violation_type_data: ViolationTypeCreate) -> ViolationTypeRead:
-        violation_type_obj = self.violation_type_repo.create(
-            type_name=violation_type_data.type_name,
-            default_fine=violation_type_data.default_fine,
-            description=violation_type_data.description
-        )
-        return ViolationTypeRead.model_validate(violation_type_obj)
\ No newline at end of file
+        with self.uow:
+            violation_type_obj = self.violation_type_repo.create(
+                type_name=violation_type_data.type_name,
+                default_fine=violation_type_data.default_fine,
+                description=violation_type_data.description
+            )
+            reference_data_cache.invalidate(VIOLATION_TYPES, self.db)
+            return ViolationTypeRead.model_validate(violation_type_obj)
\ No newline at end of file
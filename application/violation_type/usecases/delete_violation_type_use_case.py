@@ -1,12 +1,17 @@
 from sqlalchemy.orm import Session
 
+from infrastructure.cache import reference_data_cache, VIOLATION_TYPES
 from infrastructure.database.repository import ViolationTypeRepository
+from infrastructure.database.unit_of_work import UnitOfWork
 
 
 class DeleteViolationTypeUseCase:
     def __init__(self, db: Session):
         self.db = db
+        self.uow = UnitOfWork(db)
         self.violation_type_repo = ViolationTypeRepository(db)
 
     def execute(self, type_id: int):
-        return self.violation_type_repo.delete(type_id)
\ No newline at end of file
+        with self.uow:
+            self.violation_type_repo.delete(type_id)
+            reference_data_cache.invalidate(VIOLATION_TYPES, self.db)
\ No newline at end of file
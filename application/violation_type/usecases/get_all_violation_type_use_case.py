@@ -3,6 +3,7 @@ from typing import List
 from sqlalchemy.orm import Session
 
 from application.violation_type.schemas import ViolationTypeRead
+from infrastructure.cache import reference_data_cache, VIOLATION_TYPES
 from infrastructure.database.repository import ViolationTypeRepository
 
 
@@ -12,5 +13,6 @@ class GetAllViolationTypesUseCase:
         self.violation_type_repo = ViolationTypeRepository(db)
 
     def execute(self) -> List[ViolationTypeRead]:
-        types = self.violation_type_repo.get_all()
-        return [ViolationTypeRead.model_validate(t) for t in types]
\ No newline at end of file
+        return reference_data_cache.get_or_load(
+            VIOLATION_TYPES, lambda: [ViolationTypeRead.model_validate(t) for t in self.violation_type_repo.get_all()]
+        )
\ No newline at end of file
@@ -2,6 +2,7 @@ from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
 from application.violation_type.schemas import ViolationTypeRead
+from application.violation_type.usecases.get_all_violation_type_use_case import GetAllViolationTypesUseCase
 from infrastructure.database.repository import ViolationTypeRepository
 
 
@@ -11,11 +12,13 @@ class GetViolationTypeByIdUseCase:
         self.violation_type_repo = ViolationTypeRepository(db)
 
     def execute(self, type_id: int) -> ViolationTypeRead:
-        violation_type = self.violation_type_repo.get_by_id(type_id)
+        violation_type = next(
+            (t for t in GetAllViolationTypesUseCase(self.db).execute() if t.id == type_id), None
+        )
         if violation_type is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Тип нарушения не найден")
 
-        return ViolationTypeRead.model_validate(violation_type)
+        return violation_type
 
 
 
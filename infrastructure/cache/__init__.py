@@ -0,0 +1,7 @@
+from .entity_counters import EntityCounters, entity_counters
+from .principal_cache import AuthenticatedPrincipal, PrincipalCache, principal_cache
+from .reference_data import (
+    ReferenceDataCache, reference_data_cache, reference_data_listener,
+    CAR_STATUSES, RENTAL_STATUSES, CAR_COLORS, CAR_CATEGORIES, VIOLATION_TYPES, CAR_MODELS
+)
+from .status_registry import StatusRegistry, StatusRegistryError, status_registry
\ No newline at end of file
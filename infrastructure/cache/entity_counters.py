@@ -0,0 +1,50 @@
+import os
+import time
+from threading import Lock
+from typing import Callable, Dict, Optional, Tuple
+
+# Кэш счетчиков для панели администратора: значение загружается COUNT-запросом,
+# затем изменяется репозиториями при создании/удалении. TTL страхует от расхождений
+# (каскадные удаления, другие процессы приложения).
+ENTITY_COUNTERS_ENABLED = os.getenv("ENTITY_COUNTERS_CACHE", "false").lower() in ("1", "true", "yes")
+ENTITY_COUNTERS_TTL = float(os.getenv("ENTITY_COUNTERS_TTL", 300))
+
+
+class EntityCounters:
+    def __init__(self, enabled: bool = ENTITY_COUNTERS_ENABLED, ttl: float = ENTITY_COUNTERS_TTL):
+        self.enabled = enabled
+        self.ttl = ttl
+        self._values: Dict[str, Tuple[int, float]] = {}
+        self._lock = Lock()
+
+    def get_or_load(self, name: str, loader: Callable[[], int]) -> int:
+        if not self.enabled:
+            return loader()
+
+        with self._lock:
+            cached = self._values.get(name)
+        if cached is not None and time.monotonic() - cached[1] < self.ttl:
+            return cached[0]
+
+        value = loader()
+        with self._lock:
+            self._values[name] = (value, time.monotonic())
+        return value
+
+    def add(self, name: str, delta: int):
+        if not self.enabled:
+            return
+        with self._lock:
+            cached = self._values.get(name)
+            if cached is not None:
+                self._values[name] = (max(cached[0] + delta, 0), cached[1])
+
+    def invalidate(self, name: Optional[str] = None):
+        with self._lock:
+            if name is None:
+                self._values.clear()
+            else:
+                self._values.pop(name, None)
+
+
+entity_counters = EntityCounters()
@@ -0,0 +1,99 @@
+import os
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional, Tuple
+
+from infrastructure.metrics import metrics_registry
+
+# Кэш аутентифицированных пользователей: JWT проверяется на каждом запросе,
+# а пользователь с ролью и id клиента берется из памяти вместо двух SELECT.
+# Короткий TTL ограничивает устаревание данных в других воркерах.
+PRINCIPAL_CACHE_ENABLED = os.getenv("PRINCIPAL_CACHE", "true").lower() in ("1", "true", "yes")
+PRINCIPAL_CACHE_TTL = float(os.getenv("PRINCIPAL_CACHE_TTL", 30))
+PRINCIPAL_CACHE_SIZE = int(os.getenv("PRINCIPAL_CACHE_SIZE", 10000))
+
+
+class PrincipalRole:
+    __slots__ = ("id", "role_name")
+
+    def __init__(self, id: int, role_name: str):
+        self.id = id
+        self.role_name = role_name
+
+
+class AuthenticatedPrincipal:
+    """Неизменяемый снимок текущего пользователя: совместим с обращениями current_user.id и current_user.role.role_name"""
+
+    __slots__ = ("id", "username", "role", "client_id")
+
+    def __init__(self, id: int, username: str, role: PrincipalRole, client_id: Optional[int]):
+        self.id = id
+        self.username = username
+        self.role = role
+        self.client_id = client_id
+
+    @classmethod
+    def from_user(cls, user, client_id: Optional[int]) -> "AuthenticatedPrincipal":
+        return cls(
+            id=user.id,
+            username=user.username,
+            role=PrincipalRole(user.role.id, user.role.role_name),
+            client_id=client_id
+        )
+
+
+class PrincipalCache:
+    def __init__(self, enabled: bool = PRINCIPAL_CACHE_ENABLED, ttl: float = PRINCIPAL_CACHE_TTL,
+                 max_size: int = PRINCIPAL_CACHE_SIZE):
+        self.enabled = enabled
+        self.ttl = ttl
+        self.max_size = max_size
+        self._values: "OrderedDict[int, Tuple[AuthenticatedPrincipal, float]]" = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: int) -> Optional[AuthenticatedPrincipal]:
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            cached = self._values.get(user_id)
+            if cached is None or time.monotonic() - cached[1] >= self.ttl:
+                self._values.pop(user_id, None)
+                self.misses += 1
+                return None
+            self._values.move_to_end(user_id)
+            self.hits += 1
+            return cached[0]
+
+    def put(self, principal: AuthenticatedPrincipal):
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._values[principal.id] = (principal, time.monotonic())
+            self._values.move_to_end(principal.id)
+            while len(self._values) > self.max_size:
+                self._values.popitem(last=False)
+
+    def invalidate(self, user_id: Optional[int] = None):
+        with self._lock:
+            if user_id is None:
+                self._values.clear()
+            else:
+                self._values.pop(user_id, None)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "size": len(self._values),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+principal_cache = PrincipalCache()
+metrics_registry.register("principal_cache", principal_cache.snapshot)
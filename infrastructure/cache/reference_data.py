@@ -0,0 +1,205 @@
+import asyncio
+import logging
+import os
+import time
+import uuid
+from threading import Lock
+from typing import Callable, Dict, Optional, Tuple
+
+import asyncpg
+from sqlalchemy import select, func
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session
+
+from infrastructure.database.database_session import ASYNC_DATABASE_URL
+from infrastructure.database.unit_of_work import after_commit
+from infrastructure.metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+# Справочники (статусы, цвета, категории, типы нарушений) почти не меняются, а нужны почти каждой странице.
+# Значения хранятся в памяти воркера, изменения через use case'ы увеличивают версию справочника.
+# TTL страхует от изменений в обход приложения. С REFERENCE_DATA_NOTIFY воркеры оповещают
+# друг друга об изменениях через LISTEN/NOTIFY Postgres.
+REFERENCE_DATA_CACHE_ENABLED = os.getenv("REFERENCE_DATA_CACHE", "true").lower() in ("1", "true", "yes")
+REFERENCE_DATA_TTL = float(os.getenv("REFERENCE_DATA_TTL", 600))
+REFERENCE_DATA_NOTIFY = os.getenv("REFERENCE_DATA_NOTIFY", "false").lower() in ("1", "true", "yes")
+REFERENCE_DATA_CHANNEL = "reference_data"
+# Переподключение слушателя после обрыва соединения: задержка удваивается до максимума
+REFERENCE_DATA_RECONNECT_DELAY = float(os.getenv("REFERENCE_DATA_RECONNECT_DELAY", 0.5))
+REFERENCE_DATA_RECONNECT_MAX_DELAY = float(os.getenv("REFERENCE_DATA_RECONNECT_MAX_DELAY", 30))
+
+CAR_STATUSES = "car_statuses"
+RENTAL_STATUSES = "rental_statuses"
+CAR_COLORS = "car_colors"
+CAR_CATEGORIES = "car_categories"
+VIOLATION_TYPES = "violation_types"
+# Пары «марка, модель» для автодополнения поиска по каталогу
+CAR_MODELS = "car_models"
+REFERENCE_DATA_NAMES = (CAR_STATUSES, RENTAL_STATUSES, CAR_COLORS, CAR_CATEGORIES, VIOLATION_TYPES, CAR_MODELS)
+
+
+class ReferenceDataCache:
+    def __init__(self, enabled: bool = REFERENCE_DATA_CACHE_ENABLED, ttl: float = REFERENCE_DATA_TTL):
+        self.enabled = enabled
+        self.ttl = ttl
+        self._values: Dict[str, Tuple[int, list, float]] = {}
+        self._versions: Dict[str, int] = {}
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def version(self, name: str) -> int:
+        with self._lock:
+            return self._versions.get(name, 0)
+
+    def get_or_load(self, name: str, loader: Callable[[], list]) -> list:
+        if not self.enabled:
+            return loader()
+
+        with self._lock:
+            version = self._versions.get(name, 0)
+            cached = self._values.get(name)
+            if cached is not None and cached[0] == version and time.monotonic() - cached[2] < self.ttl:
+                self.hits += 1
+                return list(cached[1])
+            self.misses += 1
+
+        value = loader()
+        with self._lock:
+            # Справочник могли изменить, пока шла загрузка - такое значение не сохраняем
+            if self._versions.get(name, 0) == version:
+                self._values[name] = (version, value, time.monotonic())
+        return list(value)
+
+    def invalidate(self, name: Optional[str] = None, session: Optional[Session] = None):
+        """Сбрасывает справочник; если передана сессия, оповещает остальные воркеры через нее.
+
+        Уведомление уходит вместе с коммитом транзакции сессии; после коммита справочник сбрасывается
+        повторно, чтобы не осталось значения, загруженного до фиксации изменений.
+        """
+        self.drop(name)
+        if session is not None and name is not None:
+            reference_data_listener.publish(name, session)
+            after_commit(session, lambda: self.drop(name))
+
+    def drop(self, name: Optional[str] = None):
+        with self._lock:
+            names = [name] if name is not None else set(REFERENCE_DATA_NAMES) | set(self._versions)
+            for key in names:
+                self._versions[key] = self._versions.get(key, 0) + 1
+                self._values.pop(key, None)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "versions": dict(self._versions),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+class ReferenceDataListener:
+    """Рассылает и принимает уведомления об изменении справочников между воркерами"""
+
+    def __init__(self, cache: ReferenceDataCache, enabled: bool = REFERENCE_DATA_NOTIFY,
+                 channel: str = REFERENCE_DATA_CHANNEL):
+        self.cache = cache
+        self.enabled = enabled
+        self.channel = channel
+        # Свои уведомления воркер пропускает: кэш уже сброшен при изменении
+        self.instance_id = uuid.uuid4().hex
+        self._connection = None
+        self._reconnect_task: Optional[asyncio.Task] = None
+        self._stopped = False
+
+    def publish(self, name: str, session: Session):
+        if not self.enabled:
+            return
+
+        # NOTIFY транзакционный: доставляется при коммите изменения справочника.
+        # Savepoint не дает ошибке уведомления откатить само изменение
+        try:
+            with session.begin_nested():
+                session.execute(select(func.pg_notify(self.channel, f"{name}:{self.instance_id}")))
+        except Exception:
+            logger.exception("Failed to publish reference data invalidation for %s", name)
+
+    def _on_notification(self, connection, pid, channel, payload: str):
+        name, _, instance_id = payload.partition(":")
+        if instance_id != self.instance_id:
+            self.cache.drop(name)
+
+    def _on_termination(self, connection):
+        if connection is not self._connection:
+            return
+        # Пока соединения нет, уведомления теряются: справочники перечитываются после переподключения
+        logger.warning("Reference data listener connection lost, reconnecting")
+        self._connection = None
+        self.cache.drop()
+        self._schedule_reconnect()
+
+    async def _connect(self):
+        url = make_url(ASYNC_DATABASE_URL)
+        connection = await asyncpg.connect(
+            user=url.username, password=url.password, host=url.host, port=url.port, database=url.database
+        )
+        try:
+            await connection.add_listener(self.channel, self._on_notification)
+        except Exception:
+            connection.terminate()
+            raise
+        connection.add_termination_listener(self._on_termination)
+        self._connection = connection
+        # Пока слушатель не работал, уведомления могли быть пропущены
+        self.cache.drop()
+
+    def _schedule_reconnect(self):
+        if self._stopped or (self._reconnect_task is not None and not self._reconnect_task.done()):
+            return
+        self._reconnect_task = asyncio.get_running_loop().create_task(self._reconnect())
+
+    async def _reconnect(self):
+        delay = REFERENCE_DATA_RECONNECT_DELAY
+        while not self._stopped and self._connection is None:
+            await asyncio.sleep(delay)
+            try:
+                await self._connect()
+            except Exception as exc:
+                delay = min(delay * 2, REFERENCE_DATA_RECONNECT_MAX_DELAY)
+                logger.warning("Reference data listener reconnect failed (%s), retrying in %.1fs", exc, delay)
+            else:
+                logger.info("Reference data listener reconnected")
+
+    async def start(self):
+        if not self.enabled or self._connection is not None:
+            return
+
+        self._stopped = False
+        try:
+            await self._connect()
+        except Exception:
+            # Без слушателя приложение работает: изменения других воркеров подхватит TTL
+            logger.exception("Failed to start reference data listener, retrying in background")
+            self._schedule_reconnect()
+
+    async def stop(self):
+        self._stopped = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        connection, self._connection = self._connection, None
+        if connection is None:
+            return
+        try:
+            connection.remove_termination_listener(self._on_termination)
+            await connection.remove_listener(self.channel, self._on_notification)
+            await asyncio.wait_for(connection.close(), timeout=5)
+        except Exception:
+            connection.terminate()
+
+
+reference_data_cache = ReferenceDataCache()
+reference_data_listener = ReferenceDataListener(reference_data_cache)
+metrics_registry.register("reference_data_cache", reference_data_cache.snapshot)
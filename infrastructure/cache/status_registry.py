@@ -0,0 +1,71 @@
+from threading import Lock
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from infrastructure.cache.reference_data import reference_data_cache, CAR_STATUSES, RENTAL_STATUSES
+from infrastructure.database.models import RentalStatusEntity, CarStatusEntity
+
+ACTIVE_RENTAL_STATUS = "Активна"
+COMPLETED_RENTAL_STATUS = "Завершена"
+RENTED_CAR_STATUS = "В аренде"
+AVAILABLE_CAR_STATUS = "Доступна для аренды"
+
+
+class StatusRegistryError(RuntimeError):
+    pass
+
+
+class StatusIds:
+    __slots__ = ("active_rental", "completed_rental", "rented_car", "available_car")
+
+    def __init__(self, active_rental: int, completed_rental: int, rented_car: int, available_car: int):
+        self.active_rental = active_rental
+        self.completed_rental = completed_rental
+        self.rented_car = rented_car
+        self.available_car = available_car
+
+
+class StatusRegistry:
+    """Id служебных статусов аренд и машин: загружаются при старте и перечитываются после изменения справочников"""
+
+    def __init__(self):
+        self._ids: Optional[StatusIds] = None
+        self._versions: Tuple[int, int] = (-1, -1)
+        self._lock = Lock()
+
+    def _current_versions(self) -> Tuple[int, int]:
+        return reference_data_cache.version(RENTAL_STATUSES), reference_data_cache.version(CAR_STATUSES)
+
+    def load(self, session: Session) -> StatusIds:
+        versions = self._current_versions()
+        rental_statuses: Dict[str, int] = dict(session.execute(select(RentalStatusEntity.status, RentalStatusEntity.id)).all())
+        car_statuses: Dict[str, int] = dict(session.execute(select(CarStatusEntity.status, CarStatusEntity.id)).all())
+
+        missing = [name for name in (ACTIVE_RENTAL_STATUS, COMPLETED_RENTAL_STATUS) if name not in rental_statuses]
+        missing += [name for name in (RENTED_CAR_STATUS, AVAILABLE_CAR_STATUS) if name not in car_statuses]
+        if missing:
+            raise StatusRegistryError(f"Не найдены обязательные статусы: {', '.join(missing)}")
+
+        ids = StatusIds(
+            active_rental=rental_statuses[ACTIVE_RENTAL_STATUS],
+            completed_rental=rental_statuses[COMPLETED_RENTAL_STATUS],
+            rented_car=car_statuses[RENTED_CAR_STATUS],
+            available_car=car_statuses[AVAILABLE_CAR_STATUS],
+        )
+        with self._lock:
+            self._ids = ids
+            self._versions = versions
+        return ids
+
+    def get(self, session: Session) -> StatusIds:
+        with self._lock:
+            ids = self._ids
+            fresh = self._versions == self._current_versions()
+        if ids is not None and fresh:
+            return ids
+        return self.load(session)
+
+
+status_registry = StatusRegistry()
@@ -0,0 +1,35 @@
+from datetime import datetime
+from typing import List
+
+from sqlalchemy import select, and_, func, literal_column
+from sqlalchemy.orm import Session
+
+from infrastructure.cache.status_registry import status_registry
+from infrastructure.database.models import CarEntity, RentalEntity, RENTAL_PERIOD
+
+
+def rental_overlaps(start: datetime, end: datetime):
+    """Условие «аренда пересекается с периодом [start, end)»"""
+    return RENTAL_PERIOD.op("&&")(func.tsrange(start, end, literal_column("'[)'")))
+
+
+def active_rental_overlaps(session: Session, start: datetime, end: datetime):
+    """Условие «активная аренда пересекается с периодом [start, end)»"""
+    statuses = status_registry.get(session)
+    return and_(RentalEntity.rental_status_id == statuses.active_rental, rental_overlaps(start, end))
+
+
+def busy_car_ids(session: Session, start: datetime, end: datetime):
+    """Машины с активной арендой, пересекающейся с периодом"""
+    return select(RentalEntity.car_id).where(active_rental_overlaps(session, start, end))
+
+
+def availability_filters(session: Session, start: datetime, end: datetime) -> List:
+    """Условия для машин, свободных весь период [start, end)"""
+    statuses = status_registry.get(session)
+    # Машина «В аренде» может быть свободна в другой период - решают интервалы аренд,
+    # машины в прочих статусах (не выдаются) в подбор не попадают
+    return [
+        CarEntity.car_status_id.in_((statuses.available_car, statuses.rented_car)),
+        CarEntity.id.not_in(busy_car_ids(session, start, end)),
+    ]
@@ -0,0 +1,28 @@
+import json
+from typing import Set
+
+from sqlalchemy import Select
+from sqlalchemy.orm import Session
+
+
+def explain_plan(session: Session, query: Select) -> dict:
+    """План запроса Postgres (EXPLAIN FORMAT JSON) без выполнения самого запроса"""
+    connection = session.connection()
+    # IN (...) со списком компилируется в placeholder, который раскрывается только при выполнении:
+    # для exec_driver_sql параметры раскрываются сразу и остаются связанными
+    compiled = query.compile(dialect=connection.dialect, compile_kwargs={"render_postcompile": True})
+    params = compiled.params
+    if compiled.positiontup is not None:
+        params = tuple(params[name] for name in compiled.positiontup)
+
+    plan = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled.string}", params).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]
+
+
+def plan_indexes(plan: dict) -> Set[str]:
+    indexes = {plan["Index Name"]} if "Index Name" in plan else set()
+    for child in plan.get("Plans", ()):
+        indexes |= plan_indexes(child)
+    return indexes
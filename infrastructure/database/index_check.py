@@ -0,0 +1,131 @@
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional, Set, Union
+
+from sqlalchemy import Select, select, text, func, literal_column
+from sqlalchemy.orm import Session
+
+from infrastructure.cache import status_registry
+from infrastructure.database.availability import active_rental_overlaps, busy_car_ids
+from infrastructure.database.explain import explain_plan, plan_indexes
+from infrastructure.database.models import RentalEntity, ViolationEntity, RefreshTokenEntity, RENTAL_PERIOD
+from infrastructure.database.repository import CarRepository, RentalRepository
+from infrastructure.database.status_indexes import StatusIndex, ACTIVE_RENTALS_END_DATE, ACTIVE_RENTALS_CAR_PERIOD
+
+
+class IndexCheck:
+    __slots__ = ("name", "index", "build")
+
+    def __init__(self, name: str, index: Union[str, StatusIndex], build: Callable[[Session], Select]):
+        self.name = name
+        self.index = index
+        self.build = build
+
+    def index_name(self, session: Session) -> str:
+        """Имя ожидаемого индекса: у частичных индексов по статусу в него входит текущий id статуса"""
+        if isinstance(self.index, StatusIndex):
+            return self.index.index_name(status_registry.get(session))
+        return self.index
+
+
+class IndexCheckResult:
+    __slots__ = ("check", "index", "used", "ok")
+
+    def __init__(self, check: IndexCheck, index: str, used: Set[str]):
+        self.check = check
+        self.index = index
+        self.used = used
+        self.ok = index in used
+
+
+def _now() -> datetime:
+    return datetime.now()
+
+
+# Запросы в том виде, в каком их строят репозитории, и индекс, который может их обслуживать
+INDEX_CHECKS: List[IndexCheck] = [
+    IndexCheck(
+        "Завершение просроченных аренд", ACTIVE_RENTALS_END_DATE,
+        lambda session: select(RentalEntity.id).where(
+            RentalEntity.rental_status_id == status_registry.get(session).active_rental, RentalEntity.end_date < _now()
+        )
+    ),
+    IndexCheck(
+        "Аренды клиента", "ix_rentals_client_id_id",
+        lambda _: RentalRepository._filter_query(client_id=1).order_by(RentalEntity.id)
+    ),
+    IndexCheck(
+        "Аренды машины", "ix_rentals_car_id_rental_status_id",
+        lambda _: RentalRepository._filter_query(car_id=1)
+    ),
+    IndexCheck(
+        "Аренды за период", "ix_rentals_start_date_id",
+        lambda _: select(RentalEntity.id)
+        .where(RentalEntity.start_date >= _now() - timedelta(days=30), RentalEntity.start_date < _now())
+        .order_by(RentalEntity.start_date, RentalEntity.id)
+    ),
+    IndexCheck(
+        "Нарушения аренды", "ix_violations_rental_id_violation_date",
+        lambda _: select(ViolationEntity)
+        .where(ViolationEntity.rental_id == 1)
+        .order_by(ViolationEntity.violation_date.desc())
+    ),
+    IndexCheck(
+        "Нарушения за период", "ix_violations_violation_date_id",
+        lambda _: select(ViolationEntity.fine_amount, ViolationEntity.is_paid)
+        .where(ViolationEntity.violation_date >= _now() - timedelta(days=30), ViolationEntity.violation_date < _now())
+    ),
+    IndexCheck("Машины по категории", "ix_cars_category_id", lambda _: CarRepository._filter_query(category_id=1)),
+    IndexCheck("Машины по цвету", "ix_cars_color_id", lambda _: CarRepository._filter_query(color_id=1)),
+    IndexCheck("Машины по году", "ix_cars_year", lambda _: CarRepository._filter_query(min_year=2020, max_year=2021)),
+    IndexCheck(
+        "Машины по стоимости", "ix_cars_daily_cost", lambda _: CarRepository._filter_query(min_cost=1000, max_cost=1500)
+    ),
+    IndexCheck("Поиск по каталогу", "ix_cars_search_name_trgm", lambda _: CarRepository._search_query("toyta camry")),
+    IndexCheck("Фильтр по марке", "ix_cars_brand_trgm", lambda _: CarRepository._filter_query(brand="toyota")),
+    IndexCheck(
+        "Занятые машины в периоде", ACTIVE_RENTALS_CAR_PERIOD,
+        lambda session: busy_car_ids(session, _now(), _now() + timedelta(days=7))
+    ),
+    IndexCheck(
+        "Аренды машин в момент нарушения", "ix_rentals_car_id_period",
+        lambda _: select(RentalEntity.id)
+        .where(
+            RentalEntity.car_id.in_([1, 2, 3]),
+            RENTAL_PERIOD.op("&&")(func.tsrange(_now() - timedelta(days=1), _now(), literal_column("'[)'")))
+        )
+    ),
+    IndexCheck(
+        "Пересекающиеся активные аренды машины", ACTIVE_RENTALS_CAR_PERIOD,
+        lambda session: select(RentalEntity.id)
+        .where(RentalEntity.car_id == 1, active_rental_overlaps(session, _now(), _now() + timedelta(days=3)))
+    ),
+    IndexCheck(
+        "Токены пользователя", "ix_refresh_tokens_user_id",
+        lambda _: select(RefreshTokenEntity).where(RefreshTokenEntity.user_id == 1)
+    ),
+    IndexCheck(
+        "Просроченные токены", "ix_refresh_tokens_expires_at",
+        lambda _: select(RefreshTokenEntity.id).where(RefreshTokenEntity.expires_at < _now())
+    ),
+]
+
+
+def check_index_usage(session: Session, checks: Optional[List[IndexCheck]] = None) -> List[IndexCheckResult]:
+    """Проверяет по планам EXPLAIN, что индексы горячих запросов существуют и подходят к запросам.
+
+    Последовательное сканирование запрещается на время проверки: на маленьких
+    таблицах планировщик иначе выбирает его независимо от наличия индекса.
+    Поэтому OK значит «индекс может обслуживать запрос» (нет опечатки в имени,
+    условие частичного индекса совпадает, выражение индекса совпадает с запросом),
+    но не то, что планировщик выберет его на реальных данных - это видно
+    только по EXPLAIN ANALYZE на рабочей базе.
+    """
+    results = []
+    try:
+        session.execute(text("SET LOCAL enable_seqscan = off"))
+        for check in checks or INDEX_CHECKS:
+            used = plan_indexes(explain_plan(session, check.build(session)))
+            results.append(IndexCheckResult(check, check.index_name(session), used))
+    finally:
+        session.rollback()
+    return results
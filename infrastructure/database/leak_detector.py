@@ -0,0 +1,79 @@
+import itertools
+import logging
+import time
+from contextvars import ContextVar
+from threading import Lock
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from infrastructure.metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+_current_request: ContextVar[Optional[str]] = ContextVar("current_request", default=None)
+
+
+class ConnectionLeakDetector:
+    """Помечает соединения из пула текущим запросом и находит те, что не вернулись в пул после его завершения"""
+
+    def __init__(self):
+        self._checked_out: Dict[int, Tuple[str, float]] = {}
+        self._lock = Lock()
+        self.leaks = 0
+
+    def install(self, engine: Engine):
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        request = _current_request.get()
+        if request is not None:
+            with self._lock:
+                self._checked_out[id(connection_record)] = (request, time.perf_counter())
+
+    def _on_checkin(self, dbapi_connection, connection_record):
+        with self._lock:
+            self._checked_out.pop(id(connection_record), None)
+
+    def check_request(self, request: str):
+        now = time.perf_counter()
+        with self._lock:
+            held = [started for owner, started in self._checked_out.values() if owner == request]
+            self.leaks += len(held)
+        for started in held:
+            logger.warning(
+                "Connection checked out during %s is still held after the request finished (%.0f ms)",
+                request, (now - started) * 1000
+            )
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {"leaked_connections": self.leaks, "tracked_connections": len(self._checked_out)}
+
+
+leak_detector = ConnectionLeakDetector()
+metrics_registry.register("db_connection_leaks", leak_detector.snapshot)
+
+
+class ConnectionLeakMiddleware:
+    _counter = itertools.count(1)
+
+    def __init__(self, app, detector: ConnectionLeakDetector = leak_detector):
+        self.app = app
+        self.detector = detector
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = f'{scope["method"]} {scope["path"]} #{next(self._counter)}'
+        token = _current_request.set(request)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current_request.reset(token)
+            # К этому моменту зависимости запроса (get_db / get_async_db) уже закрыли свои сессии
+            self.detector.check_request(request)
@@ -7,6 +7,7 @@ from alembic import context
 
 from infrastructure.database.database_session import DATABASE_URL
 from infrastructure.database.models import Base
+from infrastructure.database.status_indexes import STATUS_INDEXES
 
 config = context.config
 
@@ -18,6 +19,13 @@ config.set_main_option("sqlalchemy.url", DATABASE_URL)
 target_metadata = Base.metadata
 
 
+def include_object(object, name, type_, reflected, compare_to):
+    # Частичные индексы по id статусов создаются приложением, а не миграциями
+    if type_ == "index" and reflected and any(index.matches(name) for index in STATUS_INDEXES):
+        return False
+    return True
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -34,6 +42,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -57,7 +66,7 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection, target_metadata=target_metadata, include_object=include_object
         )
 
         with context.begin_transaction():
@@ -0,0 +1,60 @@
+"""add rental daily stats
+
+Revision ID: 3b74ddc54e27
+Revises: e03d7cfc7e60
+Create Date: 2026-10-18 12:04:51.318270
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b74ddc54e27'
+down_revision: Union[str, Sequence[str], None] = 'e03d7cfc7e60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('rental_daily_stats',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('category_id', sa.BigInteger(), nullable=False),
+    sa.Column('car_id', sa.BigInteger(), nullable=False),
+    sa.Column('rentals_started', sa.Integer(), nullable=False),
+    sa.Column('rentals_completed', sa.Integer(), nullable=False),
+    sa.Column('revenue', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('rentals_with_violations', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['car_id'], ['cars.id'], ),
+    sa.ForeignKeyConstraint(['category_id'], ['car_categories.id'], ),
+    sa.PrimaryKeyConstraint('day', 'category_id', 'car_id')
+    )
+    # Заполнение по существующим арендам, дальше агрегаты поддерживаются приложением
+    # (пересборка: python manage.py rebuild-rental-stats)
+    op.execute("""
+        INSERT INTO rental_daily_stats
+            (day, category_id, car_id, rentals_started, rentals_completed, revenue, rentals_with_violations)
+        SELECT day, category_id, car_id, sum(started), sum(completed), sum(revenue), sum(with_violations)
+        FROM (
+            SELECT r.start_date::date AS day, c.category_id, r.car_id,
+                   1 AS started, 0 AS completed, r.total_amount AS revenue,
+                   CASE WHEN EXISTS (SELECT 1 FROM violations v WHERE v.rental_id = r.id) THEN 1 ELSE 0 END
+                       AS with_violations
+            FROM rentals r JOIN cars c ON c.id = r.car_id
+            UNION ALL
+            SELECT r.end_date::date, c.category_id, r.car_id, 0, 1, 0, 0
+            FROM rentals r
+            JOIN cars c ON c.id = r.car_id
+            JOIN rental_statuses s ON s.id = r.rental_status_id
+            WHERE s.status = 'Завершена'
+        ) contributions
+        GROUP BY day, category_id, car_id
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('rental_daily_stats')
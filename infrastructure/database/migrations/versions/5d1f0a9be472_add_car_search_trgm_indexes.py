@@ -0,0 +1,37 @@
+"""add car search trgm indexes
+
+Revision ID: 5d1f0a9be472
+Revises: 96e980c026d9
+Create Date: 2026-10-18 16:12:44.730921
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d1f0a9be472'
+down_revision: Union[str, Sequence[str], None] = '96e980c026d9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index('ix_cars_brand_trgm', 'cars', ['brand'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'brand': 'gin_trgm_ops'})
+    op.create_index('ix_cars_model_trgm', 'cars', ['model'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'model': 'gin_trgm_ops'})
+    op.execute(
+        "CREATE INDEX ix_cars_search_name_trgm ON cars USING gin (lower(brand || ' ' || model) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_cars_search_name_trgm', table_name='cars')
+    op.drop_index('ix_cars_model_trgm', table_name='cars', postgresql_using='gin')
+    op.drop_index('ix_cars_brand_trgm', table_name='cars', postgresql_using='gin')
@@ -0,0 +1,50 @@
+"""add query indexes
+
+Revision ID: 96e980c026d9
+Revises: 3b74ddc54e27
+Create Date: 2026-10-18 14:31:07.204116
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '96e980c026d9'
+down_revision: Union[str, Sequence[str], None] = '3b74ddc54e27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_rentals_rental_status_id_end_date', 'rentals', ['rental_status_id', 'end_date'], unique=False)
+    op.create_index('ix_rentals_client_id_id', 'rentals', ['client_id', 'id'], unique=False)
+    op.create_index('ix_rentals_car_id_rental_status_id', 'rentals', ['car_id', 'rental_status_id'], unique=False)
+    op.create_index('ix_rentals_start_date_id', 'rentals', ['start_date', 'id'], unique=False)
+    op.create_index('ix_violations_rental_id_violation_date', 'violations', ['rental_id', 'violation_date'], unique=False)
+    op.create_index('ix_violations_violation_date_id', 'violations', ['violation_date', 'id'], unique=False)
+    op.create_index(op.f('ix_cars_category_id'), 'cars', ['category_id'], unique=False)
+    op.create_index(op.f('ix_cars_color_id'), 'cars', ['color_id'], unique=False)
+    op.create_index(op.f('ix_cars_year'), 'cars', ['year'], unique=False)
+    op.create_index(op.f('ix_cars_daily_cost'), 'cars', ['daily_cost'], unique=False)
+    op.create_index(op.f('ix_refresh_tokens_user_id'), 'refresh_tokens', ['user_id'], unique=False)
+    op.create_index(op.f('ix_refresh_tokens_expires_at'), 'refresh_tokens', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_refresh_tokens_expires_at'), table_name='refresh_tokens')
+    op.drop_index(op.f('ix_refresh_tokens_user_id'), table_name='refresh_tokens')
+    op.drop_index(op.f('ix_cars_daily_cost'), table_name='cars')
+    op.drop_index(op.f('ix_cars_year'), table_name='cars')
+    op.drop_index(op.f('ix_cars_color_id'), table_name='cars')
+    op.drop_index(op.f('ix_cars_category_id'), table_name='cars')
+    op.drop_index('ix_violations_violation_date_id', table_name='violations')
+    op.drop_index('ix_violations_rental_id_violation_date', table_name='violations')
+    op.drop_index('ix_rentals_start_date_id', table_name='rentals')
+    op.drop_index('ix_rentals_car_id_rental_status_id', table_name='rentals')
+    op.drop_index('ix_rentals_client_id_id', table_name='rentals')
+    op.drop_index('ix_rentals_rental_status_id_end_date', table_name='rentals')
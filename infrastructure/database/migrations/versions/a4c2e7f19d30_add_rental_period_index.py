@@ -0,0 +1,28 @@
+"""add rental period index
+
+Revision ID: a4c2e7f19d30
+Revises: 5d1f0a9be472
+Create Date: 2026-10-18 17:40:12.551804
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c2e7f19d30'
+down_revision: Union[str, Sequence[str], None] = '5d1f0a9be472'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE INDEX ix_rentals_period ON rentals USING gist (tsrange(start_date, end_date, '[)'))")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_rentals_period', table_name='rentals')
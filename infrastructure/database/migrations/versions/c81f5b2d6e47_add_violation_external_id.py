@@ -0,0 +1,35 @@
+"""add violation external id
+
+Revision ID: c81f5b2d6e47
+Revises: a4c2e7f19d30
+Create Date: 2026-10-18 21:05:37.184420
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c81f5b2d6e47'
+down_revision: Union[str, Sequence[str], None] = 'a4c2e7f19d30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('violations', sa.Column('external_id', sa.String(length=100), nullable=True))
+    op.create_index('ix_violations_external_id', 'violations', ['external_id'], unique=True)
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    op.execute(
+        "CREATE INDEX ix_rentals_car_id_period ON rentals USING gist (car_id, tsrange(start_date, end_date, '[)'))"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_rentals_car_id_period', table_name='rentals')
+    op.drop_index('ix_violations_external_id', table_name='violations')
+    op.drop_column('violations', 'external_id')
@@ -6,8 +6,9 @@ from .rental_status_entity import RentalStatusEntity
 from .car_status_entity import CarStatusEntity
 from .car_category_entity import CarCategoryEntity
 from .car_color_entity import CarColorEntity
-from .car_entity import CarEntity
-from .rental_entity import RentalEntity
+from .car_entity import CarEntity, CAR_SEARCH_NAME
+from .rental_entity import RentalEntity, RENTAL_PERIOD
 from .violation_type_entity import ViolationTypeEntity
 from .violation_entity import ViolationEntity
-from .refresh_token_entity import RefreshTokenEntity
\ No newline at end of file
+from .refresh_token_entity import RefreshTokenEntity
+from .rental_daily_stat_entity import RentalDailyStatEntity
\ No newline at end of file
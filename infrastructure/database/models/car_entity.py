@@ -1,4 +1,4 @@
-from sqlalchemy import Column, BigInteger, String, Integer, ForeignKey, Numeric
+from sqlalchemy import Column, BigInteger, String, Integer, ForeignKey, Numeric, Index, func, literal_column
 from sqlalchemy.orm import relationship
 
 from .base import Base
@@ -6,17 +6,31 @@ from .base import Base
 
 class CarEntity(Base):
     __tablename__ = 'cars'
+    __table_args__ = (
+        # Фильтры каталога ilike('%...%') по марке и модели (pg_trgm)
+        Index("ix_cars_brand_trgm", "brand", postgresql_using="gin", postgresql_ops={"brand": "gin_trgm_ops"}),
+        Index("ix_cars_model_trgm", "model", postgresql_using="gin", postgresql_ops={"model": "gin_trgm_ops"}),
+    )
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     brand = Column(String(50), nullable=False)
     model = Column(String(50), nullable=False)
-    year = Column(Integer, nullable=False)
-    category_id = Column(BigInteger, ForeignKey("car_categories.id"), nullable=False)
+    year = Column(Integer, nullable=False, index=True)
+    category_id = Column(BigInteger, ForeignKey("car_categories.id"), nullable=False, index=True)
     license_plate = Column(String(20), nullable=False, unique=True)
-    color_id = Column(BigInteger, ForeignKey("car_colors.id"), nullable=False)
-    daily_cost = Column(Numeric(10, 2), nullable=False)
+    color_id = Column(BigInteger, ForeignKey("car_colors.id"), nullable=False, index=True)
+    daily_cost = Column(Numeric(10, 2), nullable=False, index=True)
     car_status_id = Column(BigInteger, ForeignKey("car_statuses.id"), nullable=False)
 
     car_status = relationship("CarStatusEntity", back_populates="cars")
     color = relationship("CarColorEntity", back_populates="cars")
     category = relationship("CarCategoryEntity", back_populates="cars")
+
+
+# Строка поиска по каталогу «марка модель»; запросы поиска должны использовать это же выражение
+CAR_SEARCH_NAME = func.lower(CarEntity.brand + literal_column("' '") + CarEntity.model)
+
+Index(
+    "ix_cars_search_name_trgm", CAR_SEARCH_NAME.label("search_name"),
+    postgresql_using="gin", postgresql_ops={"search_name": "gin_trgm_ops"}
+)
\ No newline at end of file
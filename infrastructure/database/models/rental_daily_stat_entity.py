@@ -0,0 +1,15 @@
+from sqlalchemy import Column, BigInteger, ForeignKey, Date, Integer, Numeric
+
+from .base import Base
+
+
+class RentalDailyStatEntity(Base):
+    __tablename__ = "rental_daily_stats"
+
+    day = Column(Date, primary_key=True)
+    category_id = Column(BigInteger, ForeignKey("car_categories.id"), primary_key=True)
+    car_id = Column(BigInteger, ForeignKey("cars.id"), primary_key=True)
+    rentals_started = Column(Integer, nullable=False, default=0)
+    rentals_completed = Column(Integer, nullable=False, default=0)
+    revenue = Column(Numeric(12, 2), nullable=False, default=0)
+    rentals_with_violations = Column(Integer, nullable=False, default=0)
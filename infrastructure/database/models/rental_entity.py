@@ -1,4 +1,4 @@
-from sqlalchemy import Column, BigInteger, ForeignKey, DateTime, func, Numeric
+from sqlalchemy import Column, BigInteger, ForeignKey, DateTime, func, Numeric, Index, literal_column
 from sqlalchemy.orm import relationship
 
 from .base import Base
@@ -6,6 +6,16 @@ from .base import Base
 
 class RentalEntity(Base):
     __tablename__ = "rentals"
+    __table_args__ = (
+        # Завершение просроченных аренд: статус + окончание
+        Index("ix_rentals_rental_status_id_end_date", "rental_status_id", "end_date"),
+        # Аренды клиента и фильтр по клиенту с постраничным выводом по id
+        Index("ix_rentals_client_id_id", "client_id", "id"),
+        # Фильтр по машине и поиск активной аренды машины
+        Index("ix_rentals_car_id_rental_status_id", "car_id", "rental_status_id"),
+        # Выгрузка статистики и аналитика за период
+        Index("ix_rentals_start_date_id", "start_date", "id"),
+    )
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     client_id = Column(BigInteger, ForeignKey("clients.id"), nullable=False)
@@ -17,4 +27,19 @@ class RentalEntity(Base):
 
     violations = relationship("ViolationEntity", back_populates="rental", cascade="all, delete-orphan")
     rental_status = relationship("RentalStatusEntity", back_populates="rentals")
-    client = relationship("ClientEntity", back_populates="rentals")
\ No newline at end of file
+    client = relationship("ClientEntity", back_populates="rentals")
+    car = relationship("CarEntity")
+
+
+# Период аренды [начало, окончание) как диапазон Postgres: пересечения ищутся по GiST-индексу
+RENTAL_PERIOD = func.tsrange(RentalEntity.start_date, RentalEntity.end_date, literal_column("'[)'"))
+
+Index("ix_rentals_period", RENTAL_PERIOD.label("period"), postgresql_using="gist")
+
+# Аренда машины в заданный момент (сопоставление событий камер); car_id в GiST - через btree_gist
+Index(
+    "ix_rentals_car_id_period", RentalEntity.car_id, RENTAL_PERIOD.label("period"), postgresql_using="gist"
+)
+
+# Частичные индексы по статусу «Активна» (завершение просроченных аренд, проверка пересечений при бронировании)
+# не объявлены здесь: id статуса в их условии - данные, их создает status_indexes.sync_status_indexes
\ No newline at end of file
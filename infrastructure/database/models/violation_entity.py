@@ -1,4 +1,4 @@
-from sqlalchemy import Column, BigInteger, ForeignKey, Text, Numeric, DateTime, Boolean
+from sqlalchemy import Column, BigInteger, ForeignKey, Text, Numeric, DateTime, Boolean, Index, String
 from sqlalchemy.orm import relationship
 
 from .base import Base
@@ -6,6 +6,14 @@ from .base import Base
 
 class ViolationEntity(Base):
     __tablename__ = 'violations'
+    __table_args__ = (
+        # Нарушения аренды по дате
+        Index("ix_violations_rental_id_violation_date", "rental_id", "violation_date"),
+        # Нарушения пользователя по дате и собираемость штрафов за период
+        Index("ix_violations_violation_date_id", "violation_date", "id"),
+        # Идемпотентная загрузка событий камер: повторная загрузка файла не создает дублей
+        Index("ix_violations_external_id", "external_id", unique=True),
+    )
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     rental_id = Column(BigInteger, ForeignKey('rentals.id'), nullable=False)
@@ -14,6 +22,8 @@ class ViolationEntity(Base):
     fine_amount = Column(Numeric(10, 2), nullable=False)
     violation_date = Column(DateTime(timezone=False), nullable=False)
     is_paid = Column(Boolean, nullable=False, default=False)
+    # Идентификатор события у внешнего источника (камеры); у нарушений, созданных вручную, пустой
+    external_id = Column(String(100), nullable=True)
 
     violation_type = relationship("ViolationTypeEntity", back_populates="violations")
     rental = relationship("RentalEntity", back_populates="violations")
\ No newline at end of file
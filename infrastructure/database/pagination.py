@@ -0,0 +1,78 @@
+import os
+from typing import Generic, List, Optional, Sequence, Tuple, TypeVar
+
+from sqlalchemy import Select, select, func, tuple_
+from sqlalchemy.orm import Session
+
+from infrastructure.database.explain import explain_plan
+
+T = TypeVar("T")
+
+# Точный COUNT(*) выполняется, только если оценка планировщика Postgres меньше этого порога
+PAGINATION_EXACT_COUNT_LIMIT = int(os.getenv("PAGINATION_EXACT_COUNT_LIMIT", 10000))
+
+
+class KeysetPage(Generic[T]):
+    __slots__ = ("items", "next_after", "total", "total_is_estimate")
+
+    def __init__(self, items: List[T], next_after: Optional[int], total: Optional[int] = None,
+                 total_is_estimate: bool = False):
+        self.items = items
+        self.next_after = next_after
+        self.total = total
+        self.total_is_estimate = total_is_estimate
+
+
+def keyset_page(
+        session: Session,
+        query: Select,
+        id_column,
+        limit: int,
+        after: Optional[int] = None,
+        sort_column=None,
+        descending: bool = False,
+        with_total: bool = False
+) -> KeysetPage:
+    """Страница по ключу (sort_column, id) после строки с id=after, без OFFSET"""
+    keys: Sequence = (sort_column, id_column) if sort_column is not None else (id_column,)
+
+    total, total_is_estimate = count_or_estimate(session, query) if with_total else (None, False)
+
+    page_query = query
+    if after is not None:
+        if sort_column is None:
+            cursor = (after,)
+        else:
+            cursor = session.execute(select(*keys).where(id_column == after)).first()
+            if cursor is None:
+                return KeysetPage([], None, total, total_is_estimate)
+        key, value = (tuple_(*keys), tuple_(*cursor)) if len(keys) > 1 else (keys[0], cursor[0])
+        page_query = page_query.where(key < value if descending else key > value)
+
+    order = [k.desc() if descending else k.asc() for k in keys]
+    rows = list(session.scalars(page_query.order_by(*order).limit(limit + 1)).all())
+
+    next_after = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_after = rows[-1].id
+    return KeysetPage(rows, next_after, total, total_is_estimate)
+
+
+def count_or_estimate(session: Session, query: Select) -> Tuple[int, bool]:
+    """Количество строк запроса: на больших выборках - оценка планировщика вместо COUNT(*)"""
+    count_query = select(func.count()).select_from(query.order_by(None).subquery())
+
+    estimate = _planner_estimate(session, query)
+    if estimate is not None and estimate >= PAGINATION_EXACT_COUNT_LIMIT:
+        return estimate, True
+
+    return session.scalar(count_query), False
+
+
+def _planner_estimate(session: Session, query: Select) -> Optional[int]:
+    plan = explain_plan(session, query.order_by(None))
+    try:
+        return int(plan["Plan Rows"])
+    except (LookupError, TypeError, ValueError):
+        return None
@@ -0,0 +1,87 @@
+import time
+from contextvars import ContextVar
+from threading import Lock
+
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+
+
+class PoolMetrics:
+    def __init__(self):
+        self._lock = Lock()
+        self.checkouts = 0
+        self.checkout_total_ms = 0.0
+        self.checkout_max_ms = 0.0
+        self.timeouts = 0
+        self.overflow_peak = 0
+
+    def record_checkout(self, pool: QueuePool, duration_ms: float):
+        with self._lock:
+            self.checkouts += 1
+            self.checkout_total_ms += duration_ms
+            self.checkout_max_ms = max(self.checkout_max_ms, duration_ms)
+            self.overflow_peak = max(self.overflow_peak, pool.overflow())
+
+    def record_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self, pool: QueuePool) -> dict:
+        with self._lock:
+            return {
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "idle": pool.checkedin(),
+                "overflow": max(pool.overflow(), 0),
+                "overflow_peak": max(self.overflow_peak, 0),
+                "checkouts": self.checkouts,
+                "checkout_avg_ms": round(self.checkout_total_ms / self.checkouts, 2) if self.checkouts else 0.0,
+                "checkout_max_ms": round(self.checkout_max_ms, 2),
+                "timeouts": self.timeouts,
+            }
+
+
+_do_get_depth: ContextVar[int] = ContextVar("pool_do_get_depth", default=0)
+
+
+class _InstrumentedPoolMixin:
+    """Замеряет время ожидания соединения из пула и считает таймауты исчерпания пула"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def _do_get(self):
+        # QueuePool._do_get может вызывать себя рекурсивно, замеряем только внешний вызов.
+        # Глубина хранится в ContextVar: у каждого потока и у каждого greenlet'а асинхронного пула
+        # (их контекст копируется при создании) свое значение, чередование не сбивает счетчик
+        depth = _do_get_depth.get()
+        token = _do_get_depth.set(depth + 1)
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            if depth == 0:
+                self.metrics.record_timeout()
+            raise
+        finally:
+            _do_get_depth.reset(token)
+        if depth == 0:
+            self.metrics.record_checkout(self, (time.perf_counter() - started) * 1000)
+        return connection
+
+    def metrics_snapshot(self) -> dict:
+        return self.metrics.snapshot(self)
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncAdaptedQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
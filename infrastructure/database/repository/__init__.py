@@ -9,4 +9,6 @@ from .car_repository import CarRepository
 from .rental_repository import RentalRepository
 from .violation_type_repository import ViolationTypeRepository
 from .violation_repository import ViolationRepository
-from .refresh_token_repository import RefreshTokenRepository
\ No newline at end of file
+from .refresh_token_repository import RefreshTokenRepository
+from .async_user_repository import AsyncUserRepository
+from .rental_daily_stat_repository import RentalDailyStatRepository
\ No newline at end of file
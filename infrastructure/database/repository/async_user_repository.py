@@ -0,0 +1,38 @@
+from typing import Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload, joinedload
+
+from infrastructure.database.models import UserEntity, ClientEntity
+
+
+class AsyncUserRepository:
+    """Единственный асинхронный репозиторий: пользователь загружается на каждом запросе фронтенда до use case'ов.
+
+    Машины, аренды, клиенты и справочники читаются синхронными репозиториями через AsyncSession.run_sync
+    (InProcessGateway): ввод-вывод идет через asyncpg и не блокирует event loop, а логика и проверки
+    остаются в одном месте. Асинхронные копии этих репозиториев не заводятся намеренно.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    def _select(self):
+        # Роль нужна почти всегда (проверки прав, шаблоны), ленивая загрузка в async недоступна
+        return select(UserEntity).options(selectinload(UserEntity.role))
+
+    async def get_by_id(self, user_id: int) -> UserEntity | None:
+        return await self.session.scalar(self._select().where(UserEntity.id == user_id))
+
+    async def get_by_username(self, username: str) -> UserEntity | None:
+        return await self.session.scalar(self._select().where(UserEntity.username == username))
+
+    async def get_with_client_id(self, user_id: int) -> Tuple[Optional[UserEntity], Optional[int]]:
+        row = (await self.session.execute(
+            select(UserEntity, ClientEntity.id)
+            .outerjoin(ClientEntity, ClientEntity.user_id == UserEntity.id)
+            .options(joinedload(UserEntity.role))
+            .where(UserEntity.id == user_id)
+        )).first()
+        return (row[0], row[1]) if row else (None, None)
@@ -25,21 +25,19 @@ class CarCategoryRepository:
     def create(self, category_name: str, description: str, base_cost: Decimal) -> CarCategoryEntity:
         category_obj = CarCategoryEntity(category_name=category_name, description=description, base_cost=base_cost)
         self.session.add(category_obj)
-        self.session.commit()
-        self.session.refresh(category_obj)
+        self.session.flush()
         return category_obj
 
     def delete(self, category_id: int):
         category = self.session.query(CarCategoryEntity).filter(CarCategoryEntity.id == category_id).first()
         if category:
             self.session.delete(category)
-            self.session.commit()
+            self.session.flush()
 
     def update(self, category_id: int, category_name: str, description: str, base_cost: Decimal) -> CarCategoryEntity:
         category_obj = self.session.get(CarCategoryEntity, category_id)
         category_obj.category_name = category_name
         category_obj.description = description
         category_obj.base_cost = base_cost
-        self.session.commit()
-        self.session.refresh(category_obj)
+        self.session.flush()
         return category_obj
\ No newline at end of file
@@ -24,20 +24,18 @@ class CarColorRepository:
     def create(self, color: str, color_hex: str) -> CarColorEntity:
         color_obj = CarColorEntity(color=color, hex=color_hex)
         self.session.add(color_obj)
-        self.session.commit()
-        self.session.refresh(color_obj)
+        self.session.flush()
         return color_obj
 
     def delete(self, color_id: int):
         color = self.session.query(CarColorEntity).filter(CarColorEntity.id == color_id).first()
         if color:
             self.session.delete(color)
-            self.session.commit()
+            self.session.flush()
 
     def update(self, color_id: int, color_name: str, color_hex: str) -> CarColorEntity:
         color_obj = self.session.get(CarColorEntity, color_id)
         color_obj.color = color_name
         color_obj.hex = color_hex
-        self.session.commit()
-        self.session.refresh(color_obj)
+        self.session.flush()
         return color_obj
\ No newline at end of file
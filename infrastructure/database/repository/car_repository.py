@@ -1,10 +1,29 @@
+import os
+from datetime import datetime
 from decimal import Decimal
-from typing import Optional, List
+from typing import Optional, List, Tuple, Sequence, Dict, Iterable
 
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, func, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session
 
-from infrastructure.database.models import CarEntity
+from infrastructure.cache import entity_counters
+from infrastructure.database.models import CarEntity, CarCategoryEntity, CAR_SEARCH_NAME
+from infrastructure.database.availability import availability_filters
+from infrastructure.database.pagination import KeysetPage, keyset_page
+from infrastructure.database.repository.rental_daily_stat_repository import RentalDailyStatRepository
+from infrastructure.database.unit_of_work import after_commit
+
+
+# Сколько бронирование ждет блокировку машины, которую бронирует другой запрос
+BOOKING_LOCK_TIMEOUT_MS = int(os.getenv("BOOKING_LOCK_TIMEOUT_MS", 5000))
+# SQLSTATE lock_not_available: истек lock_timeout
+_LOCK_NOT_AVAILABLE = "55P03"
+
+
+class CarLockTimeoutError(RuntimeError):
+    """Машину не удалось заблокировать за BOOKING_LOCK_TIMEOUT_MS"""
 
 
 class CarRepository:
@@ -14,6 +33,30 @@ class CarRepository:
     def get_by_id(self, car_id: int) -> Optional[CarEntity]:
         return self.session.get(CarEntity, car_id)
 
+    def get_by_ids(self, car_ids: Iterable[int]) -> List[CarEntity]:
+        return list(self.session.scalars(select(CarEntity).where(CarEntity.id.in_(set(car_ids)))).all())
+
+    def ids_by_plates(self, plates: Iterable[str]) -> Dict[str, int]:
+        return dict(self.session.execute(
+            select(CarEntity.license_plate, CarEntity.id).where(CarEntity.license_plate.in_(set(plates)))
+        ).all())
+
+    def lock_for_booking(self, car_id: int) -> Optional[CarEntity]:
+        """Блокирует строку машины до конца транзакции; None - машины нет.
+
+        Бронирования одной машины выполняются по очереди: следующее ждет коммита предыдущего
+        и видит его аренду. Ожидание дольше BOOKING_LOCK_TIMEOUT_MS - CarLockTimeoutError.
+        """
+        self.session.execute(text(f"SET LOCAL lock_timeout = {BOOKING_LOCK_TIMEOUT_MS}"))
+        try:
+            return self.session.scalars(
+                select(CarEntity).where(CarEntity.id == car_id).with_for_update()
+            ).first()
+        except OperationalError as exc:
+            if getattr(exc.orig, "pgcode", None) == _LOCK_NOT_AVAILABLE:
+                raise CarLockTimeoutError(car_id) from exc
+            raise
+
     def get_all(self) -> List[CarEntity]:
         return list(
             self.session.scalars(
@@ -22,6 +65,44 @@ class CarRepository:
             .all()
         )
 
+    def search(
+            self, text: str, limit: int,
+            available_from: Optional[datetime] = None, available_to: Optional[datetime] = None, **filters
+    ) -> List[CarEntity]:
+        """Машины, похожие на запрос, от самых похожих: опечатки допускаются за счет сходства триграмм"""
+        filters["extra_filters"] = self._availability(available_from, available_to)
+        query = self._search_query(text, **filters)
+        return list(self.session.scalars(query.limit(limit)).all())
+
+    @classmethod
+    def _search_query(cls, text: str, **filters):
+        text = text.strip().lower()
+        # name %> text: в названии есть слово, похожее на запрос (word_similarity, индекс ix_cars_search_name_trgm)
+        rank = func.word_similarity(text, CAR_SEARCH_NAME)
+        return (
+            cls._filter_query(**filters)
+            .where(CAR_SEARCH_NAME.op("%>")(text))
+            .order_by(rank.desc(), func.similarity(CAR_SEARCH_NAME, text).desc(), CarEntity.id)
+        )
+
+    def get_models(self) -> List[Tuple[str, str]]:
+        return list(self.session.execute(
+            select(CarEntity.brand, CarEntity.model).distinct().order_by(CarEntity.brand, CarEntity.model)
+        ).all())
+
+    def fleet_columns(self) -> List[Tuple[int, str, int, str]]:
+        """(id, госномер, id категории, категория) всех машин парка"""
+        return list(self.session.execute(
+            select(CarEntity.id, CarEntity.license_plate, CarEntity.category_id, CarCategoryEntity.category_name)
+            .join(CarCategoryEntity, CarCategoryEntity.id == CarEntity.category_id)
+            .order_by(CarEntity.id)
+        ).all())
+
+    def count(self) -> int:
+        return entity_counters.get_or_load(
+            "cars", lambda: self.session.scalar(select(func.count()).select_from(CarEntity))
+        )
+
     def create(
             self, brand: str, model: str,
             year: int, category_id: int, license_plate: str,
@@ -38,15 +119,32 @@ class CarRepository:
             car_status_id=car_status_id
         )
         self.session.add(car_obj)
-        self.session.commit()
-        self.session.refresh(car_obj)
+        self.session.flush()
+        after_commit(self.session, lambda: entity_counters.add("cars", 1))
         return car_obj
 
+    def bulk_create(self, cars: List[dict]) -> List[str]:
+        """Вставляет машины одним многострочным INSERT; машины с уже занятым номером пропускаются.
+
+        Возвращает номера вставленных машин.
+        """
+        if not cars:
+            return []
+        plates = list(self.session.scalars(
+            postgresql.insert(CarEntity)
+            .values(cars)
+            .on_conflict_do_nothing(index_elements=[CarEntity.license_plate])
+            .returning(CarEntity.license_plate)
+        ))
+        after_commit(self.session, lambda: entity_counters.add("cars", len(plates)))
+        return plates
+
     def delete(self, car_id: int):
         car = self.session.query(CarEntity).filter(CarEntity.id == car_id).first()
         if car:
             self.session.delete(car)
-            self.session.commit()
+            self.session.flush()
+            after_commit(self.session, lambda: entity_counters.add("cars", -1))
 
     def update(
             self, car_id: int, brand: str, model: str,
@@ -54,6 +152,10 @@ class CarRepository:
             color_id: int, daily_cost: Decimal, car_status_id: int
     ) -> CarEntity:
         car_obj = self.session.get(CarEntity, car_id)
+        if car_obj.category_id != category_id:
+            # Суточные агрегаты ведутся по текущей категории машины: переносим их вместе с машиной,
+            # иначе последующие изменения ее аренд вычитались бы из строк новой категории
+            RentalDailyStatRepository(self.session).move_car(car_id, category_id)
         car_obj.brand = brand
         car_obj.model = model
         car_obj.year = year
@@ -62,15 +164,13 @@ class CarRepository:
         car_obj.color_id = color_id
         car_obj.daily_cost = daily_cost
         car_obj.car_status_id=car_status_id
-        self.session.commit()
-        self.session.refresh(car_obj)
+        self.session.flush()
         return car_obj
 
     def update_status(self, car_id: int, car_status_id: int) -> CarEntity:
         car_obj = self.session.get(CarEntity, car_id)
         car_obj.car_status_id = car_status_id
-        self.session.commit()
-        self.session.refresh(car_obj)
+        self.session.flush()
         return car_obj
 
     def filter(
@@ -82,11 +182,58 @@ class CarRepository:
             min_year: Optional[int] = None,
             max_year: Optional[int] = None,
             min_cost: Optional[Decimal] = None,
-            max_cost: Optional[Decimal] = None
+            max_cost: Optional[Decimal] = None,
+            available_from: Optional[datetime] = None,
+            available_to: Optional[datetime] = None
     ) -> List[CarEntity]:
+        query = self._filter_query(
+            brand, model, category_id, color_id, min_year, max_year, min_cost, max_cost,
+            self._availability(available_from, available_to)
+        )
+        return list(self.session.scalars(query).all())
+
+    def filter_page(
+            self,
+            limit: int,
+            after: Optional[int] = None,
+            with_total: bool = False,
+            brand: Optional[str] = None,
+            model: Optional[str] = None,
+            category_id: Optional[int] = None,
+            color_id: Optional[int] = None,
+            min_year: Optional[int] = None,
+            max_year: Optional[int] = None,
+            min_cost: Optional[Decimal] = None,
+            max_cost: Optional[Decimal] = None,
+            available_from: Optional[datetime] = None,
+            available_to: Optional[datetime] = None
+    ) -> KeysetPage:
+        query = self._filter_query(
+            brand, model, category_id, color_id, min_year, max_year, min_cost, max_cost,
+            self._availability(available_from, available_to)
+        )
+        return keyset_page(self.session, query, CarEntity.id, limit, after, with_total=with_total)
+
+    def _availability(self, available_from: Optional[datetime], available_to: Optional[datetime]) -> List:
+        if available_from is None or available_to is None:
+            return []
+        return availability_filters(self.session, available_from, available_to)
+
+    @staticmethod
+    def _filter_query(
+            brand: Optional[str] = None,
+            model: Optional[str] = None,
+            category_id: Optional[int] = None,
+            color_id: Optional[int] = None,
+            min_year: Optional[int] = None,
+            max_year: Optional[int] = None,
+            min_cost: Optional[Decimal] = None,
+            max_cost: Optional[Decimal] = None,
+            extra_filters: Sequence = ()
+    ):
         query = select(CarEntity)
 
-        filters = []
+        filters = list(extra_filters)
         if brand:
             filters.append(CarEntity.brand.ilike(f"%{brand}%"))
         if model:
@@ -107,4 +254,4 @@ class CarRepository:
         if filters:
             query = query.where(and_(*filters))
 
-        return list(self.session.scalars(query).all())
\ No newline at end of file
+        return query
\ No newline at end of file
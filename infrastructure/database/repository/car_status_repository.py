@@ -31,19 +31,17 @@ class CarStatusRepository:
     def create(self, status: str) -> CarStatusEntity:
         status_obj = CarStatusEntity(status=status)
         self.session.add(status_obj)
-        self.session.commit()
-        self.session.refresh(status_obj)
+        self.session.flush()
         return status_obj
 
     def delete(self, status_id: int):
         status = self.session.query(CarStatusEntity).filter(CarStatusEntity.id == status_id).first()
         if status:
             self.session.delete(status)
-            self.session.commit()
+            self.session.flush()
 
     def update(self, status_id: int, status: str) -> CarStatusEntity:
         status_obj = self.session.get(CarStatusEntity, status_id)
         status_obj.status = status
-        self.session.commit()
-        self.session.refresh(status_obj)
+        self.session.flush()
         return status_obj
\ No newline at end of file
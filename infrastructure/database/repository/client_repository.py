@@ -1,10 +1,13 @@
 from datetime import date
-from typing import Optional, List
+from typing import Optional, List, Iterable
 
-from sqlalchemy import select
+from sqlalchemy import select, func, and_, or_
 from sqlalchemy.orm import Session
 
+from infrastructure.cache import entity_counters, principal_cache
 from infrastructure.database.models import ClientEntity
+from infrastructure.database.pagination import KeysetPage, keyset_page
+from infrastructure.database.unit_of_work import after_commit
 
 
 class ClientRepository:
@@ -14,6 +17,9 @@ class ClientRepository:
     def get_by_id(self, client_id: int) -> Optional[ClientEntity]:
         return self.session.get(ClientEntity, client_id)
 
+    def get_by_ids(self, client_ids: Iterable[int]) -> List[ClientEntity]:
+        return list(self.session.scalars(select(ClientEntity).where(ClientEntity.id.in_(set(client_ids)))).all())
+
     def get_by_user_id(self, user_id: int) -> Optional[ClientEntity]:
         return (
             self.session.query(ClientEntity)
@@ -29,6 +35,29 @@ class ClientRepository:
             .all()
         )
 
+    def search(self, text: str, limit: int) -> List[ClientEntity]:
+        """Клиенты, у которых каждое слово запроса есть в фамилии, имени, телефоне, email или номере прав"""
+        columns = (
+            ClientEntity.surname, ClientEntity.name, ClientEntity.phone, ClientEntity.email, ClientEntity.driver_license
+        )
+        conditions = [
+            or_(*(column.icontains(word, autoescape=True) for column in columns)) for word in text.split()
+        ]
+        return list(self.session.scalars(
+            select(ClientEntity)
+            .where(and_(*conditions))
+            .order_by(ClientEntity.surname, ClientEntity.name, ClientEntity.id)
+            .limit(limit)
+        ).all())
+
+    def get_page(self, limit: int, after: Optional[int] = None, with_total: bool = False) -> KeysetPage:
+        return keyset_page(self.session, select(ClientEntity), ClientEntity.id, limit, after, with_total=with_total)
+
+    def count(self) -> int:
+        return entity_counters.get_or_load(
+            "clients", lambda: self.session.scalar(select(func.count()).select_from(ClientEntity))
+        )
+
     def create(
             self, name: str, surname: str,
             birth_date: date, phone: str, email: str,
@@ -45,8 +74,9 @@ class ClientRepository:
             user_id=user_id
         )
         self.session.add(client_obj)
-        self.session.commit()
-        self.session.refresh(client_obj)
+        self.session.flush()
+        after_commit(self.session, lambda: entity_counters.add("clients", 1))
+        after_commit(self.session, lambda: principal_cache.invalidate(user_id))
         return client_obj
 
     def update(
@@ -58,6 +88,5 @@ class ClientRepository:
         client_obj.phone = phone
         client_obj.email = email
         client_obj.driver_license = driver_license
-        self.session.commit()
-        self.session.refresh(client_obj)
+        self.session.flush()
         return client_obj
\ No newline at end of file
@@ -9,7 +9,7 @@ class RefreshTokenRepository:
 
     def add(self, token: RefreshTokenEntity):
         self.session.add(token)
-        self.session.commit()
+        self.session.flush()
 
     def delete(self, token: str):
         token_obj = (
@@ -19,4 +19,4 @@ class RefreshTokenRepository:
         
         if token_obj:
             self.session.delete(token_obj)
-            self.session.commit()
\ No newline at end of file
+            self.session.flush()
\ No newline at end of file
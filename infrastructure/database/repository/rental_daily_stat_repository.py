@@ -0,0 +1,223 @@
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import select, func, delete, update, literal, union_all, exists, case
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from infrastructure.cache.status_registry import status_registry
+from infrastructure.database.models import RentalDailyStatEntity, RentalEntity, ViolationEntity, CarEntity
+
+StatKey = Tuple[date, int, int]
+
+_COUNTERS = ("rentals_started", "rentals_completed", "revenue", "rentals_with_violations")
+
+
+class RentalSnapshot:
+    """Вклад одной аренды в суточные агрегаты"""
+    __slots__ = ("start_day", "end_day", "category_id", "car_id", "total_amount", "completed", "has_violations")
+
+    def __init__(self, start_day: date, end_day: date, category_id: int, car_id: int,
+                 total_amount: Decimal, completed: bool, has_violations: bool):
+        self.start_day = start_day
+        self.end_day = end_day
+        self.category_id = category_id
+        self.car_id = car_id
+        self.total_amount = total_amount
+        self.completed = completed
+        self.has_violations = has_violations
+
+
+class RentalDailyStatRepository:
+    """Суточные агрегаты аренд по машинам и категориям.
+
+    Аренда учитывается в дне начала (началась, выручка, есть нарушения),
+    завершение - в дне окончания. Изменения вносятся в той же транзакции,
+    что и запись аренды или нарушения.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def snapshot(self, rental: RentalEntity) -> RentalSnapshot:
+        category_id = self.session.scalar(select(CarEntity.category_id).where(CarEntity.id == rental.car_id))
+        has_violations = rental.id is not None and self.session.scalar(
+            select(exists().where(ViolationEntity.rental_id == rental.id))
+        )
+        completed_status_id = status_registry.get(self.session).completed_rental
+        return RentalSnapshot(
+            start_day=rental.start_date.date(),
+            end_day=rental.end_date.date(),
+            category_id=category_id,
+            car_id=rental.car_id,
+            total_amount=rental.total_amount,
+            completed=rental.rental_status_id == completed_status_id,
+            has_violations=bool(has_violations),
+        )
+
+    def apply_change(self, old: Optional[RentalSnapshot], new: Optional[RentalSnapshot]):
+        """Вычитает вклад аренды до изменения и добавляет вклад после"""
+        deltas = defaultdict(lambda: [0, 0, Decimal(0), 0])
+        for snapshot, sign in ((old, -1), (new, 1)):
+            if snapshot is None:
+                continue
+            start = deltas[(snapshot.start_day, snapshot.category_id, snapshot.car_id)]
+            start[0] += sign
+            start[2] += sign * Decimal(snapshot.total_amount)
+            start[3] += sign * int(snapshot.has_violations)
+            if snapshot.completed:
+                deltas[(snapshot.end_day, snapshot.category_id, snapshot.car_id)][1] += sign
+        self._add(deltas)
+
+    def add_completed(self, rentals: Iterable[Tuple[int, datetime]]):
+        """Учитывает завершение аренд, переданных парами (car_id, end_date)"""
+        rentals = list(rentals)
+        if not rentals:
+            return
+        categories = dict(self.session.execute(
+            select(CarEntity.id, CarEntity.category_id).where(CarEntity.id.in_({car_id for car_id, _ in rentals}))
+        ).all())
+        deltas = defaultdict(lambda: [0, 0, Decimal(0), 0])
+        for car_id, end_date in rentals:
+            deltas[(end_date.date(), categories[car_id], car_id)][1] += 1
+        self._add(deltas)
+
+    def sync_violation_flag(self, rental_id: int, added: bool):
+        """Учитывает первое добавленное (added) или последнее удаленное нарушение аренды"""
+        # Блокировка строки аренды не дает параллельным записям нарушений дважды учесть одну аренду
+        rental = self.session.scalars(
+            select(RentalEntity).where(RentalEntity.id == rental_id).with_for_update()
+        ).first()
+        if rental is None:
+            return
+
+        violations = self.session.scalar(
+            select(func.count()).select_from(ViolationEntity).where(ViolationEntity.rental_id == rental_id)
+        )
+        category_id = self.session.scalar(select(CarEntity.category_id).where(CarEntity.id == rental.car_id))
+        key = (rental.start_date.date(), category_id, rental.car_id)
+        if added and violations == 1:
+            self._add({key: [0, 0, Decimal(0), 1]})
+        elif not added and violations == 0:
+            self._add({key: [0, 0, Decimal(0), -1]})
+
+    def add_violation_flags(self, added: Dict[int, int]):
+        """Учитывает аренды, для которых добавленные пачкой нарушения (rental_id -> количество) - первые"""
+        if not added:
+            return
+        rentals = self.session.execute(
+            select(RentalEntity.id, RentalEntity.start_date, CarEntity.category_id, RentalEntity.car_id)
+            .join(CarEntity, CarEntity.id == RentalEntity.car_id)
+            .where(RentalEntity.id.in_(added))
+            .order_by(RentalEntity.id)
+            .with_for_update(of=RentalEntity)
+        ).all()
+        violations = dict(self.session.execute(
+            select(ViolationEntity.rental_id, func.count())
+            .where(ViolationEntity.rental_id.in_(added))
+            .group_by(ViolationEntity.rental_id)
+        ).all())
+
+        deltas = defaultdict(lambda: [0, 0, Decimal(0), 0])
+        for rental_id, start_date, category_id, car_id in rentals:
+            if violations.get(rental_id, 0) == added[rental_id]:
+                deltas[(start_date.date(), category_id, car_id)][3] += 1
+        self._add(deltas)
+
+    def _add(self, deltas: Dict[StatKey, list]):
+        values = [
+            dict(day=day, category_id=category_id, car_id=car_id, **dict(zip(_COUNTERS, counters)))
+            for (day, category_id, car_id), counters in deltas.items()
+            if any(counters)
+        ]
+        if not values:
+            return
+
+        stmt = postgresql.insert(RentalDailyStatEntity).values(values)
+        table = RentalDailyStatEntity.__table__
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.day, table.c.category_id, table.c.car_id],
+            set_={name: table.c[name] + stmt.excluded[name] for name in _COUNTERS}
+        )
+        self.session.execute(stmt)
+
+    def move_car(self, car_id: int, category_id: int):
+        """Переносит агрегаты машины в ее новую категорию.
+
+        Строки машины есть только в ее текущей категории, поэтому перенос - обновление ключа без слияния строк.
+        """
+        self.session.execute(
+            update(RentalDailyStatEntity)
+            .where(RentalDailyStatEntity.car_id == car_id)
+            .values(category_id=category_id)
+        )
+
+    def summary(self, start_day: date, end_day: date) -> Tuple[int, int, Decimal, int]:
+        row = self.session.execute(
+            select(*(func.coalesce(func.sum(RentalDailyStatEntity.__table__.c[name]), 0) for name in _COUNTERS))
+            .where(RentalDailyStatEntity.day >= start_day, RentalDailyStatEntity.day <= end_day)
+        ).one()
+        return int(row[0]), int(row[1]), Decimal(row[2]), int(row[3])
+
+    def rebuild(self, start_day: Optional[date] = None, end_day: Optional[date] = None) -> int:
+        """Пересобирает агрегаты за период (по умолчанию - за всю историю) из аренд и нарушений"""
+        completed_status_id = status_registry.get(self.session).completed_rental
+
+        start_day_expr = func.date(RentalEntity.start_date)
+        end_day_expr = func.date(RentalEntity.end_date)
+        has_violations = exists().where(ViolationEntity.rental_id == RentalEntity.id)
+
+        started = (
+            select(
+                start_day_expr.label("day"),
+                CarEntity.category_id.label("category_id"),
+                RentalEntity.car_id.label("car_id"),
+                literal(1).label("rentals_started"),
+                literal(0).label("rentals_completed"),
+                RentalEntity.total_amount.label("revenue"),
+                case((has_violations, 1), else_=0).label("rentals_with_violations"),
+            )
+            .join(CarEntity, CarEntity.id == RentalEntity.car_id)
+        )
+        completed = (
+            select(
+                end_day_expr.label("day"),
+                CarEntity.category_id.label("category_id"),
+                RentalEntity.car_id.label("car_id"),
+                literal(0).label("rentals_started"),
+                literal(1).label("rentals_completed"),
+                literal(0).label("revenue"),
+                literal(0).label("rentals_with_violations"),
+            )
+            .join(CarEntity, CarEntity.id == RentalEntity.car_id)
+            .where(RentalEntity.rental_status_id == completed_status_id)
+        )
+
+        cleanup = delete(RentalDailyStatEntity)
+        if start_day is not None:
+            started = started.where(RentalEntity.start_date >= start_day)
+            completed = completed.where(RentalEntity.end_date >= start_day)
+            cleanup = cleanup.where(RentalDailyStatEntity.day >= start_day)
+        if end_day is not None:
+            started = started.where(RentalEntity.start_date < end_day + timedelta(days=1))
+            completed = completed.where(RentalEntity.end_date < end_day + timedelta(days=1))
+            cleanup = cleanup.where(RentalDailyStatEntity.day <= end_day)
+
+        contributions = union_all(started, completed).subquery()
+        rollup = (
+            select(
+                contributions.c.day, contributions.c.category_id, contributions.c.car_id,
+                *(func.sum(contributions.c[name]) for name in _COUNTERS)
+            )
+            .group_by(contributions.c.day, contributions.c.category_id, contributions.c.car_id)
+        )
+
+        self.session.execute(cleanup)
+        result = self.session.execute(
+            RentalDailyStatEntity.__table__.insert().from_select(
+                ["day", "category_id", "car_id", *_COUNTERS], rollup
+            )
+        )
+        return result.rowcount
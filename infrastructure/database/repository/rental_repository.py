@@ -1,20 +1,40 @@
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from decimal import Decimal
-from typing import Optional, List
+from typing import Optional, List, Tuple, Iterator, Iterable
 
-from sqlalchemy import select, and_, func
-from sqlalchemy.orm import Session
+from sqlalchemy import select, and_, func, update, exists, RowMapping
+from sqlalchemy.orm import Session, joinedload, selectinload
 
-from infrastructure.database.models import RentalEntity, ViolationEntity, ClientEntity
+from infrastructure.cache import entity_counters
+from infrastructure.database.availability import active_rental_overlaps, rental_overlaps
+from infrastructure.database.models import RentalEntity, ViolationEntity, ClientEntity, CarEntity
+from infrastructure.database.pagination import KeysetPage, keyset_page
+from infrastructure.database.repository.rental_daily_stat_repository import RentalDailyStatRepository
+from infrastructure.database.unit_of_work import after_commit
 
 
 class RentalRepository:
     def __init__(self, session: Session):
         self.session = session
+        self.stats = RentalDailyStatRepository(session)
 
     def get_by_id(self, rental_id: int) -> Optional[RentalEntity]:
         return self.session.get(RentalEntity, rental_id)
 
+    def get_bundle(self, rental_id: int) -> Optional[RentalEntity]:
+        # Аренда со статусом, машиной и клиентом одним JOIN, нарушения с типами - вторым запросом (select-in)
+        query = (
+            select(RentalEntity)
+            .where(RentalEntity.id == rental_id)
+            .options(
+                joinedload(RentalEntity.rental_status),
+                joinedload(RentalEntity.car),
+                joinedload(RentalEntity.client),
+                selectinload(RentalEntity.violations).joinedload(ViolationEntity.violation_type),
+            )
+        )
+        return self.session.scalars(query).unique().first()
+
     def get_by_user_id(self, user_id: int) -> List[RentalEntity]:
         return (
             self.session.query(RentalEntity)
@@ -23,6 +43,17 @@ class RentalRepository:
             .all()
         )
 
+    def get_user_page(
+            self, user_id: int, limit: int, after: Optional[int] = None, with_total: bool = False
+    ) -> KeysetPage:
+        query = (
+            select(RentalEntity)
+            .join(ClientEntity, RentalEntity.client_id == ClientEntity.id)
+            .where(ClientEntity.user_id == user_id)
+        )
+        # Свои аренды пользователь видит начиная с последних
+        return keyset_page(self.session, query, RentalEntity.id, limit, after, descending=True, with_total=with_total)
+
     def get_by_user_and_id(self, user_id: int, rental_id: int):
         return (
             self.session.query(RentalEntity)
@@ -42,6 +73,33 @@ class RentalRepository:
             .all()
         )
 
+    def iter_rows(self, batch_size: int) -> Iterator[RowMapping]:
+        # Строки таблицы без ORM-объектов (identity map не растет), пачками через серверный курсор
+        query = select(RentalEntity.__table__).order_by(RentalEntity.id).execution_options(yield_per=batch_size)
+        yield from self.session.execute(query).mappings()
+
+    def periods_of_cars(
+            self, car_ids: Iterable[int], start: datetime, end: datetime
+    ) -> List[Tuple[int, int, datetime, datetime]]:
+        """Аренды машин (id, car_id, start_date, end_date) любого статуса, пересекающиеся с периодом [start, end)"""
+        return [tuple(row) for row in self.session.execute(
+            select(RentalEntity.id, RentalEntity.car_id, RentalEntity.start_date, RentalEntity.end_date)
+            .where(RentalEntity.car_id.in_(set(car_ids)), rental_overlaps(start, end))
+        )]
+
+    def has_overlapping(
+            self, car_id: int, start_date: datetime, end_date: datetime, exclude_rental_id: Optional[int] = None
+    ) -> bool:
+        conditions = [RentalEntity.car_id == car_id, active_rental_overlaps(self.session, start_date, end_date)]
+        if exclude_rental_id is not None:
+            conditions.append(RentalEntity.id != exclude_rental_id)
+        return self.session.scalar(select(exists().where(*conditions)))
+
+    def count(self) -> int:
+        return entity_counters.get_or_load(
+            "rentals", lambda: self.session.scalar(select(func.count()).select_from(RentalEntity))
+        )
+
     def create(
             self, client_id: int, car_id: int,
             start_date: datetime, end_date: datetime,
@@ -56,15 +114,18 @@ class RentalRepository:
             rental_status_id=rental_status_id
         )
         self.session.add(rental_obj)
-        self.session.commit()
-        self.session.refresh(rental_obj)
+        self.session.flush()
+        self.stats.apply_change(None, self.stats.snapshot(rental_obj))
+        after_commit(self.session, lambda: entity_counters.add("rentals", 1))
         return rental_obj
 
     def delete(self, rental_id: int):
         rental = self.session.query(RentalEntity).filter(RentalEntity.id == rental_id).first()
         if rental:
+            self.stats.apply_change(self.stats.snapshot(rental), None)
             self.session.delete(rental)
-            self.session.commit()
+            self.session.flush()
+            after_commit(self.session, lambda: entity_counters.add("rentals", -1))
 
     def update(
             self, rental_id: int, car_id: int,
@@ -72,31 +133,64 @@ class RentalRepository:
             total_amount: Decimal, rental_status_id: int
     ) -> RentalEntity:
         rental_obj = self.session.get(RentalEntity, rental_id)
+        old = self.stats.snapshot(rental_obj)
         rental_obj.car_id = car_id
         rental_obj.start_date = start_date
         rental_obj.end_date = end_date
         rental_obj.total_amount = total_amount
         rental_obj.rental_status_id = rental_status_id
-        self.session.commit()
-        self.session.refresh(rental_obj)
+        self.stats.apply_change(old, self.stats.snapshot(rental_obj))
+        self.session.flush()
         return rental_obj
 
-    def get_expired_active_rentals(self, active_status_id: int) -> List[RentalEntity]:
+    def complete_expired_batch(
+            self, active_status_id: int, completed_status_id: int,
+            available_car_status_id: int, batch_size: int
+    ) -> Tuple[int, int]:
+        """Завершает до batch_size просроченных аренд и освобождает их машины (коммит - за вызывающим)"""
         now = datetime.now()
-        return (
-            self.session.query(RentalEntity)
-            .filter(
+        expired_ids = (
+            select(RentalEntity.id)
+            .where(
                 RentalEntity.rental_status_id == active_status_id,
                 RentalEntity.end_date < now
             )
-            .all()
+            .order_by(RentalEntity.id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
         )
+        completed = self.session.execute(
+            update(RentalEntity)
+            .where(RentalEntity.id.in_(expired_ids))
+            .values(rental_status_id=completed_status_id)
+            .returning(RentalEntity.car_id, RentalEntity.end_date)
+            .execution_options(synchronize_session=False)
+        ).all()
+        car_ids = [car_id for car_id, _ in completed]
+        self.stats.add_completed(completed)
+
+        released_cars = 0
+        if car_ids:
+            # Машину не освобождаем, если у нее есть другая активная аренда
+            has_active_rental = exists().where(
+                RentalEntity.car_id == CarEntity.id,
+                RentalEntity.rental_status_id == active_status_id
+            )
+            released_cars = self.session.execute(
+                update(CarEntity)
+                .where(CarEntity.id.in_(set(car_ids)), ~has_active_rental)
+                .values(car_status_id=available_car_status_id)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+
+        return len(car_ids), released_cars
 
     def update_status(self, rental_id: int, rental_status_id: int) -> RentalEntity:
         rental_obj = self.session.get(RentalEntity, rental_id)
+        old = self.stats.snapshot(rental_obj)
         rental_obj.rental_status_id = rental_status_id
-        self.session.commit()
-        self.session.refresh(rental_obj)
+        self.stats.apply_change(old, self.stats.snapshot(rental_obj))
+        self.session.flush()
         return rental_obj
 
     def filter(
@@ -104,6 +198,21 @@ class RentalRepository:
             car_id: Optional[int] = None,
             client_id: Optional[int] = None
     ) -> List[RentalEntity]:
+        return list(self.session.scalars(self._filter_query(car_id, client_id)).all())
+
+    def filter_page(
+            self,
+            limit: int,
+            after: Optional[int] = None,
+            with_total: bool = False,
+            car_id: Optional[int] = None,
+            client_id: Optional[int] = None
+    ) -> KeysetPage:
+        query = self._filter_query(car_id, client_id)
+        return keyset_page(self.session, query, RentalEntity.id, limit, after, with_total=with_total)
+
+    @staticmethod
+    def _filter_query(car_id: Optional[int] = None, client_id: Optional[int] = None):
         query = select(RentalEntity)
 
         filters = []
@@ -115,31 +224,22 @@ class RentalRepository:
         if filters:
             query = query.where(and_(*filters))
 
-        return list(self.session.scalars(query).all())
-
-    def statistic_get_rentals(self, start_date: datetime, end_date: datetime):
-        base_query = (
-            select(RentalEntity)
-            .where(RentalEntity.start_date >= start_date)
-            .where(RentalEntity.end_date <= end_date)
+        return query
+
+    def analytics_columns(self, start_date: datetime, end_date: datetime) -> List[Tuple[int, datetime, datetime, Decimal]]:
+        """(car_id, начало, окончание, сумма) аренд, пересекающихся с периодом"""
+        return list(self.session.execute(
+            select(RentalEntity.car_id, RentalEntity.start_date, RentalEntity.end_date, RentalEntity.total_amount)
+            .where(RentalEntity.start_date < end_date, RentalEntity.end_date > start_date)
+        ).all())
+
+    def iter_statistic_rows(self, start_day: date, end_day: date, batch_size: int) -> Iterator[RowMapping]:
+        # Тот же период, что и у суточных агрегатов: аренды, начавшиеся с start_day по end_day включительно
+        query = (
+            select(RentalEntity.__table__)
+            .where(RentalEntity.start_date >= start_day)
+            .where(RentalEntity.start_date < end_day + timedelta(days=1))
+            .order_by(RentalEntity.start_date, RentalEntity.id)
+            .execution_options(yield_per=batch_size)
         )
-        rentals = list(self.session.scalars(base_query).all())
-
-        total_count = len(rentals)
-
-        if total_count == 0:
-            return rentals, 0, 0
-
-        violation_count_query = (
-            select(func.count(func.distinct(ViolationEntity.rental_id)))
-            .join(RentalEntity, RentalEntity.id == ViolationEntity.rental_id)
-            .where(RentalEntity.start_date >= start_date)
-            .where(RentalEntity.end_date <= end_date)
-        )
-
-        violation_count = self.session.scalar(violation_count_query) or 0
-
-        percent_with_violations = (violation_count / total_count) * 100
-        percent_without_violations = 100 - percent_with_violations
-
-        return rentals, percent_with_violations, percent_without_violations
\ No newline at end of file
+        yield from self.session.execute(query).mappings()
\ No newline at end of file
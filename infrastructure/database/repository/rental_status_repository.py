@@ -31,19 +31,17 @@ class RentalStatusRepository:
     def create(self, status: str) -> RentalStatusEntity:
         status_obj = RentalStatusEntity(status=status)
         self.session.add(status_obj)
-        self.session.commit()
-        self.session.refresh(status_obj)
+        self.session.flush()
         return status_obj
 
     def delete(self, status_id: int):
         status = self.session.query(RentalStatusEntity).filter(RentalStatusEntity.id == status_id).first()
         if status:
             self.session.delete(status)
-            self.session.commit()
+            self.session.flush()
 
     def update(self, status_id: int, status: str) -> RentalStatusEntity:
         status_obj = self.session.get(RentalStatusEntity, status_id)
         status_obj.status = status
-        self.session.commit()
-        self.session.refresh(status_obj)
+        self.session.flush()
         return status_obj
\ No newline at end of file
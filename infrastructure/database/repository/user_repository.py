@@ -1,6 +1,11 @@
-from sqlalchemy.orm import Session
+from typing import Optional, Tuple
 
-from infrastructure.database.models import UserEntity
+from sqlalchemy import select
+from sqlalchemy.orm import Session, joinedload
+
+from infrastructure.cache import principal_cache
+from infrastructure.database.models import UserEntity, ClientEntity
+from infrastructure.database.unit_of_work import after_commit
 
 
 class UserRepository:
@@ -8,7 +13,21 @@ class UserRepository:
         self.session = session
 
     def get_by_id(self, user_id: int) -> UserEntity | None:
-        return self.session.query(UserEntity).filter(UserEntity.id == user_id).first()
+        return (
+            self.session.query(UserEntity)
+            .options(joinedload(UserEntity.role))
+            .filter(UserEntity.id == user_id)
+            .first()
+        )
+
+    def get_with_client_id(self, user_id: int) -> Tuple[Optional[UserEntity], Optional[int]]:
+        row = self.session.execute(
+            select(UserEntity, ClientEntity.id)
+            .outerjoin(ClientEntity, ClientEntity.user_id == UserEntity.id)
+            .options(joinedload(UserEntity.role))
+            .where(UserEntity.id == user_id)
+        ).first()
+        return (row[0], row[1]) if row else (None, None)
 
     def get_by_username(self, username: str) -> UserEntity | None:
         return (
@@ -19,6 +38,6 @@ class UserRepository:
 
     def create(self, user: UserEntity) -> UserEntity:
         self.session.add(user)
-        self.session.commit()
-        self.session.refresh(user)
+        self.session.flush()
+        after_commit(self.session, lambda: principal_cache.invalidate(user.id))
         return user
\ No newline at end of file
@@ -1,15 +1,21 @@
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional, List
+from collections import Counter
+from typing import Optional, List, Iterator, Tuple
 
+from sqlalchemy import select, RowMapping
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import Session
 
 from infrastructure.database.models import ViolationEntity, RentalEntity, ClientEntity
+from infrastructure.database.pagination import KeysetPage, keyset_page
+from infrastructure.database.repository.rental_daily_stat_repository import RentalDailyStatRepository
 
 
 class ViolationRepository:
     def __init__(self, session: Session):
         self.session = session
+        self.stats = RentalDailyStatRepository(session)
 
     def get_by_id(self, violation_id: int) -> Optional[ViolationEntity]:
         return self.session.get(ViolationEntity, violation_id)
@@ -24,6 +30,25 @@ class ViolationRepository:
             .all()
         )
 
+    def iter_rows(self, batch_size: int) -> Iterator[RowMapping]:
+        # Строки таблицы без ORM-объектов (identity map не растет), пачками через серверный курсор
+        query = select(ViolationEntity.__table__).order_by(ViolationEntity.id).execution_options(yield_per=batch_size)
+        yield from self.session.execute(query).mappings()
+
+    def get_user_page(
+            self, user_id: int, limit: int, after: Optional[int] = None, with_total: bool = False
+    ) -> KeysetPage:
+        query = (
+            select(ViolationEntity)
+            .join(ViolationEntity.rental)
+            .join(RentalEntity.client)
+            .where(ClientEntity.user_id == user_id)
+        )
+        return keyset_page(
+            self.session, query, ViolationEntity.id, limit, after,
+            sort_column=ViolationEntity.violation_date, descending=True, with_total=with_total
+        )
+
     def get_by_rental_id(self, rental_id: int) -> List[ViolationEntity]:
         return (
             self.session.query(ViolationEntity)
@@ -44,6 +69,13 @@ class ViolationRepository:
             .first()
         )
 
+    def fine_columns(self, start_date: datetime, end_date: datetime) -> List[Tuple[Decimal, bool]]:
+        """(штраф, оплачен) нарушений за период"""
+        return list(self.session.execute(
+            select(ViolationEntity.fine_amount, ViolationEntity.is_paid)
+            .where(ViolationEntity.violation_date >= start_date, ViolationEntity.violation_date < end_date)
+        ).all())
+
     def create(
             self, rental_id: int, violation_type_id: int,
             description: str, fine_amount: Decimal,
@@ -58,15 +90,32 @@ class ViolationRepository:
             is_paid=is_paid
         )
         self.session.add(violation_obj)
-        self.session.commit()
-        self.session.refresh(violation_obj)
+        self.session.flush()
+        self.stats.sync_violation_flag(rental_id, added=True)
         return violation_obj
 
+    def bulk_create(self, violations: List[dict]) -> List[str]:
+        """Вставляет нарушения одним многострочным INSERT; нарушения с уже загруженным external_id пропускаются.
+
+        Возвращает external_id вставленных нарушений.
+        """
+        if not violations:
+            return []
+        inserted = self.session.execute(
+            postgresql.insert(ViolationEntity)
+            .values(violations)
+            .on_conflict_do_nothing(index_elements=[ViolationEntity.external_id])
+            .returning(ViolationEntity.external_id, ViolationEntity.rental_id)
+        ).all()
+        self.stats.add_violation_flags(Counter(rental_id for _, rental_id in inserted))
+        return [external_id for external_id, _ in inserted]
+
     def delete(self, violation_id: int):
         violation = self.session.query(ViolationEntity).filter(ViolationEntity.id == violation_id).first()
         if violation:
             self.session.delete(violation)
-            self.session.commit()
+            self.session.flush()
+            self.stats.sync_violation_flag(violation.rental_id, added=False)
 
     def update(
             self, violation_id: int, rental_id: int,
@@ -75,12 +124,16 @@ class ViolationRepository:
             is_paid: bool
     ) -> ViolationEntity:
         violation_obj = self.session.get(ViolationEntity, violation_id)
+        previous_rental_id = violation_obj.rental_id
         violation_obj.rental_id = rental_id
         violation_obj.violation_type_id = violation_type_id
         violation_obj.description = description
         violation_obj.fine_amount = fine_amount
         violation_obj.violation_date = violation_date
         violation_obj.is_paid = is_paid
-        self.session.commit()
-        self.session.refresh(violation_obj)
+        if previous_rental_id != rental_id:
+            self.session.flush()
+            self.stats.sync_violation_flag(previous_rental_id, added=False)
+            self.stats.sync_violation_flag(rental_id, added=True)
+        self.session.flush()
         return violation_obj
\ No newline at end of file
@@ -30,21 +30,19 @@ class ViolationTypeRepository:
             description=description,
         )
         self.session.add(v_type_obj)
-        self.session.commit()
-        self.session.refresh(v_type_obj)
+        self.session.flush()
         return v_type_obj
 
     def delete(self, type_id: int):
         v_type = self.session.query(ViolationTypeEntity).filter(ViolationTypeEntity.id == type_id).first()
         if v_type:
             self.session.delete(v_type)
-            self.session.commit()
+            self.session.flush()
 
     def update(self, type_id: int, type_name: str, default_fine: Decimal, description: str) -> ViolationTypeEntity:
         type_obj = self.session.get(ViolationTypeEntity, type_id)
         type_obj.type_name = type_name
         type_obj.default_fine = default_fine
         type_obj.description = description
-        self.session.commit()
-        self.session.refresh(type_obj)
+        self.session.flush()
         return type_obj
\ No newline at end of file
@@ -0,0 +1,69 @@
+import re
+from typing import Callable, List
+
+from sqlalchemy import Engine, text
+
+from infrastructure.cache.status_registry import StatusIds
+
+
+class StatusIndex:
+    """Частичный индекс аренд с условием «статус аренды = служебный статус».
+
+    Id статусов - данные справочника: статус можно пересоздать через админку, поэтому условие
+    не зашивается в миграцию. Индекс создается под текущий id из status_registry, id входит в имя.
+    """
+    __slots__ = ("name", "columns", "status")
+
+    def __init__(self, name: str, columns: str, status: Callable[[StatusIds], int]):
+        self.name = name
+        self.columns = columns
+        self.status = status
+
+    def index_name(self, ids: StatusIds) -> str:
+        return f"{self.name}_{self.status(ids)}"
+
+    def matches(self, index_name: str) -> bool:
+        """Индекс этого вида под любой id статуса"""
+        return re.fullmatch(rf"{re.escape(self.name)}_\d+", index_name) is not None
+
+
+# Завершение просроченных аренд: активные аренды по окончанию
+ACTIVE_RENTALS_END_DATE = StatusIndex("ix_rentals_active_end_date", "(end_date)", lambda ids: ids.active_rental)
+# Проверка пересечений при бронировании; car_id в GiST - через btree_gist
+ACTIVE_RENTALS_CAR_PERIOD = StatusIndex(
+    "ix_rentals_active_car_id_period", "USING gist (car_id, tsrange(start_date, end_date, '[)'))",
+    lambda ids: ids.active_rental
+)
+
+STATUS_INDEXES: List[StatusIndex] = [ACTIVE_RENTALS_END_DATE, ACTIVE_RENTALS_CAR_PERIOD]
+
+
+def sync_status_indexes(engine: Engine, ids: StatusIds) -> List[str]:
+    """Создает частичные индексы под текущие id статусов и удаляет индексы под прежние id.
+
+    CREATE INDEX CONCURRENTLY не блокирует запись в rentals, но ждет завершения уже открытых
+    транзакций и не выполняется внутри транзакции - поэтому отдельное соединение в autocommit.
+    Возвращает имена созданных индексов.
+    """
+    created = []
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        # Прерванная сборка CONCURRENTLY оставляет невалидный индекс - он пересоздается
+        existing = dict(connection.execute(text(
+            "SELECT index_class.relname, pg_index.indisvalid FROM pg_index "
+            "JOIN pg_class index_class ON index_class.oid = pg_index.indexrelid "
+            "JOIN pg_class table_class ON table_class.oid = pg_index.indrelid "
+            "WHERE table_class.relname = 'rentals'"
+        )).all())
+        for index in STATUS_INDEXES:
+            name = index.index_name(ids)
+            for stale in [other for other, valid in existing.items()
+                          if index.matches(other) and (other != name or not valid)]:
+                connection.execute(text(f'DROP INDEX CONCURRENTLY IF EXISTS "{stale}"'))
+                del existing[stale]
+            if name not in existing:
+                connection.execute(text(
+                    f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{name}" ON rentals {index.columns} '
+                    f"WHERE rental_status_id = {int(index.status(ids))}"
+                ))
+                created.append(name)
+    return created
@@ -0,0 +1,46 @@
+from typing import Callable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, SessionTransaction
+
+_AFTER_COMMIT_KEY = "after_commit_callbacks"
+
+
+class UnitOfWork:
+    """Транзакция use case'а.
+
+    Репозитории только flush'ат изменения (INSERT ... RETURNING выдает id и серверные значения),
+    фиксирует их один commit на выходе из блока with. При исключении транзакция откатывается.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def __enter__(self) -> "UnitOfWork":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.session.commit()
+        else:
+            self.session.rollback()
+            # Откат без начатой транзакции не вызывает событий сессии
+            self.session.info.pop(_AFTER_COMMIT_KEY, None)
+
+
+def after_commit(session: Session, callback: Callable[[], None]):
+    """Откладывает callback (обновление кэшей) до коммита транзакции; при откате callback отбрасывается"""
+    session.info.setdefault(_AFTER_COMMIT_KEY, []).append(callback)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit(session: Session):
+    for callback in session.info.pop(_AFTER_COMMIT_KEY, ()):
+        callback()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_after_commit(session: Session, previous_transaction: SessionTransaction):
+    # Откат savepoint'а не отменяет внешнюю транзакцию
+    if not previous_transaction.nested:
+        session.info.pop(_AFTER_COMMIT_KEY, None)
@@ -0,0 +1,22 @@
+from threading import Lock
+from typing import Callable, Dict
+
+
+class MetricsRegistry:
+    """Реестр источников метрик: каждый компонент регистрирует функцию, возвращающую снимок своих метрик"""
+
+    def __init__(self):
+        self._providers: Dict[str, Callable[[], dict]] = {}
+        self._lock = Lock()
+
+    def register(self, name: str, provider: Callable[[], dict]):
+        with self._lock:
+            self._providers[name] = provider
+
+    def collect(self) -> dict:
+        with self._lock:
+            providers = dict(self._providers)
+        return {name: provider() for name, provider in providers.items()}
+
+
+metrics_registry = MetricsRegistry()
@@ -1,6 +1,9 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from starlette.concurrency import run_in_threadpool
 
-from application.admin.routers import documentation_router, statistic_router
+from application.admin.routers import documentation_router, statistic_router, metrics_router
 from application.auth.routers import auth
 from application.car.routers import car_router
 from application.car_category.routers import car_category_router
@@ -15,8 +18,36 @@ from application.client.routers import client_router
 # Фронтенд роутеры
 from application.frontend.routers import frontend_router, cars_router, profile_router, rentals_router, violations_router
 from application.frontend.routers import admin_router, admin_crud_router
+from application.frontend.gateway import FRONTEND_API_MODE
+from application.frontend.http_client import start_http_client, close_http_client
+from application.rental.scheduler import rental_expiration_scheduler, RENTAL_EXPIRATION_ENABLED
+from infrastructure.cache import reference_data_listener, status_registry
+from infrastructure.database.database_session import SessionLocal
+from infrastructure.database.leak_detector import ConnectionLeakMiddleware
+
+
+def load_status_registry():
+    # Без служебных статусов аренды не работают - приложение не должно стартовать
+    with SessionLocal() as db:
+        status_registry.load(db)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await run_in_threadpool(load_status_registry)
+    if FRONTEND_API_MODE == "http":
+        await start_http_client()
+    if RENTAL_EXPIRATION_ENABLED:
+        await rental_expiration_scheduler.start()
+    await reference_data_listener.start()
+    yield
+    await reference_data_listener.stop()
+    await rental_expiration_scheduler.stop()
+    await close_http_client()
+
 
-app = FastAPI(title="Car rental", docs_url=None, redoc_url=None)
+app = FastAPI(title="Car rental", docs_url=None, redoc_url=None, lifespan=lifespan)
+app.add_middleware(ConnectionLeakMiddleware)
 
 # API роутеры
 app.include_router(auth.router)
@@ -31,6 +62,7 @@ app.include_router(violation_router.router)
 app.include_router(client_router.router)
 app.include_router(documentation_router.router)
 app.include_router(statistic_router.router)
+app.include_router(metrics_router.router)
 
 # Фронтенд роутеры
 app.include_router(frontend_router.router)
@@ -0,0 +1,103 @@
+import argparse
+import sys
+from datetime import date
+
+from application.bulk_import import ImportFormat, IMPORT_BATCH_SIZE, detect_format, read_rows
+from application.car.usecases import ImportCarsUseCase
+from application.violation.usecases import IngestViolationsUseCase
+from infrastructure.cache import status_registry
+from infrastructure.database.database_session import SessionLocal, engine
+from infrastructure.database.index_check import check_index_usage
+from infrastructure.database.repository import RentalDailyStatRepository
+from infrastructure.database.status_indexes import sync_status_indexes
+from infrastructure.database.unit_of_work import UnitOfWork
+
+
+def rebuild_rental_stats(args):
+    with SessionLocal() as db, UnitOfWork(db):
+        rows = RentalDailyStatRepository(db).rebuild(args.start, args.end)
+    print(f"Суточных агрегатов пересобрано: {rows}")
+
+
+def explain_indexes(args):
+    with SessionLocal() as db:
+        results = check_index_usage(db)
+
+    for result in results:
+        mark = "OK  " if result.ok else "FAIL"
+        used = ", ".join(sorted(result.used)) or "seq scan"
+        print(f"{mark} {result.check.name}: ожидается {result.index}, план без seq scan использует {used}")
+
+    if not all(result.ok for result in results):
+        sys.exit(1)
+
+
+def sync_indexes(args):
+    with SessionLocal() as db:
+        ids = status_registry.load(db)
+    created = sync_status_indexes(engine, ids)
+    print(f"Создано частичных индексов: {', '.join(created) or 'нет, все на месте'}")
+
+
+def _run_import(args, use_case_cls):
+    import_format = args.format or detect_format(args.file)
+    if import_format is None:
+        sys.exit("Не удалось определить формат файла, укажите --format csv или --format ndjson")
+
+    with open(args.file, encoding="utf-8-sig", newline="") as stream, SessionLocal() as db:
+        result = use_case_cls(db, batch_size=args.batch_size).execute(read_rows(stream, import_format))
+
+    for error in result.errors:
+        print(f"Строка {error.row}: {'; '.join(error.errors)}")
+    print(
+        f"Строк: {result.total}, загружено: {result.imported}, загружено ранее: {result.skipped}, "
+        f"с ошибками: {result.failed}"
+    )
+
+    if result.failed:
+        sys.exit(1)
+
+
+def import_cars(args):
+    _run_import(args, ImportCarsUseCase)
+
+
+def import_violations(args):
+    _run_import(args, IngestViolationsUseCase)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Служебные команды Car rental")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    rebuild = commands.add_parser("rebuild-rental-stats", help="Пересобрать суточные агрегаты аренд")
+    rebuild.add_argument("--from", dest="start", type=date.fromisoformat, help="Первый день (YYYY-MM-DD)")
+    rebuild.add_argument("--to", dest="end", type=date.fromisoformat, help="Последний день (YYYY-MM-DD)")
+    rebuild.set_defaults(handler=rebuild_rental_stats)
+
+    explain = commands.add_parser(
+        "explain-indexes", help="Проверить по EXPLAIN (без seq scan), что индексы подходят к горячим запросам"
+    )
+    explain.set_defaults(handler=explain_indexes)
+
+    sync = commands.add_parser(
+        "sync-status-indexes", help="Создать частичные индексы по текущим id служебных статусов"
+    )
+    sync.set_defaults(handler=sync_indexes)
+
+    cars = commands.add_parser("import-cars", help="Загрузить машины из CSV или NDJSON")
+    cars.set_defaults(handler=import_cars)
+    violations = commands.add_parser("import-violations", help="Загрузить нарушения из файла камер (CSV или NDJSON)")
+    violations.set_defaults(handler=import_violations)
+    for command in (cars, violations):
+        command.add_argument("file", help="Путь к файлу")
+        command.add_argument("--format", type=ImportFormat, choices=list(ImportFormat), metavar="{csv,ndjson}",
+                             help="По умолчанию - по расширению")
+        command.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE, help="Строк в одной транзакции")
+
+    args = parser.parse_args()
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
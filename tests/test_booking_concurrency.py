@@ -0,0 +1,110 @@
+import os
+
+import pytest
+
+if not os.getenv("TEST_DATABASE_URL"):
+    pytest.skip("Нужна тестовая PostgreSQL: задайте TEST_DATABASE_URL", allow_module_level=True)
+
+import random
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import List, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import select, and_
+from sqlalchemy.orm import aliased
+
+from application.auth.schemas import UserCreate
+from application.auth.usecases import RegisterUserUseCase
+from application.car.schemas import CarCreate
+from application.car.usecases import CreateCarUseCase
+from application.client.schemas import ClientCreate
+from application.client.usecases import CreateClientUseCase
+from application.rental.schemas import RentalCreate
+from application.rental.usecases import CreateRentalUseCase, DeleteRentalUseCase
+from infrastructure.database.models import RentalEntity
+
+CARS = 3
+# Не больше пула соединений (DB_POOL_SIZE + DB_MAX_OVERFLOW): иначе потоки ждут соединения, а не блокировки машины
+WORKERS = 12
+ATTEMPTS = 300
+WINDOW_HOURS = 10 * 24
+
+
+@pytest.fixture
+def client_id(database, reference_data) -> int:
+    with database.SessionLocal() as db:
+        user = RegisterUserUseCase(db).register_user(UserCreate(username="booking-client", password="booking-client"))
+        client = CreateClientUseCase(db).execute(ClientCreate(
+            name="Иван", surname="Иванов", birth_date=date(1990, 1, 1), phone="79990000000",
+            email="booking@example.com", driver_license="7700 000000",
+            license_expiry_date=date.today() + timedelta(days=3650), user_id=user.id,
+        ))
+    return client.id
+
+
+@pytest.fixture
+def car_ids(database, reference_data) -> List[int]:
+    with database.SessionLocal() as db:
+        return [
+            CreateCarUseCase(db).execute(CarCreate(
+                brand="Lada", model="Vesta", year=2022, category_id=reference_data.category_id,
+                license_plate=f"А{number:03d}АА77", color_id=reference_data.color_id, daily_cost=Decimal("1000"),
+                car_status_id=reference_data.available_car_status_id,
+            )).id
+            for number in range(CARS)
+        ]
+
+
+@pytest.fixture
+def booked(database) -> List[int]:
+    """Id созданных аренд; после теста аренды удаляются, чтобы не искажать статистику для других тестов"""
+    rental_ids: List[int] = []
+    yield rental_ids
+    with database.SessionLocal() as db:
+        for rental_id in rental_ids:
+            DeleteRentalUseCase(db).execute(rental_id)
+
+
+def test_parallel_bookings_never_overlap(database, client_id, car_ids, booked):
+    # Много коротких окон на несколько машин: большая часть попыток конкурирует за одни и те же периоды
+    window_start = datetime.now().replace(minute=0, second=0, microsecond=0) + timedelta(days=1)
+    rng = random.Random(22)
+    bookings = []
+    for _ in range(ATTEMPTS):
+        start = window_start + timedelta(hours=rng.randrange(WINDOW_HOURS))
+        bookings.append(RentalCreate(
+            client_id=client_id, car_id=rng.choice(car_ids), start_date=start,
+            end_date=start + timedelta(hours=rng.randint(1, 72)), total_amount=Decimal("1000"),
+        ))
+
+    def book(rental: RentalCreate) -> Optional[int]:
+        with database.SessionLocal() as db:
+            try:
+                return CreateRentalUseCase(db).execute(rental).id
+            except HTTPException as exc:
+                if exc.status_code == status.HTTP_409_CONFLICT:
+                    return None
+                raise
+
+    with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        booked.extend(rental_id for rental_id in pool.map(book, bookings) if rental_id is not None)
+
+    # Без броней или без отказов тест ничего не проверил бы
+    assert booked
+    assert len(booked) < ATTEMPTS
+
+    first, second = aliased(RentalEntity), aliased(RentalEntity)
+    with database.SessionLocal() as db:
+        overlaps = db.execute(
+            select(first.id, second.id)
+            .join(second, and_(
+                first.car_id == second.car_id,
+                first.id < second.id,
+                first.start_date < second.end_date,
+                first.end_date > second.start_date,
+            ))
+            .where(first.car_id.in_(car_ids))
+        ).all()
+    assert overlaps == []
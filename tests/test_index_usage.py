@@ -0,0 +1,110 @@
+import os
+
+import pytest
+
+if not os.getenv("TEST_DATABASE_URL"):
+    pytest.skip("Нужна тестовая PostgreSQL: задайте TEST_DATABASE_URL", allow_module_level=True)
+
+from sqlalchemy import text
+
+from infrastructure.cache import status_registry
+from infrastructure.cache.status_registry import StatusIds, AVAILABLE_CAR_STATUS
+from infrastructure.database.index_check import check_index_usage
+from infrastructure.database.status_indexes import STATUS_INDEXES, sync_status_indexes
+
+
+# Объемы, при которых выбор индекса определяется селективностью условий, а не равной стоимостью планов
+# пустых таблиц. Строки генерируются одним INSERT ... SELECT: через use case'ы это минуты
+HOT_DATA = [
+    "INSERT INTO car_categories (category_name, description, base_cost) "
+    "SELECT 'Категория ' || n, '', 1000 FROM generate_series(1, 9) n",
+    "INSERT INTO car_colors (color, hex) SELECT 'Цвет ' || n, '#' || lpad(n::text, 6, '0') FROM generate_series(1, 19) n",
+    "INSERT INTO users (username, password_hash, role_id) "
+    "SELECT 'volume-' || n, '!', (SELECT id FROM roles WHERE role_name = 'user') FROM generate_series(1, 2000) n",
+    "INSERT INTO clients (name, surname, birth_date, phone, email, driver_license, license_expiry_date, user_id) "
+    "SELECT 'Клиент', username, '1990-01-01', '7' || lpad(id::text, 10, '0'), username || '@example.com', username, "
+    "current_date + 3650, id FROM users WHERE username LIKE 'volume-%'",
+    "INSERT INTO cars (brand, model, year, category_id, license_plate, color_id, daily_cost, car_status_id) "
+    "SELECT (ARRAY['Toyota', 'Lada', 'Kia', 'Hyundai', 'Skoda', 'BMW', 'Audi', 'Renault'])[1 + n % 8], "
+    "'Модель ' || n % 40, 2000 + n % 25, "
+    "(SELECT array_agg(id ORDER BY id) FROM car_categories)[1 + n % 10], 'V' || n, "
+    "(SELECT array_agg(id ORDER BY id) FROM car_colors)[1 + n % 20], 500 + n % 100 * 50, "
+    "(SELECT id FROM car_statuses WHERE status = :available) FROM generate_series(1, 5000) n",
+    # Почти все аренды завершены за два года; активные - вокруг текущего момента, половина просрочена
+    "INSERT INTO rentals (client_id, car_id, start_date, end_date, total_amount, rental_status_id) "
+    "SELECT client.ids[1 + n % 2000], car.ids[1 + n % 5000], "
+    "CASE WHEN n % 50 = 0 THEN now() - interval '5 days' + (n % 10) * interval '1 day' "
+    "ELSE now() - interval '730 days' + n * interval '20 minutes' END, "
+    "CASE WHEN n % 50 = 0 THEN now() - interval '2 days' + (n % 10) * interval '1 day' "
+    "ELSE now() - interval '727 days' + n * interval '20 minutes' END, 3000, "
+    "CASE WHEN n % 50 = 0 THEN :active ELSE :completed END "
+    "FROM generate_series(1, 50000) n, "
+    "(SELECT array_agg(id ORDER BY id) AS ids FROM clients) client, "
+    "(SELECT array_agg(id ORDER BY id) AS ids FROM cars) car",
+    "INSERT INTO violation_types (type_name, default_fine, description) VALUES ('Превышение скорости', 500, '')",
+    "INSERT INTO violations (rental_id, violation_type_id, description, fine_amount, violation_date, is_paid) "
+    "SELECT rental.ids[1 + n * 2 % 50000], (SELECT max(id) FROM violation_types), '', 500, "
+    "now() - interval '730 days' + n * interval '50 minutes', n % 3 = 0 "
+    "FROM generate_series(1, 20000) n, (SELECT array_agg(id ORDER BY id) AS ids FROM rentals) rental",
+    "INSERT INTO refresh_tokens (user_id, token, created_at, expires_at) "
+    "SELECT id, 'volume-token-' || id, now(), now() + (id % 60 - 2) * interval '1 day' "
+    "FROM users WHERE username LIKE 'volume-%'",
+]
+
+
+def _status_index_names(db):
+    names = db.scalars(text("SELECT indexname FROM pg_indexes WHERE tablename = 'rentals'")).all()
+    return {name for name in names if any(index.matches(name) for index in STATUS_INDEXES)}
+
+
+@pytest.fixture
+def status_ids(database, reference_data) -> StatusIds:
+    with database.SessionLocal() as db:
+        ids = status_registry.load(db)
+    sync_status_indexes(database.engine, ids)
+    return ids
+
+
+@pytest.fixture
+def hot_data(database, status_ids):
+    with database.SessionLocal() as db:
+        for statement in HOT_DATA:
+            db.execute(text(statement), {
+                "available": AVAILABLE_CAR_STATUS, "active": status_ids.active_rental,
+                "completed": status_ids.completed_rental,
+            })
+        db.commit()
+    with database.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text("ANALYZE"))
+
+
+def test_hot_queries_can_use_their_indexes(database, hot_data):
+    # Тест ловит опечатки в именах, разошедшиеся выражения и условия частичных индексов
+    with database.SessionLocal() as db:
+        results = check_index_usage(db)
+
+    failed = [
+        f"{result.check.name}: ожидается {result.index}, план использует {', '.join(sorted(result.used)) or 'seq scan'}"
+        for result in results if not result.ok
+    ]
+    assert not failed, "\n".join(failed)
+
+
+def test_status_indexes_follow_status_id(database, status_ids):
+    # Статус пересоздали через админку - у него новый id
+    recreated = StatusIds(
+        active_rental=status_ids.active_rental + 100, completed_rental=status_ids.completed_rental,
+        rented_car=status_ids.rented_car, available_car=status_ids.available_car,
+    )
+    try:
+        created = sync_status_indexes(database.engine, recreated)
+        with database.SessionLocal() as db:
+            names = _status_index_names(db)
+        assert set(created) == names == {index.index_name(recreated) for index in STATUS_INDEXES}
+
+        assert sync_status_indexes(database.engine, recreated) == []
+    finally:
+        sync_status_indexes(database.engine, status_ids)
+
+    with database.SessionLocal() as db:
+        assert _status_index_names(db) == {index.index_name(status_ids) for index in STATUS_INDEXES}